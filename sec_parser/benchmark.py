@@ -0,0 +1,653 @@
+"""Performance benchmarks for hot extraction and parsing paths.
+
+Each benchmark times the current implementation against a reference copy of
+the code it replaced (or a synthetic baseline) and checks that both produce
+identical output.  No network or AI calls.
+
+Usage:
+    python -m sec_parser.benchmark collapse                  # _try_collapse_line micro-benchmark
+    python -m sec_parser.benchmark collapse --pages 200      # more synthetic cell-heavy pages
+    python -m sec_parser.benchmark deinterleave              # _try_deinterleave micro-benchmark
+    python -m sec_parser.benchmark memory --pdf-dir test-pdfs # peak traced memory of extract_pdf
+    python -m sec_parser.benchmark pages                     # retained memory per 100 extracted pages
+    python -m sec_parser.benchmark sections --pdf-dir test-pdfs  # section-start scan, synthetic + PDFs
+    python -m sec_parser.benchmark assembly                  # section assembly, 250-2000 page documents
+    python -m sec_parser.benchmark fuzzy --scale 10          # fuzzy line-item matching, 10x taxonomy
+    python -m sec_parser.benchmark calibrate                 # refit chunk budgets from the LLM cache
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+
+# ---------------------------------------------------------------------------
+# Reference implementations (pre-optimization, kept for equivalence checks)
+# ---------------------------------------------------------------------------
+
+def legacy_try_collapse_line(line: str) -> str:
+    """Original per-factor collapse: one full run-length scan per factor 2-15."""
+    if len(line) < 6:
+        return line
+
+    best: tuple[float, int, str] | None = None
+    for factor in range(2, 16):
+        if len(line) < factor * 3:
+            continue
+        collapsed = _legacy_collapse_with_factor(line, factor)
+        if collapsed is not None:
+            ratio = len(collapsed) / len(line)
+            if best is None or ratio < best[0]:
+                best = (ratio, factor, collapsed)
+
+    if best is not None:
+        return best[2]
+    return line
+
+
+def _legacy_collapse_with_factor(line: str, factor: int) -> str | None:
+    chars = list(line)
+    if not chars:
+        return None
+
+    collapsed = []
+    i = 0
+    matches = 0
+    total_groups = 0
+
+    while i < len(chars):
+        ch = chars[i]
+        j = i
+        while j < len(chars) and chars[j] == ch:
+            j += 1
+        run_length = j - i
+
+        if ch == ' ':
+            collapsed.append(' ')
+            i = j
+            continue
+
+        total_groups += 1
+        if run_length == factor:
+            matches += 1
+            collapsed.append(ch)
+            i = j
+        elif run_length % factor == 0:
+            matches += 1
+            collapsed.append(ch * (run_length // factor))
+            i = j
+        else:
+            collapsed.append(ch * run_length)
+            i = j
+
+    if total_groups > 0 and matches / total_groups >= 0.7 and total_groups >= 3:
+        return ''.join(collapsed)
+    return None
+
+
+def legacy_try_deinterleave(text: str) -> str:
+    """Original de-interleave: per-character stream build, all 16 terms per stream."""
+    from .pdf_extract import _COMMON_WORDS, _FINANCIAL_TERMS
+
+    stripped = text.strip()
+    if len(stripped) < 10 or len(stripped) >= 60:
+        return text
+    if any(c.isdigit() for c in stripped):
+        return text
+
+    words_lower = stripped.lower().split()
+    recognized = sum(1 for w in words_lower if w in _COMMON_WORDS)
+    if len(words_lower) > 0 and recognized / len(words_lower) >= 0.4:
+        return text
+
+    best_result = None
+    best_score = 0
+
+    candidates = [stripped]
+    no_spaces = stripped.replace(" ", "")
+    if no_spaces != stripped:
+        candidates.append(no_spaces)
+
+    for candidate in candidates:
+        for n_streams in (2, 3):
+            if len(candidate) < n_streams * 4:
+                continue
+            streams = [[] for _ in range(n_streams)]
+            for idx, ch in enumerate(candidate):
+                streams[idx % n_streams].append(ch)
+            parts = ["".join(s).strip() for s in streams]
+
+            score = 0
+            for part in parts:
+                part_lower = part.lower()
+                for term in _FINANCIAL_TERMS:
+                    if term in part_lower:
+                        score += len(term)
+
+            if score > best_score:
+                best_score = score
+                best_result = " / ".join(p for p in parts if p)
+
+    if best_score >= 10 and best_result:
+        return best_result
+    return text
+
+
+def legacy_extract_pdf(path: Path) -> list:
+    """Original serial extraction: layout caches live until the PDF closes."""
+    import pdfplumber
+
+    from .pdf_extract import PageData, _extract_page_tables, _extract_page_text
+
+    pages = []
+    with pdfplumber.open(path) as pdf:
+        for i, page in enumerate(pdf.pages):
+            text = _extract_page_text(page)
+            pages.append(PageData(page_number=i + 1, text=text, tables=_extract_page_tables(page, text)))
+    return pages
+
+
+def legacy_fuzzy_match(label_lower: str, alias_index: dict[str, str]) -> tuple[float, str | None]:
+    """Original fuzzy match: full SequenceMatcher ratio against every alias."""
+    import difflib
+
+    best_score = 0.0
+    best_canonical = None
+    for alias, canonical in alias_index.items():
+        score = difflib.SequenceMatcher(None, label_lower, alias).ratio()
+        if score > best_score:
+            best_score = score
+            best_canonical = canonical
+    return best_score, best_canonical
+
+
+def legacy_find_section_starts(pages: list) -> list[tuple[str, int]]:
+    """Original section-start search: one finditer per pattern per page, and
+    one search per pattern again for the TOC heuristic."""
+    from .section_split import SECTION_PATTERNS, _is_heading_match, _is_toc_page
+
+    found: list[tuple[str, int]] = []
+    seen: set[str] = set()
+    for page in pages:
+        if len(seen) == len(SECTION_PATTERNS):
+            break
+        toc_matches = {key: [m] for key, pat in SECTION_PATTERNS if (m := pat.search(page.text))}
+        if _is_toc_page(page, toc_matches):
+            continue
+        for key, pattern in SECTION_PATTERNS:
+            if key in seen:
+                continue
+            for m in pattern.finditer(page.text):
+                if _is_heading_match(page.text, m):
+                    found.append((key, page.page_number))
+                    seen.add(key)
+                    break
+    return sorted(found, key=lambda x: x[1])
+
+
+@dataclass
+class LegacyPageData:
+    """Original page record: a plain dataclass with a per-instance __dict__."""
+    page_number: int
+    text: str
+    tables: list[list[list[str]]] = field(default_factory=list)
+
+
+@dataclass
+class LegacySectionData:
+    """Original section record, holding its own list of the pages' tables."""
+    name: str
+    start_page: int
+    end_page: int
+    text: str = ""
+    tables: list[list[list[str]]] = field(default_factory=list)
+
+
+# ---------------------------------------------------------------------------
+# Synthetic inputs
+# ---------------------------------------------------------------------------
+
+_LABELS = [
+    "Total assets", "Net income (loss)", "Cash and cash equivalents",
+    "Accounts payable and accrued liabilities", "Additional paid-in capital",
+    "Retained earnings", "Operating activities", "Year Ended December 31,",
+]
+
+
+def synthetic_cells(pages: int, seed: int = 7) -> list[str]:
+    """Cell strings resembling statement pages: numbers, symbols, labels, bold runs."""
+    rng = random.Random(seed)
+    cells: list[str] = []
+    for _ in range(pages):
+        for _ in range(60):  # rows per page
+            label = rng.choice(_LABELS)
+            if rng.random() < 0.1:
+                factor = rng.choice((2, 3))
+                label = "".join(ch * factor for ch in label)  # bold overlay artifact
+            cells.append(label)
+            for _ in range(rng.randint(4, 8)):
+                cells.append(rng.choice(("", "$", ")", f"{rng.randint(1, 99_999):,}", f"({rng.randint(1, 999)}")))
+    return cells
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    """Best wall time of *repeat* runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_collapse(pages: int, repeat: int) -> int:
+    from .pdf_extract import _try_collapse_line
+
+    cells = synthetic_cells(pages)
+    mismatches = [c for c in cells if _try_collapse_line(c) != legacy_try_collapse_line(c)]
+    legacy = _time(lambda: [legacy_try_collapse_line(c) for c in cells], repeat)
+    current = _time(lambda: [_try_collapse_line(c) for c in cells], repeat)
+
+    print(f"collapse: {len(cells):,} cells from {pages} synthetic statement pages")
+    print(f"  legacy   {legacy * 1000:8.1f} ms")
+    print(f"  current  {current * 1000:8.1f} ms  ({legacy / current:.1f}x)")
+    print(f"  output mismatches: {len(mismatches)}")
+    return 1 if mismatches else 0
+
+
+def bench_deinterleave(pages: int, repeat: int) -> int:
+    from .pdf_extract import _try_deinterleave
+
+    cells = synthetic_cells(pages)
+    # Rotated-header artifacts, as pdfplumber reads two stacked column headers
+    cells += ["CRoemtmaoinn eSdt oIcnkc", "CPoremfemrreond SSttcoockk"] * pages
+    mismatches = [c for c in cells if _try_deinterleave(c) != legacy_try_deinterleave(c)]
+    legacy = _time(lambda: [legacy_try_deinterleave(c) for c in cells], repeat)
+    current = _time(lambda: [_try_deinterleave(c) for c in cells], repeat)
+
+    print(f"deinterleave: {len(cells):,} cells from {pages} synthetic statement pages")
+    print(f"  legacy   {legacy * 1000:8.1f} ms")
+    print(f"  current  {current * 1000:8.1f} ms  ({legacy / current:.1f}x)")
+    print(f"  output mismatches: {len(mismatches)}")
+    return 1 if mismatches else 0
+
+
+def _peak_traced(fn: Callable[[], object]) -> tuple[object, int]:
+    """Run *fn* under tracemalloc; return its result and peak traced bytes."""
+    tracemalloc.start()
+    try:
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak
+
+
+def bench_memory(pdf_dir: Path, limit: int | None) -> int:
+    from .pdf_extract import extract_pdf
+
+    pdfs = sorted(pdf_dir.glob("*.pdf"))[:limit]
+    if not pdfs:
+        print(f"memory: no PDFs in {pdf_dir}", file=sys.stderr)
+        return 1
+
+    print(f"memory: peak traced allocation per PDF ({len(pdfs)} files)")
+    print(f"  {'PDF':<40} {'pages':>6} {'legacy MB':>10} {'current MB':>11} {'KB/page':>8}")
+    mismatched = 0
+    for pdf_path in pdfs:
+        legacy_pages, legacy_peak = _peak_traced(lambda: legacy_extract_pdf(pdf_path))
+        pages, peak = _peak_traced(lambda: extract_pdf(pdf_path))
+        if pages != legacy_pages:
+            mismatched += 1
+        n = max(len(pages), 1)
+        print(
+            f"  {pdf_path.name[:40]:<40} {len(pages):>6} {legacy_peak / 2**20:>10.1f} "
+            f"{peak / 2**20:>11.1f} {peak / 1024 / n:>8.0f}"
+        )
+    print(f"  output mismatches: {mismatched}")
+    return 1 if mismatched else 0
+
+
+def _synthetic_page_tables(pages: int) -> list[list[list[list[str]]]]:
+    """Per-page statement tables whose cells are distinct string objects, as
+    pdfplumber returns them (each cell is joined from its own characters)."""
+    cells = synthetic_cells(pages)
+    per_page = len(cells) // pages
+    result = []
+    for p in range(pages):
+        page_cells = cells[p * per_page:(p + 1) * per_page]
+        rows = [page_cells[i:i + 6] for i in range(0, len(page_cells), 6)]
+        result.append([[["".join(list(c)) for c in row] for row in rows]])
+    return result
+
+
+def bench_pages(pages: int) -> int:
+    from .pdf_extract import PageData, intern_tables
+    from .section_split import SectionData
+
+    text = "Total assets and liabilities for the year ended December 31, 2024. " * 30
+
+    def legacy() -> list:
+        built = [
+            LegacyPageData(page_number=i + 1, text=text, tables=tables)
+            for i, tables in enumerate(_synthetic_page_tables(pages))
+        ]
+        section = LegacySectionData("balance_sheet", 1, pages, text, [t for p in built for t in p.tables])
+        return [built, section]
+
+    def current() -> list:
+        built = [
+            PageData(page_number=i + 1, text=text, tables=intern_tables(tables))
+            for i, tables in enumerate(_synthetic_page_tables(pages))
+        ]
+        section = SectionData("balance_sheet", 1, pages, text, pages=built)
+        section.tables  # gathered by reference
+        return [built, section]
+
+    def retained(build: Callable[[], list]) -> int:
+        tracemalloc.start()
+        try:
+            kept = build()
+            size, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del kept
+        return size
+
+    legacy_bytes = retained(legacy)
+    current_bytes = retained(current)
+    per_100 = 100 / pages / 1024
+    print(f"pages: retained memory for {pages} synthetic statement pages + one section")
+    print(f"  legacy   {legacy_bytes * per_100:8.0f} KB per 100 pages")
+    print(
+        f"  current  {current_bytes * per_100:8.0f} KB per 100 pages  "
+        f"({1 - current_bytes / legacy_bytes:.0%} less)"
+    )
+    return 0
+
+
+_PROSE = (
+    "The Company recorded revenue growth driven by higher volumes and pricing. "
+    "Operating expenses increased due to investments in technology and personnel, "
+    "partially offset by lower professional fees. See Note 7 for further details.\n"
+)
+
+
+def synthetic_filing(pages: int, seed: int = 11) -> list:
+    """Text-only 10-K pages: a TOC, prose, statement headings and mid-sentence references."""
+    from .pdf_extract import PageData
+    from .section_split import SECTION_TITLES
+
+    rng = random.Random(seed)
+    toc = "TABLE OF CONTENTS\n" + "".join(
+        f"{title} {10 + 7 * i}\n" for i, title in enumerate(SECTION_TITLES.values())
+    )
+    headings = [
+        "Item 1A. Risk Factors", "Item 3. Legal Proceedings",
+        "Item 7. Management's Discussion and Analysis of Financial Condition and Results of Operations",
+        "Item 7A. Quantitative and Qualitative Disclosures About Market Risk",
+        "CONSOLIDATED STATEMENTS OF OPERATIONS", "CONSOLIDATED STATEMENTS OF COMPREHENSIVE INCOME",
+        "CONSOLIDATED BALANCE SHEETS", "CONSOLIDATED STATEMENTS OF CASH FLOWS",
+        "CONSOLIDATED STATEMENTS OF STOCKHOLDERS' EQUITY", "NOTES TO CONSOLIDATED FINANCIAL STATEMENTS",
+        "Item 9A. Controls and Procedures", "Item 15. Exhibits", "SIGNATURES",
+    ]
+    result = [PageData(1, "UNITED STATES SECURITIES AND EXCHANGE COMMISSION\nFORM 10-K"), PageData(2, toc)]
+    for n in range(3, pages + 1):
+        body = _PROSE * rng.randint(20, 30)
+        if rng.random() < 0.3:
+            body += "as discussed in the Consolidated Statements of Cash Flows on page 52.\n"
+        if (n - 3) % max(pages // len(headings), 1) == 0 and (n - 3) // max(pages // len(headings), 1) < len(headings):
+            body = headings[(n - 3) // max(pages // len(headings), 1)] + "\n" + body
+        result.append(PageData(n, body))
+    return result
+
+
+def bench_sections(pdf_dir: Path, pages: int, repeat: int) -> int:
+    from .pdf_extract import iter_pages
+    from .section_split import _find_section_starts
+
+    corpus = [("synthetic", synthetic_filing(pages))]
+    for pdf_path in sorted(pdf_dir.glob("*.pdf")):
+        corpus.append((pdf_path.name, list(iter_pages(pdf_path, lazy_tables=True))))
+
+    mismatched = 0
+    print(f"sections: section-start scan over {len(corpus)} document(s)")
+    for name, doc in corpus:
+        if _find_section_starts(doc) != legacy_find_section_starts(doc):
+            mismatched += 1
+        legacy = _time(lambda: legacy_find_section_starts(doc), repeat)
+        current = _time(lambda: _find_section_starts(doc), repeat)
+        print(
+            f"  {name[:40]:<40} {len(doc):>5} pages  legacy {legacy * 1000:7.1f} ms  "
+            f"current {current * 1000:7.1f} ms  ({legacy / current:.1f}x)"
+        )
+    print(f"  documents with different section starts: {mismatched}")
+    return 1 if mismatched else 0
+
+
+def synthetic_ifrs_report(pages: int) -> list:
+    """Text-only IFRS report: statements, a long notes section, then parent company pages."""
+    from .pdf_extract import PageData
+
+    headings = [
+        "Consolidated Statement of Profit or Loss", "Consolidated Statement of Financial Position",
+        "Consolidated Statement of Changes in Equity", "Consolidated Statement of Cash Flows",
+        "Notes to the Consolidated Financial Statements",
+    ]
+    parent_from = pages - pages // 10
+    result = []
+    for n in range(1, pages + 1):
+        body = _PROSE * 20
+        if n <= len(headings):
+            body = headings[n - 1] + "\n" + body
+        elif n >= parent_from:
+            body = "Parent Company financial statements\n" + body
+        result.append(PageData(n, body))
+    return result
+
+
+def bench_assembly(sizes: list[int], repeat: int) -> int:
+    from .ifrs_section_split import split_ifrs_sections
+    from .page_index import PageIndex
+    from .section_split import _find_section_starts, split_sections
+
+    print("assembly: section assembly time per page (flat means linear in document size)")
+    for pages in sizes:
+        doc = synthetic_filing(pages)
+        index = PageIndex()
+        starts = _find_section_starts(doc, index)
+        sec = _time(lambda: split_sections(doc, starts=starts, index=index), repeat)
+        ifrs_doc = synthetic_ifrs_report(pages)
+        ifrs_index = PageIndex()
+        split_ifrs_sections(ifrs_doc, ifrs_index)  # warm the memoized page flags
+        ifrs = _time(lambda: split_ifrs_sections(ifrs_doc, ifrs_index), repeat)
+        print(
+            f"  {pages:>5} pages  sec {sec * 1e6 / pages:6.2f} us/page  "
+            f"ifrs {ifrs * 1e6 / pages:6.2f} us/page"
+        )
+    return 0
+
+
+_ALIAS_PREFIXES = ["", "total ", "net ", "other ", "consolidated ", "adjusted "]
+_ALIAS_SUFFIXES = ["", ", net", " (note 4)", " - continuing operations", " and other", ", current portion"]
+
+
+def expanded_alias_index(scale: int, seed: int = 5) -> dict[str, str]:
+    """The shipped alias index plus (scale - 1)x as many plausible variant aliases."""
+    from .taxonomy_cache import compiled_taxonomy
+
+    base = compiled_taxonomy().alias_index
+    rng = random.Random(seed)
+    index = dict(base)
+    items = list(base.items())
+    while len(index) < len(base) * scale:
+        alias, canonical = rng.choice(items)
+        words = alias.split()
+        if len(words) > 2 and rng.random() < 0.3:
+            i = rng.randrange(len(words) - 1)
+            words[i], words[i + 1] = words[i + 1], words[i]
+        variant = rng.choice(_ALIAS_PREFIXES) + " ".join(words) + rng.choice(_ALIAS_SUFFIXES)
+        index.setdefault(variant, canonical)
+    return index
+
+
+def _statement_labels(alias_index: dict[str, str], count: int, seed: int = 9) -> list[str]:
+    """Labels that miss the exact index: typos, reworded and unrelated line items."""
+    rng = random.Random(seed)
+    aliases = list(alias_index)
+    unrelated = [
+        "gain on sale of vessel", "impairment of goodwill and intangibles", "dividends paid to minority holders",
+        "foreign exchange translation reserve", "amortisation of right-of-use assets", "charter hire revenue",
+    ]
+    labels = []
+    while len(labels) < count:
+        if rng.random() < 0.3:
+            label = rng.choice(unrelated)
+        else:
+            chars = list(rng.choice(aliases))
+            for _ in range(rng.randint(1, 3)):
+                chars[rng.randrange(len(chars))] = rng.choice("abcdefghijklmnopqrstuvwxyz ")
+            label = "".join(chars)
+        if label not in alias_index:
+            labels.append(label)
+    return labels
+
+
+def bench_fuzzy(scale: int, labels: int, repeat: int) -> int:
+    from .normalize import FuzzyMatcher
+
+    print(f"fuzzy: {labels} unmatched labels against the alias index")
+    mismatched = 0
+    for factor in sorted({1, scale}):
+        index = expanded_alias_index(factor)
+        queries = _statement_labels(index, labels)
+        matcher = FuzzyMatcher(index)
+        mismatched += sum(matcher.best(q) != legacy_fuzzy_match(q, index) for q in queries)
+        legacy = _time(lambda: [legacy_fuzzy_match(q, index) for q in queries], repeat)
+        current = _time(lambda: [matcher.best(q) for q in queries], repeat)
+        print(
+            f"  {factor:>3}x taxonomy ({len(index):>5} aliases)  legacy {legacy * 1e3 / labels:7.3f} ms/label  "
+            f"indexed {current * 1e3 / labels:7.3f} ms/label  ({legacy / current:.1f}x)"
+        )
+    print(f"  labels with a different result: {mismatched}")
+    return 1 if mismatched else 0
+
+
+def bench_calibrate(quantile: float) -> int:
+    """Compare token estimates and output ratios with responses in the LLM cache.
+
+    Every cached Notes and prose response records Gemini's prompt and output
+    token counts next to the estimate its chunk was sized with, so a cache
+    warmed by real runs is the calibration corpus.  Prints the fitted
+    OUTPUT_RATIO per model and kind for updating token_budget by hand.
+    """
+    from . import llm_cache
+    from .prompts import NOTES_EXTRACTION_PROMPT, PROSE_SECTION_PROMPT
+    from .token_budget import OUTPUT_RATIO, estimate_tokens, fit_output_ratio
+
+    overheads = {
+        "notes": estimate_tokens(NOTES_EXTRACTION_PROMPT.format(content="")),
+        "prose": estimate_tokens(PROSE_SECTION_PROMPT.format(content="")),
+    }
+    groups: dict[tuple[str, str], list[dict]] = {}
+    for meta in llm_cache.iter_meta():
+        if meta.get("kind") in overheads and meta.get("estimated_tokens"):
+            groups.setdefault((meta.get("model", "?"), meta["kind"]), []).append(meta)
+    if not groups:
+        print("calibrate: no cached responses with token counts; run some filings first")
+        return 0
+
+    print(f"calibrate: output/input ratio at the {quantile:.0%} quantile, per estimated chunk token")
+    for (model, kind), metas in sorted(groups.items()):
+        counted = [m for m in metas if m.get("prompt_tokens")]
+        scale = (
+            sum(m["prompt_tokens"] for m in counted) / sum(m["estimated_tokens"] for m in counted)
+            if counted else float("nan")
+        )
+        samples = [
+            (m["estimated_tokens"] - overheads[kind], m["output_tokens"])
+            for m in metas if not m.get("truncated") and m.get("output_tokens")
+        ]
+        fitted = fit_output_ratio(samples, quantile)
+        truncated = sum(1 for m in metas if m.get("truncated"))
+        print(
+            f"  {model:<24} {kind:<6} {len(metas):>5} responses  {truncated:>3} truncated  "
+            f"actual/estimated prompt tokens {scale:5.2f}  "
+            f"ratio {fitted if fitted is not None else float('nan'):5.2f} (now {OUTPUT_RATIO.get(kind, 1.0):.2f})"
+        )
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="SEC PDF parser performance benchmarks")
+    sub = parser.add_subparsers(dest="bench", required=True)
+
+    p = sub.add_parser("collapse", help="Bold-overlay collapse on table cells")
+    p.add_argument("--pages", type=int, default=100, help="Synthetic statement pages")
+    p.add_argument("--repeat", type=int, default=3, help="Timing repetitions (best is reported)")
+
+    p = sub.add_parser("deinterleave", help="Rotated-header de-interleave on table cells")
+    p.add_argument("--pages", type=int, default=100, help="Synthetic statement pages")
+    p.add_argument("--repeat", type=int, default=3, help="Timing repetitions (best is reported)")
+
+    p = sub.add_parser("memory", help="Peak traced memory of extract_pdf over a PDF corpus")
+    p.add_argument("--pdf-dir", type=Path, default=Path("test-pdfs"), help="Directory containing PDFs")
+    p.add_argument("--limit", type=int, default=None, help="Only the first N PDFs")
+
+    p = sub.add_parser("pages", help="Retained memory of extracted page and section records")
+    p.add_argument("--pages", type=int, default=400, help="Synthetic statement pages")
+
+    p = sub.add_parser("sections", help="Section-start detection on synthetic and corpus filings")
+    p.add_argument("--pdf-dir", type=Path, default=Path("test-pdfs"), help="Directory containing PDFs")
+    p.add_argument("--pages", type=int, default=400, help="Pages in the synthetic filing")
+    p.add_argument("--repeat", type=int, default=3, help="Timing repetitions (best is reported)")
+
+    p = sub.add_parser("assembly", help="Section assembly scaling with document length")
+    p.add_argument(
+        "--sizes", type=int, nargs="+", default=[250, 500, 1000, 2000], help="Synthetic document page counts",
+    )
+    p.add_argument("--repeat", type=int, default=3, help="Timing repetitions (best is reported)")
+
+    p = sub.add_parser("fuzzy", help="Fuzzy line-item matching against an expanded taxonomy")
+    p.add_argument("--scale", type=int, default=10, help="Alias index size relative to taxonomy.yaml")
+    p.add_argument("--labels", type=int, default=100, help="Unmatched labels to look up")
+    p.add_argument("--repeat", type=int, default=1, help="Timing repetitions (best is reported)")
+
+    p = sub.add_parser("calibrate", help="Token estimates and output ratios against cached Gemini responses")
+    p.add_argument("--quantile", type=float, default=None, help="Quantile of observed ratios to fit")
+
+    args = parser.parse_args()
+    if args.bench == "collapse":
+        return bench_collapse(args.pages, args.repeat)
+    if args.bench == "deinterleave":
+        return bench_deinterleave(args.pages, args.repeat)
+    if args.bench == "memory":
+        return bench_memory(args.pdf_dir, args.limit)
+    if args.bench == "pages":
+        return bench_pages(args.pages)
+    if args.bench == "sections":
+        return bench_sections(args.pdf_dir, args.pages, args.repeat)
+    if args.bench == "assembly":
+        return bench_assembly(args.sizes, args.repeat)
+    if args.bench == "fuzzy":
+        return bench_fuzzy(args.scale, args.labels, args.repeat)
+    if args.bench == "calibrate":
+        from .token_budget import CALIBRATION_QUANTILE
+
+        return bench_calibrate(args.quantile if args.quantile is not None else CALIBRATION_QUANTILE)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,7 +11,7 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 from .consistency import enforce_consistent_mappings
-from .pipeline import ProcessingResult, process_pdf
+from .pipeline import ProcessingResult, open_label_memo, process_pdf, resolve_unmapped_labels
 
 load_dotenv()
 
@@ -74,6 +74,51 @@ def main() -> None:
         action="store_true",
         help="Disable XBRL fetching from SEC EDGAR (use PDF extraction only)",
     )
+    parser.add_argument(
+        "--lazy-tables",
+        action="store_true",
+        help="Extract text first and run table detection only on pages of sections that need tables",
+    )
+    parser.add_argument(
+        "--page-workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Extract pages of large PDFs in N worker processes (0 = one per CPU, default: 1)",
+    )
+    parser.add_argument(
+        "--no-extract-cache",
+        action="store_true",
+        help="Ignore and do not update the on-disk cache of extracted pages",
+    )
+    parser.add_argument(
+        "--no-label-memo",
+        action="store_true",
+        help="Ignore and do not update the on-disk memo of line-item normalization results",
+    )
+    parser.add_argument(
+        "--no-llm-labels",
+        action="store_true",
+        help="Skip the batch Gemini pass that maps line-item labels left unmatched by the taxonomy",
+    )
+    parser.add_argument(
+        "--no-note-reuse",
+        action="store_true",
+        help="Extract every note with Gemini instead of reusing notes unchanged since an earlier filing",
+    )
+    parser.add_argument(
+        "--llm-cache",
+        choices=("on", "readonly", "off"),
+        default=None,
+        help="Gemini response cache mode (overrides SEC_PARSER_LLM_CACHE; default: on)",
+    )
+    parser.add_argument(
+        "--max-rss-mb",
+        type=float,
+        default=None,
+        metavar="MB",
+        help="Fail a PDF whose extraction pushes resident memory above MB",
+    )
 
     args = parser.parse_args()
 
@@ -85,6 +130,8 @@ def main() -> None:
     # Set model via env var if provided as CLI arg
     if args.model:
         os.environ["GEMINI_MODEL"] = args.model
+    if args.llm_cache:
+        os.environ["SEC_PARSER_LLM_CACHE"] = args.llm_cache
 
     output_dir = args.output or args.input_folder / "output"
 
@@ -103,13 +150,33 @@ def main() -> None:
         print(f"\n[{i}/{len(pdfs)}] {pdf_path.name}", file=sys.stderr)
         try:
             use_xbrl = not args.no_xbrl
-            result = process_pdf(pdf_path, output_dir, verbose=args.verbose, use_xbrl=use_xbrl)
+            result = process_pdf(
+                pdf_path, output_dir, verbose=args.verbose, use_xbrl=use_xbrl,
+                lazy_tables=args.lazy_tables, page_workers=args.page_workers,
+                use_extract_cache=not args.no_extract_cache, max_rss_mb=args.max_rss_mb,
+                use_label_memo=not args.no_label_memo, use_note_store=not args.no_note_reuse,
+            )
             successes.append(result)
             print(f"  -> {result.output_path}", file=sys.stderr)
+            calls = result.gemini
+            if args.verbose and (calls.requests or calls.cached):
+                print(
+                    f"  Gemini: {calls.requests} request(s), {calls.cached} cached, "
+                    f"{calls.retries} retried",
+                    file=sys.stderr,
+                )
         except Exception as e:
             failures.append((pdf_path, str(e)))
             print(f"  FAILED: {e}", file=sys.stderr)
 
+    memo = None if args.no_label_memo else open_label_memo()
+
+    # Third normalization tier: one deduplicated LLM pass over the whole batch
+    if successes and not args.no_llm_labels:
+        resolved = resolve_unmapped_labels(successes, memo=memo, verbose=args.verbose)
+        if resolved:
+            print(f"\nLLM normalization mapped {resolved} label(s)", file=sys.stderr)
+
     # Multi-filing post-processing
     if len(successes) > 1:
         # Enforce consistent normalization mappings across filings
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 
+from .page_index import PageIndex
 from .pdf_extract import PageData
 
 # SEC markers — typically found on cover pages
@@ -59,7 +60,55 @@ _FORM_10K_FOOTER = re.compile(
 )
 
 
-def detect_10k_start_page(pages: list[PageData]) -> int:
+class TenKStartDetector:
+    """Incremental :func:`detect_10k_start_page` over pages fed in order.
+
+    ``cover_page`` is set as soon as an SEC cover page is seen, so callers
+    streaming pages can act on the 10-K start before extraction finishes.
+    The footer fallback only settles once every page has been fed.
+    """
+
+    def __init__(self, index: PageIndex | None = None) -> None:
+        self.index = index
+        self.cover_page: int | None = None
+        self._footer_page: int | None = None
+        self._footer_seen = False
+
+    @property
+    def started(self) -> bool:
+        """True once a cover page or a Form 10-K footer has been seen."""
+        return self.cover_page is not None or self._footer_seen
+
+    def feed(self, page: PageData) -> None:
+        if self.cover_page is not None:
+            return
+        text = page.text
+        is_toc = self.index.is_detect_toc(page) if self.index is not None else _is_toc_page(text)
+
+        # Skip TOC pages — they may reference "FORM 10-K" in listings
+        if not is_toc:
+            # Primary signal: both SEC commission header AND form type on same page
+            has_commission = bool(_SEC_COMMISSION_PATTERN.search(text))
+            has_form = bool(_FORM_10K_PATTERN.search(text))
+            # Secondary signal: "(Exact name of registrant..." line
+            if (has_commission and has_form) or _REGISTRANT_PATTERN.search(text):
+                self.cover_page = page.page_number
+                return
+
+        # Fallback signal: first page carrying a Form 10-K footer (for combined
+        # annual reports where the SEC cover page is omitted, e.g. JPM)
+        if not self._footer_seen and _FORM_10K_FOOTER.search(text):
+            self._footer_seen = True
+            # Footer on page 1 means no prefix to skip
+            if page.page_number > 1:
+                self._footer_page = page.page_number
+
+    def result(self) -> int:
+        """1-indexed filing start page given the pages fed so far (1 if none)."""
+        return self.cover_page or self._footer_page or 1
+
+
+def detect_10k_start_page(pages: list[PageData], index: PageIndex | None = None) -> int:
     """Find the page where the 10-K/10-Q filing begins in a combined document.
 
     Combined annual reports (like JPM) include shareholder letters, commentary,
@@ -74,56 +123,66 @@ def detect_10k_start_page(pages: list[PageData]) -> int:
        indicates embedded 10-K pages in a combined annual report.
 
     Returns the 1-indexed page number of the filing start. Returns 1 if no
-    start page is detected (entire document is the filing).
+    start page is detected (entire document is the filing).  *index* shares
+    memoized page classifications with other detection and splitting steps.
     """
-    # Pass 1: Look for SEC cover page markers (highest confidence)
+    detector = TenKStartDetector(index)
     for page in pages:
-        text = page.text
-
-        # Skip TOC pages — they may reference "FORM 10-K" in listings
-        if _is_toc_page(text):
-            continue
-
-        # Primary signal: both SEC commission header AND form type on same page
-        has_commission = bool(_SEC_COMMISSION_PATTERN.search(text))
-        has_form = bool(_FORM_10K_PATTERN.search(text))
+        detector.feed(page)
+        if detector.cover_page is not None:
+            break
+    return detector.result()
 
-        if has_commission and has_form:
-            return page.page_number
 
-        # Secondary signal: "(Exact name of registrant..." line
-        if _REGISTRANT_PATTERN.search(text):
-            return page.page_number
+def _report_markers(text: str) -> tuple[frozenset[int], frozenset[int]]:
+    """Indices of the SEC and IFRS marker patterns found in *text*."""
+    sec = frozenset(i for i, pat in enumerate(_SEC_PATTERNS) if pat.search(text))
+    ifrs = frozenset(i for i, pat in enumerate(_IFRS_PATTERNS) if pat.search(text))
+    return sec, ifrs
 
-    # Pass 2: Look for Form 10-K footer pattern (for combined annual reports
-    # where the SEC cover page is omitted, e.g. JPM)
-    for page in pages:
-        if _FORM_10K_FOOTER.search(page.text):
-            # Only treat as combined document if this isn't the first page
-            if page.page_number > 1:
-                return page.page_number
-            break  # Footer on page 1 means no prefix to skip
 
-    # No clear start page found — treat entire document as the filing
-    return 1
+class ReportTypeDetector:
+    """Incremental :func:`detect_report_type` over pages fed in order.
 
+    ``done`` becomes true once *scan_pages* pages have been seen; later pages
+    are ignored.
+    """
 
-def detect_report_type(pages: list[PageData], scan_pages: int = 10) -> str:
+    def __init__(self, scan_pages: int = 10, index: PageIndex | None = None) -> None:
+        self.scan_pages = scan_pages
+        self.index = index
+        self._seen = 0
+        self._sec_matched: set[int] = set()
+        self._ifrs_matched: set[int] = set()
+
+    @property
+    def done(self) -> bool:
+        return self._seen >= self.scan_pages
+
+    def feed(self, page: PageData) -> None:
+        if self.done:
+            return
+        self._seen += 1
+        if self.index is not None:
+            sec, ifrs = self.index.report_markers(page)
+        else:
+            sec, ifrs = _report_markers(page.text)
+        self._sec_matched |= sec
+        self._ifrs_matched |= ifrs
+
+    def result(self) -> str:
+        return "ifrs" if len(self._ifrs_matched) > len(self._sec_matched) else "sec"
+
+
+def detect_report_type(
+    pages: list[PageData], scan_pages: int = 10, index: PageIndex | None = None,
+) -> str:
     """Scan the first N pages and return 'sec' or 'ifrs'.
 
     Scores each unique pattern matched (not per-page occurrence).
     The higher score wins. Defaults to 'sec' for backward compatibility.
     """
-    sec_matched: set[int] = set()
-    ifrs_matched: set[int] = set()
-
+    detector = ReportTypeDetector(scan_pages, index)
     for page in pages[:scan_pages]:
-        text = page.text
-        for i, pat in enumerate(_SEC_PATTERNS):
-            if pat.search(text):
-                sec_matched.add(i)
-        for i, pat in enumerate(_IFRS_PATTERNS):
-            if pat.search(text):
-                ifrs_matched.add(i)
-
-    return "ifrs" if len(ifrs_matched) > len(sec_matched) else "sec"
+        detector.feed(page)
+    return detector.result()
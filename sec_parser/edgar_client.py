@@ -8,9 +8,6 @@ import time
 import urllib.request
 import urllib.error
 from dataclasses import dataclass, field
-from pathlib import Path
-
-import yaml
 
 
 class EdgarFetchError(Exception):
@@ -161,18 +158,12 @@ def load_xbrl_taxonomy_map() -> dict[str, dict[str, str]]:
     """Load XBRL concept -> canonical name mapping from xbrl_taxonomy_map.yaml.
 
     Returns dict keyed by statement_type, each containing {xbrl_concept: canonical_name}.
+    The map is parsed once per process as part of the compiled taxonomy and
+    shared between calls, so callers must not mutate it.
     """
-    map_path = Path(__file__).parent / "xbrl_taxonomy_map.yaml"
-    with open(map_path, encoding="utf-8") as f:
-        raw = yaml.safe_load(f)
-
-    result: dict[str, dict[str, str]] = {}
-    for statement_type, concepts in raw.items():
-        result[statement_type] = {}
-        for concept_name, canonical_name in concepts.items():
-            result[statement_type][concept_name] = canonical_name
+    from .taxonomy_cache import compiled_taxonomy
 
-    return result
+    return compiled_taxonomy().xbrl_map
 
 
 def extract_statement_facts(
@@ -0,0 +1,144 @@
+"""Content-addressed on-disk cache of extracted PDF pages.
+
+Entries are keyed by the PDF's SHA-256 plus the extractor version and table
+settings, so edits to the file or to the extraction logic never serve stale
+pages.  Each entry stores every page's text and cleaned tables as
+zlib-compressed JSON; pages skipped by the 10-K pre-scan are stored
+text-only and come back with lazily extracted tables.  The cache directory
+is trimmed to a size budget by evicting least-recently-used entries.
+
+Hashing a large PDF is not free, so callers that both load and store an
+entry compute :func:`cache_key` once and pass it to both.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import zlib
+from pathlib import Path
+
+import pdfplumber
+
+from .pdf_extract import _TEXT_TABLE_SETTINGS, PageData, _TableLoader, intern_tables
+
+# Bump whenever text cleanup or table extraction changes its output
+EXTRACTOR_VERSION = 3
+
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3  # 2 GiB
+
+
+def cache_root() -> Path:
+    """Root directory for sec-parse caches (``SEC_PARSER_CACHE_DIR`` overrides)."""
+    override = os.environ.get("SEC_PARSER_CACHE_DIR")
+    if override:
+        return Path(override)
+    return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "sec-parse"
+
+
+def _extract_dir() -> Path:
+    return cache_root() / "extract"
+
+
+def file_sha256(path: Path) -> str:
+    """Hex SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def cache_key(path: Path) -> str:
+    """Cache key for *path*: content hash + extractor version + table settings."""
+    settings = json.dumps(
+        {
+            "extractor": EXTRACTOR_VERSION,
+            "pdfplumber": pdfplumber.__version__,
+            "text_tables": _TEXT_TABLE_SETTINGS,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(f"{file_sha256(path)}:{settings}".encode()).hexdigest()
+
+
+def _entry_path(key: str) -> Path:
+    return _extract_dir() / f"{key}.json.z"
+
+
+def load_pages(path: Path, key: str | None = None) -> list[PageData] | None:
+    """Return cached pages for *path*, or None on a miss or unreadable entry.
+
+    *key* is ``cache_key(path)`` when the caller has already computed it.
+    """
+    entry = _entry_path(key or cache_key(path))
+    try:
+        payload = json.loads(zlib.decompress(entry.read_bytes()))
+    except (OSError, ValueError, zlib.error):
+        return None
+    # Touch so eviction treats this entry as recently used
+    try:
+        os.utime(entry)
+    except OSError:
+        pass
+    loader = _TableLoader(path)
+    return [
+        PageData(page_number=i + 1, text=text, tables=intern_tables(tables))
+        if tables is not None
+        else PageData(page_number=i + 1, text=text, table_loader=loader)
+        for i, (text, tables) in enumerate(payload["pages"])
+    ]
+
+
+def store_pages(
+    path: Path,
+    pages: list[PageData],
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    text_only_before: int = 1,
+    key: str | None = None,
+) -> None:
+    """Write *pages* for *path* to the cache, then evict down to *max_bytes*.
+
+    Pages must have their tables loaded, except pages numbered below
+    *text_only_before*, which may be stored text-only; otherwise a partially
+    extracted document (lazy tables) is not cached.  Write failures are
+    ignored — the cache is an optimization, never a requirement.  *key* is
+    ``cache_key(path)`` when the caller has already computed it.
+    """
+    if not all(p.tables_loaded or p.page_number < text_only_before for p in pages):
+        return
+    payload = {"pages": [[p.text, p.tables if p.tables_loaded else None] for p in pages]}
+    data = zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"), 6)
+    entry = _entry_path(key or cache_key(path))
+    try:
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        tmp = entry.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, entry)
+    except OSError:
+        return
+    evict(max_bytes)
+
+
+def evict(max_bytes: int = DEFAULT_MAX_BYTES) -> int:
+    """Delete least-recently-used entries until the cache fits *max_bytes*.
+
+    Returns the number of entries removed.
+    """
+    try:
+        entries = [(e.stat().st_mtime, e.stat().st_size, e) for e in _extract_dir().glob("*.json.z")]
+    except OSError:
+        return 0
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, entry in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            entry.unlink()
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
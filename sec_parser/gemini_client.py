@@ -3,31 +3,526 @@
 from __future__ import annotations
 
 import os
+import random
 import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from typing import Callable, Iterator, TypeVar
 
 from google import genai
-from google.genai import types
+from google.genai import errors, types
 
+from . import llm_cache
+from .note_store import NoteStore, note_number
 from .prompts import (
     COVER_PAGE_PROMPT,
     NOTES_EXTRACTION_PROMPT,
+    PROMPT_VERSION,
     PROSE_SECTION_PROMPT,
     TABLE_NORMALIZATION_PROMPT,
 )
+from .token_budget import chunk_budget, estimate_tokens, model_limits
 
 DEFAULT_MODEL = "gemini-2.5-flash"
-CHUNK_CHAR_LIMIT = 100_000
+# Times a chunk whose response hit the output limit is split and re-requested
+MAX_RESPLITS = 2
+# Chunk requests in flight at once (GEMINI_CONCURRENCY overrides)
+DEFAULT_CONCURRENCY = 4
+# Request starts per minute across all threads (GEMINI_RPM overrides; 0 = unlimited)
+DEFAULT_RPM = 60
+# Prompt tokens per minute across all threads (GEMINI_TPM overrides; 0 = unlimited)
+DEFAULT_TPM = 0
+# Retries of a request throttled with 429/503 (GEMINI_MAX_RETRIES overrides)
+DEFAULT_MAX_RETRIES = 5
+RETRY_STATUS = (429, 503)
+BACKOFF_BASE_SECONDS = 2.0
+BACKOFF_MAX_SECONDS = 60.0
+
+# (pid, API key, base URL) -> client; one per process so HTTP connections are reused
+_clients: dict[tuple, genai.Client] = {}
+_clients_lock = threading.Lock()
 
 
 def _get_client() -> genai.Client:
-    return genai.Client()  # reads GEMINI_API_KEY or GOOGLE_API_KEY from env
+    """Process-wide client for the current API key and endpoint.
+
+    The key is read from GEMINI_API_KEY or GOOGLE_API_KEY; GEMINI_BASE_URL
+    points the client at another endpoint, e.g. a proxy or a local stub.
+    """
+    base_url = os.environ.get("GEMINI_BASE_URL") or None
+    api_key = os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY")
+    key = (os.getpid(), api_key, base_url)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            http_options = types.HttpOptions(base_url=base_url) if base_url else None
+            client = genai.Client(api_key=api_key, http_options=http_options)
+            _clients[key] = client
+    return client
 
 
 def _get_model() -> str:
     return os.environ.get("GEMINI_MODEL", DEFAULT_MODEL)
 
 
+def _get_concurrency() -> int:
+    return max(1, int(os.environ.get("GEMINI_CONCURRENCY", DEFAULT_CONCURRENCY)))
+
+
+def _get_max_retries() -> int:
+    return max(0, int(os.environ.get("GEMINI_MAX_RETRIES", DEFAULT_MAX_RETRIES)))
+
+
+@dataclass
+class CallStats:
+    """Gemini requests sent, answered from the LLM cache, and retried after throttling."""
+    requests: int = 0
+    cached: int = 0
+    retries: int = 0
+
+    def __sub__(self, other: CallStats) -> CallStats:
+        return CallStats(*(getattr(self, f.name) - getattr(other, f.name) for f in fields(self)))
+
+
+_call_stats = CallStats()
+_stats_lock = threading.Lock()
+
+
+class CallCancelled(RuntimeError):
+    """Raised by a request whose :class:`CallScope` was cancelled or ran out of time."""
+
+
+class CallScope:
+    """The Gemini calls made for one unit of work, e.g. a PDF or its Notes job.
+
+    Calls made while the scope is entered (:func:`call_scope`), including
+    from the chunk workers those calls start, are counted in :attr:`stats`
+    and in every enclosing scope's.  Once the scope is cancelled or its
+    *deadline* (a ``time.monotonic()`` value) passes, no request or retry
+    starts, a streaming response stops at its next chunk, and the request
+    in flight is bounded by an HTTP timeout, all with :class:`CallCancelled`.
+    """
+
+    def __init__(self, parent: CallScope | None = None, deadline: float | None = None) -> None:
+        self.parent = parent
+        self.deadline = deadline
+        self.stats = CallStats()
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def remaining(self) -> float | None:
+        """Seconds left before the deadline (None without one)."""
+        return None if self.deadline is None else self.deadline - time.monotonic()
+
+    def check(self) -> None:
+        """Raise CallCancelled if the scope's calls must stop."""
+        remaining = self.remaining()
+        if self._cancelled.is_set() or (remaining is not None and remaining <= 0):
+            raise CallCancelled("Gemini calls cancelled")
+
+    def sleep(self, seconds: float) -> None:
+        """Sleep up to *seconds*, waking early on cancellation or the deadline."""
+        remaining = self.remaining()
+        if remaining is not None:
+            seconds = min(seconds, max(0.0, remaining))
+        self._cancelled.wait(seconds)
+        self.check()
+
+
+_scopes = threading.local()
+
+
+def current_scope() -> CallScope | None:
+    """The scope entered by this thread, if any."""
+    return getattr(_scopes, "current", None)
+
+
+@contextmanager
+def call_scope(scope: CallScope | None = None) -> Iterator[CallScope]:
+    """Enter *scope* (by default a new child of the current one) in this thread."""
+    previous = current_scope()
+    if scope is None:
+        scope = CallScope(previous)
+    _scopes.current = scope
+    try:
+        yield scope
+    finally:
+        _scopes.current = previous
+
+
+def _count(requests: int = 0, cached: int = 0, retries: int = 0) -> None:
+    counters = [_call_stats]
+    scope = current_scope()
+    while scope is not None:
+        counters.append(scope.stats)
+        scope = scope.parent
+    with _stats_lock:
+        for stats in counters:
+            stats.requests += requests
+            stats.cached += cached
+            stats.retries += retries
+
+
+def _sleep(seconds: float) -> None:
+    scope = current_scope()
+    if scope is None:
+        time.sleep(seconds)
+    else:
+        scope.sleep(seconds)
+
+
+def call_stats(scope: CallScope | None = None) -> CallStats:
+    """Snapshot of *scope*'s counters, or the whole process's; subtract two for a delta."""
+    stats = scope.stats if scope is not None else _call_stats
+    with _stats_lock:
+        return CallStats(stats.requests, stats.cached, stats.retries)
+
+
+class _TokenBucket:
+    """Refills at *per_minute*/60 per second up to *capacity*.
+
+    Takes may overdraw the bucket; the caller waits until the debt is repaid,
+    so concurrent takers queue in the order they arrived.
+    """
+
+    def __init__(self, per_minute: float, capacity: float) -> None:
+        self.rate = per_minute / 60.0
+        self.capacity = capacity
+        self._level = capacity
+        self._stamp = time.monotonic()
+
+    def take(self, amount: float, now: float) -> float:
+        """Withdraw *amount* and return the seconds to wait before using it."""
+        self._level = min(self.capacity, self._level + (now - self._stamp) * self.rate)
+        self._stamp = now
+        self._level -= min(amount, self.capacity)  # oversized takes wait for a full bucket
+        return max(0.0, -self._level / self.rate)
+
+
+class _RateLimiter:
+    """Token buckets for request starts (rpm) and prompt tokens (tpm), across threads.
+
+    The request bucket holds a single request, so starts are spaced at least
+    60/rpm seconds apart; the token bucket holds a minute's worth of tokens.
+    A zero rate disables that bucket.
+    """
+
+    def __init__(self, rpm: float, tpm: float = 0) -> None:
+        self._requests = _TokenBucket(rpm, 1) if rpm > 0 else None
+        self._tokens = _TokenBucket(tpm, tpm) if tpm > 0 else None
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+
+    def acquire(self, tokens: int = 0) -> None:
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._paused_until - now)
+            if self._requests is not None:
+                wait = max(wait, self._requests.take(1, now))
+            if self._tokens is not None and tokens:
+                wait = max(wait, self._tokens.take(tokens, now))
+        if wait > 0:
+            _sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request start for *seconds* (after a 429/503)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+# Built on first use, so GEMINI_RPM/GEMINI_TPM loaded from .env after import apply
+_rate_limiter: _RateLimiter | None = None
+_rate_limiter_lock = threading.Lock()
+
+
+def _get_rate_limiter() -> _RateLimiter:
+    """Process-wide rate limiter, configured from GEMINI_RPM and GEMINI_TPM."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = _RateLimiter(
+                float(os.environ.get("GEMINI_RPM", DEFAULT_RPM)),
+                float(os.environ.get("GEMINI_TPM", DEFAULT_TPM)),
+            )
+        return _rate_limiter
+
+
+def _backoff_delay(attempt: int, exc: errors.APIError) -> float:
+    """Server's Retry-After if given, else jittered exponential backoff."""
+    headers = getattr(exc.response, "headers", None) or {}
+    try:
+        return min(float(headers.get("retry-after")), BACKOFF_MAX_SECONDS)
+    except (TypeError, ValueError):
+        pass
+    delay = min(BACKOFF_BASE_SECONDS * 2 ** attempt, BACKOFF_MAX_SECONDS)
+    return delay * random.uniform(0.5, 1.0)
+
+
+_T = TypeVar("_T")
+
+
+def _send(call: Callable[[], _T], prompt: str) -> _T:
+    """Run one API request under the shared rate limiter.
+
+    Requests throttled with 429/503 are retried up to GEMINI_MAX_RETRIES
+    times; the backoff pauses every thread, not just the throttled one.  No
+    attempt starts once the current :class:`CallScope` is cancelled.
+    """
+    retries = _get_max_retries()
+    limiter = _get_rate_limiter()
+    scope = current_scope()
+    attempt = 0
+    while True:
+        limiter.acquire(estimate_tokens(prompt))
+        if scope is not None:
+            scope.check()
+        _count(requests=1)
+        try:
+            return call()
+        except errors.APIError as exc:
+            if exc.code not in RETRY_STATUS or attempt >= retries:
+                raise
+            limiter.pause(_backoff_delay(attempt, exc))
+            _count(retries=1)
+            attempt += 1
+
+
+def _request_config(max_output_tokens: int) -> types.GenerateContentConfig:
+    """Request config; within a scope's deadline, the HTTP timeout ends with it."""
+    http_options = None
+    scope = current_scope()
+    remaining = scope.remaining() if scope is not None else None
+    if remaining is not None:
+        http_options = types.HttpOptions(timeout=max(1, int(remaining * 1000)))
+    return types.GenerateContentConfig(
+        system_instruction="You are a financial document processor.",
+        max_output_tokens=max_output_tokens,
+        http_options=http_options,
+    )
+
+
+@dataclass
+class _Response:
+    """A streamed response and the token counts it reported."""
+    text: str
+    output_tokens: int
+    truncated: bool = False  # stopped at max_output_tokens
+    prompt_tokens: int | None = None  # Gemini's count of the prompt, for calibration
+
+    @classmethod
+    def from_stream(cls, text: str, last) -> _Response:
+        """Build from the joined text and the stream's final chunk."""
+        usage = getattr(last, "usage_metadata", None)
+        output_tokens = getattr(usage, "candidates_token_count", None) or estimate_tokens(text)
+        candidates = getattr(last, "candidates", None) or []
+        finish = getattr(candidates[0], "finish_reason", None) if candidates else None
+        return cls(
+            text, output_tokens, finish == types.FinishReason.MAX_TOKENS,
+            getattr(usage, "prompt_token_count", None),
+        )
+
+    @classmethod
+    def from_cache(cls, text: str, meta: dict) -> _Response:
+        return cls(
+            text, meta.get("output_tokens") or estimate_tokens(text), bool(meta.get("truncated")),
+            meta.get("prompt_tokens"),
+        )
+
+    def meta(self) -> dict:
+        return {
+            "output_tokens": self.output_tokens,
+            "truncated": self.truncated,
+            "prompt_tokens": self.prompt_tokens,
+        }
+
+
+def _stream_chunks(
+    prompts: list[str],
+    max_output_tokens: int,
+    kind: str,
+    verbose: bool = False,
+    max_workers: int | None = None,
+) -> list[_Response]:
+    """Stream one Gemini response per prompt, up to *max_workers* at a time.
+
+    Prompts with a cached response are answered from the LLM cache and the
+    rest share the module rate limiter; responses are returned in prompt
+    order whatever order they finish in.
+    """
+    model = _get_model()
+    keys = [llm_cache.response_key(model, prompt, max_output_tokens) for prompt in prompts]
+    results: list[_Response | None] = []
+    for key in keys:
+        entry = llm_cache.load_entry(key)
+        results.append(_Response.from_cache(*entry) if entry is not None else None)
+    misses = [i for i, response in enumerate(results) if response is None]
+    _count(cached=len(prompts) - len(misses))
+    if verbose and len(misses) < len(prompts):
+        print(
+            f"  [Gemini] {len(prompts) - len(misses)}/{len(prompts)} {kind} chunk(s) from cache",
+            file=sys.stderr,
+        )
+    if not misses:
+        return results
+
+    client = _get_client()
+    workers = min(max_workers or _get_concurrency(), len(misses))
+    scope = current_scope()
+
+    def run(i: int) -> _Response:
+        # Workers count and cancel with the scope of the thread that started them
+        if scope is None:
+            return fetch(i)
+        with call_scope(scope):
+            return fetch(i)
+
+    def fetch(i: int) -> _Response:
+        prompt = prompts[i]
+        if verbose:
+            print(
+                f"  [Gemini] Extracting {kind} chunk {i + 1}/{len(prompts)} "
+                f"(~{estimate_tokens(prompt):,} tokens) with {model}...",
+                file=sys.stderr,
+            )
+
+        def stream() -> _Response:
+            # Use streaming for large output
+            response = client.models.generate_content_stream(
+                model=model, contents=prompt, config=_request_config(max_output_tokens),
+            )
+            parts: list[str] = []
+            last = None
+            for last in response:
+                if scope is not None:
+                    scope.check()
+                parts.append(last.text or "")
+            return _Response.from_stream("".join(parts), last)
+
+        result = _send(stream, prompt)
+        # Kind and estimate let `benchmark calibrate` refit the chunk budgets
+        meta = {**result.meta(), "kind": kind, "model": model, "estimated_tokens": estimate_tokens(prompt)}
+        llm_cache.store_response(keys[i], result.text, meta)
+        return result
+
+    if workers == 1:
+        fetched = [run(i) for i in misses]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            fetched = list(pool.map(run, misses))
+    for i, response in zip(misses, fetched):
+        results[i] = response
+    return results
+
+
+def _chunk_limit(template: str, max_output_tokens: int, kind: str) -> int:
+    """Estimated-token budget of one *kind* chunk for the configured model."""
+    model = _get_model()
+    max_output_tokens = min(max_output_tokens, model_limits(model).output_tokens)
+    overhead = estimate_tokens(template.format(content=""))
+    return chunk_budget(model, kind, max_output_tokens, overhead)
+
+
+def _extract_chunked(
+    texts: list[str],
+    template: str,
+    chunker: Callable[[str, int], list[str]],
+    max_output_tokens: int,
+    kind: str,
+    verbose: bool = False,
+    max_workers: int | None = None,
+) -> list[str]:
+    """Chunk each of *texts* to the model's token budget, extract every chunk, and
+    return one joined result per text.
+
+    Chunks of all texts are extracted together, so they share the worker
+    pool.  Chunks are sized by :func:`chunk_budget`, which depends only on
+    the model and *kind*, so the same text always yields the same prompts
+    and a warm rerun is answered from the LLM cache.  A chunk whose response
+    still hit the limit is split in half and re-requested, up to
+    MAX_RESPLITS times; the truncation is cached with the response, so a
+    rerun re-splits identically.
+    """
+    max_output_tokens = min(max_output_tokens, model_limits(_get_model()).output_tokens)
+    limit = _chunk_limit(template, max_output_tokens, kind)
+
+    def extract(chunks: list[str], depth: int) -> list[str]:
+        """One result per chunk; a re-split chunk's parts are joined."""
+        sizes = [estimate_tokens(chunk) for chunk in chunks]
+        if verbose:
+            print(
+                f"  [Gemini] {kind.capitalize()} in {len(chunks)} chunk(s) of "
+                f"~{', '.join(f'{n:,}' for n in sizes)} tokens (budget {limit:,})",
+                file=sys.stderr,
+            )
+        prompts = [template.format(content=chunk) for chunk in chunks]
+        responses = _stream_chunks(prompts, max_output_tokens, kind, verbose, max_workers)
+
+        results: list[str] = []
+        for chunk, size, response in zip(chunks, sizes, responses):
+            parts = [chunk]
+            if response.truncated and depth < MAX_RESPLITS:
+                parts = chunker(chunk, size // 2)
+            if len(parts) > 1:
+                if verbose:
+                    print(
+                        f"  [Gemini] {kind.capitalize()} chunk hit the {max_output_tokens:,}-token "
+                        f"output limit, re-splitting into {len(parts)}",
+                        file=sys.stderr,
+                    )
+                results.append("\n\n".join(extract(parts, depth + 1)))
+            else:
+                results.append(response.text)
+        return results
+
+    chunks: list[str] = []
+    owners: list[int] = []
+    for i, text in enumerate(texts):
+        for chunk in chunker(text, limit):
+            chunks.append(chunk)
+            owners.append(i)
+    outputs: list[list[str]] = [[] for _ in texts]
+    for owner, result in zip(owners, extract(chunks, 0)):
+        outputs[owner].append(result)
+    return ["\n\n".join(parts) for parts in outputs]
+
+
+def _generate_cached(prompt: str, max_output_tokens: int, describe: str | None = None) -> str:
+    """One non-streaming request, answered from the LLM cache when possible.
+
+    With *describe*, progress is reported on stderr.
+    """
+    model = _get_model()
+    key = llm_cache.response_key(model, prompt, max_output_tokens)
+    cached = llm_cache.load_response(key)
+    if cached is not None:
+        _count(cached=1)
+        if describe:
+            print(f"  [Gemini] {describe}: cached response", file=sys.stderr)
+        return cached
+    if describe:
+        print(f"  [Gemini] {describe} ({len(prompt)} chars) with {model}...", file=sys.stderr)
+    client = _get_client()
+    text = _send(
+        lambda: client.models.generate_content(
+            model=model, contents=prompt, config=_request_config(max_output_tokens),
+        ).text,
+        prompt,
+    )
+    llm_cache.store_response(key, text)
+    return text
+
+
+def generate(prompt: str, max_output_tokens: int = 8192) -> str:
+    """Send a single free-form prompt to Gemini and return the response text."""
+    return _generate_cached(prompt, max_output_tokens)
+
+
 def _format_tables_for_prompt(tables: list[list[list[str]]]) -> str:
     """Convert raw pdfplumber table data into a readable text block."""
     if not tables:
@@ -42,173 +537,219 @@ def _format_tables_for_prompt(tables: list[list[list[str]]]) -> str:
 
 def normalize_table(section_text: str, tables: list[list[list[str]]], verbose: bool = False) -> str:
     """Send section text + raw tables to Gemini for normalization into a clean markdown table."""
-    client = _get_client()
-    model = _get_model()
-
     content = section_text
     table_text = _format_tables_for_prompt(tables)
     if table_text:
         content += "\n\n" + table_text
 
     prompt = TABLE_NORMALIZATION_PROMPT.format(content=content)
+    return _generate_cached(prompt, 8192, "Normalizing table" if verbose else None)
 
-    if verbose:
-        print(f"  [Gemini] Normalizing table ({len(prompt)} chars) with {model}...", file=sys.stderr)
-
-    response = client.models.generate_content(
-        model=model,
-        contents=prompt,
-        config=types.GenerateContentConfig(
-            system_instruction="You are a financial document processor.",
-            max_output_tokens=8192,
-        ),
-    )
-
-    return response.text
-
-
-def _chunk_notes(text: str, limit: int = CHUNK_CHAR_LIMIT) -> list[str]:
-    """Split notes text at note boundaries if it exceeds the character limit."""
-    if len(text) <= limit:
-        return [text]
-
-    # Split at "Note <number>" or "NOTE <number>" or "## Note" boundaries
-    pattern = re.compile(r"(?=\n\s*(?:Note|NOTE)\s+\d+[\s.:\-—])", re.IGNORECASE)
-    parts = pattern.split(text)
 
-    if len(parts) <= 1:
-        # Fallback: split at any heading-like boundary
-        pattern = re.compile(r"(?=\n\s*#{1,3}\s+)")
-        parts = pattern.split(text)
+def _pack(parts: list[str], budget: int) -> list[str]:
+    """Join consecutive *parts* into chunks of at most *budget* estimated tokens.
 
-    # Re-assemble into chunks that stay under the limit
+    A part over budget on its own is broken at line boundaries first.
+    """
     chunks: list[str] = []
     current = ""
+    used = 0
     for part in parts:
-        if current and len(current) + len(part) > limit:
-            chunks.append(current)
-            current = part
-        else:
-            current += part
+        tokens = estimate_tokens(part)
+        pieces = [(part, tokens)]
+        if tokens > budget:
+            pieces = [(line, estimate_tokens(line)) for line in part.splitlines(keepends=True)]
+        for piece, piece_tokens in pieces:
+            if current and used + piece_tokens > budget:
+                chunks.append(current)
+                current, used = piece, piece_tokens
+            else:
+                current += piece
+                used += piece_tokens
     if current:
         chunks.append(current)
-
     return chunks
 
 
-def extract_notes(notes_text: str, verbose: bool = False) -> str:
-    """Send notes text to Gemini for structured extraction. Uses chunking for large notes."""
-    client = _get_client()
-    model = _get_model()
-    chunks = _chunk_notes(notes_text)
+# "Note <number>" or "NOTE <number>" boundaries
+_NOTE_BOUNDARY_RE = re.compile(r"(?=\n\s*(?:Note|NOTE)\s+\d+[\s.:\-—])", re.IGNORECASE)
 
-    if verbose and len(chunks) > 1:
-        print(f"  [Gemini] Notes split into {len(chunks)} chunks", file=sys.stderr)
 
-    results: list[str] = []
-    for i, chunk in enumerate(chunks):
-        prompt = NOTES_EXTRACTION_PROMPT.format(content=chunk)
+def _split_notes(text: str) -> list[str]:
+    """Split notes text into individual notes at ``Note N`` boundaries.
 
-        if verbose:
-            print(
-                f"  [Gemini] Extracting notes chunk {i + 1}/{len(chunks)} "
-                f"({len(prompt)} chars) with {model}...",
-                file=sys.stderr,
-            )
+    Text before the first note (the section heading) stays with the first
+    note; fragments without a note number stay with the preceding note.
+    """
+    notes: list[str] = []
+    lead = ""
+    for part in _NOTE_BOUNDARY_RE.split(text):
+        if note_number(part) is not None:
+            notes.append(lead + part)
+            lead = ""
+        elif notes:
+            notes[-1] += part
+        else:
+            lead += part
+    if lead:
+        notes.append(lead)
+    return notes
 
-        # Use streaming for large output
-        response = client.models.generate_content_stream(
-            model=model,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                system_instruction="You are a financial document processor.",
-                max_output_tokens=65536,
-            ),
-        )
-        parts = []
-        for chunk_resp in response:
-            parts.append(chunk_resp.text)
-        results.append("".join(parts))
 
-    return "\n\n".join(results)
+# A line opening with a note heading in extracted markdown, e.g. "## Note 4 — Debt"
+_OUTPUT_NOTE_HEADING_RE = re.compile(
+    r"^[ \t]*(?:#{1,6}[ \t]*)?(?:\*\*)?(?:Note|NOTE)\s+(\d+)", re.MULTILINE,
+)
 
 
-def _chunk_prose(text: str, limit: int = CHUNK_CHAR_LIMIT) -> list[str]:
-    """Split prose text at heading/paragraph boundaries if it exceeds the character limit."""
-    if len(text) <= limit:
-        return [text]
+def _group_notes(notes: list[str], budget: int) -> list[list[int]]:
+    """Indices of *notes* packed in order into groups of at most *budget* estimated tokens.
 
-    # Split at Item headings, markdown headings, or double newlines
-    pattern = re.compile(r"(?=\n(?:Item\s+\d|#{1,3}\s|\n\n))", re.IGNORECASE)
-    parts = pattern.split(text)
-
-    chunks: list[str] = []
-    current = ""
-    for part in parts:
-        if current and len(current) + len(part) > limit:
-            chunks.append(current)
-            current = part
+    A note over budget on its own forms its own group.
+    """
+    groups: list[list[int]] = []
+    used = 0
+    for i, note in enumerate(notes):
+        tokens = estimate_tokens(note)
+        if groups and used + tokens <= budget:
+            groups[-1].append(i)
+            used += tokens
         else:
-            current += part
-    if current:
-        chunks.append(current)
+            groups.append([i])
+            used = tokens
+    return groups
+
+
+def _split_note_output(output: str, numbers: list[str | None]) -> list[str] | None:
+    """Split the extraction of several notes back into one output per note.
+
+    *numbers* are the notes' own numbers, in the order they were sent; the
+    output is cut at the first heading of each note after the first.
+    Returns None when one of those notes has no number or its heading
+    cannot be found.
+    """
+    if None in numbers[1:]:
+        return None
+    cuts = [0]
+    for number in numbers[1:]:
+        heading = next(
+            (m for m in _OUTPUT_NOTE_HEADING_RE.finditer(output, cuts[-1])
+             if m.start() > cuts[-1] and int(m.group(1)) == int(number)),
+            None,
+        )
+        if heading is None:
+            return None
+        cuts.append(heading.start())
+    cuts.append(len(output))
+    return [output[start:end].strip() for start, end in zip(cuts, cuts[1:])]
 
-    return chunks
 
+def _chunk_notes(text: str, budget: int) -> list[str]:
+    """Split notes text at note boundaries if it exceeds *budget* estimated tokens."""
+    if estimate_tokens(text) <= budget:
+        return [text]
 
-def extract_prose_section(section_text: str, verbose: bool = False) -> str:
-    """Send a prose-heavy section to Gemini for cleanup and structuring."""
-    client = _get_client()
-    model = _get_model()
-    chunks = _chunk_prose(section_text)
+    parts = _NOTE_BOUNDARY_RE.split(text)
 
-    if verbose and len(chunks) > 1:
-        print(f"  [Gemini] Prose section split into {len(chunks)} chunks", file=sys.stderr)
+    if len(parts) <= 1:
+        # Fallback: split at any heading-like boundary
+        pattern = re.compile(r"(?=\n\s*#{1,3}\s+)")
+        parts = pattern.split(text)
 
-    results: list[str] = []
-    for i, chunk in enumerate(chunks):
-        prompt = PROSE_SECTION_PROMPT.format(content=chunk)
+    # Re-assemble into chunks that stay under the budget
+    return _pack(parts, budget)
+
+
+def extract_notes(
+    notes_text: str,
+    verbose: bool = False,
+    max_workers: int | None = None,
+    cik: str | None = None,
+) -> str:
+    """Send notes text to Gemini for structured extraction. Uses chunking for large notes.
+
+    Chunks are sized by estimated tokens for the configured model, extracted
+    concurrently up to *max_workers* at a time (default: GEMINI_CONCURRENCY),
+    and joined in document order.
+
+    With *cik*, the text is split into individual notes and each note whose
+    fingerprint matches one extracted from an earlier filing of the same
+    company reuses that output.  Only new or changed notes are sent, packed
+    in order into chunks of the usual budget; each response is split back
+    into notes at their headings and stored per note for the next filing.
+    A response whose note headings cannot be matched is used as is but not
+    stored, so those notes are extracted again next time.
+    """
+    if not cik:
+        return _extract_chunked(
+            [notes_text], NOTES_EXTRACTION_PROMPT, _chunk_notes, 65536, "notes",
+            verbose, max_workers,
+        )[0]
+
+    notes = _split_notes(notes_text)
+    store = NoteStore(cik, f"{_get_model()}:{PROMPT_VERSION}")
+    outputs = [store.get(note) for note in notes]
+    changed = [i for i, output in enumerate(outputs) if output is None]
+    if verbose:
+        print(
+            f"  [Gemini] {len(notes) - len(changed)}/{len(notes)} note(s) unchanged since an "
+            f"earlier filing of CIK {cik}, extracting {len(changed)}",
+            file=sys.stderr,
+        )
+    if changed:
+        budget = _chunk_limit(NOTES_EXTRACTION_PROMPT, 65536, "notes")
+        groups = [
+            [changed[j] for j in group]
+            for group in _group_notes([notes[i] for i in changed], budget)
+        ]
+        fresh = _extract_chunked(
+            ["".join(notes[i] for i in group) for group in groups],
+            NOTES_EXTRACTION_PROMPT, _chunk_notes, 65536, "notes", verbose, max_workers,
+        )
+        for group, output in zip(groups, fresh):
+            split = _split_note_output(output, [note_number(notes[i]) for i in group])
+            if split is None:
+                if verbose:
+                    print(
+                        f"  [Gemini] Could not split a response covering {len(group)} notes "
+                        "at their headings; not storing it for reuse",
+                        file=sys.stderr,
+                    )
+                outputs[group[0]] = output
+                for i in group[1:]:
+                    outputs[i] = ""
+                continue
+            for i, note_output in zip(group, split):
+                outputs[i] = note_output
+                store.put(notes[i], note_output)
+        store.flush()
+    return "\n\n".join(output for output in outputs if output)
+
+
+def _chunk_prose(text: str, budget: int) -> list[str]:
+    """Split prose text at heading/paragraph boundaries if it exceeds *budget* estimated tokens."""
+    if estimate_tokens(text) <= budget:
+        return [text]
 
-        if verbose:
-            print(
-                f"  [Gemini] Extracting prose chunk {i + 1}/{len(chunks)} "
-                f"({len(prompt)} chars) with {model}...",
-                file=sys.stderr,
-            )
+    # Split at Item headings, markdown headings, or double newlines
+    pattern = re.compile(r"(?=\n(?:Item\s+\d|#{1,3}\s|\n\n))", re.IGNORECASE)
+    parts = pattern.split(text)
+    return _pack(parts, budget)
 
-        response = client.models.generate_content_stream(
-            model=model,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                system_instruction="You are a financial document processor.",
-                max_output_tokens=16000,
-            ),
-        )
-        parts = []
-        for chunk_resp in response:
-            parts.append(chunk_resp.text)
-        results.append("".join(parts))
 
-    return "\n\n".join(results)
+def extract_prose_section(
+    section_text: str, verbose: bool = False, max_workers: int | None = None,
+) -> str:
+    """Send a prose-heavy section to Gemini for cleanup and structuring.
+
+    Chunks are sized and extracted as in :func:`extract_notes`.
+    """
+    return _extract_chunked(
+        [section_text], PROSE_SECTION_PROMPT, _chunk_prose, 16000, "prose", verbose, max_workers,
+    )[0]
 
 
 def extract_cover_page(section_text: str, verbose: bool = False) -> str:
     """Send cover page text to Gemini for metadata extraction."""
-    client = _get_client()
-    model = _get_model()
-
     prompt = COVER_PAGE_PROMPT.format(content=section_text)
-
-    if verbose:
-        print(f"  [Gemini] Extracting cover page ({len(prompt)} chars) with {model}...", file=sys.stderr)
-
-    response = client.models.generate_content(
-        model=model,
-        contents=prompt,
-        config=types.GenerateContentConfig(
-            system_instruction="You are a financial document processor.",
-            max_output_tokens=4096,
-        ),
-    )
-
-    return response.text
+    return _generate_cached(prompt, 4096, "Extracting cover page" if verbose else None)
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass, field
+from bisect import bisect_right
 
+from .page_index import PageIndex
 from .pdf_extract import PageData
+from .section_split import SectionData, _pages_between, _trimmed_span
 
 # Section keys
 IFRS_INCOME_STATEMENT = "ifrs_income_statement"
@@ -69,13 +71,10 @@ IFRS_SECTION_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
 _PARENT_COMPANY = re.compile(r"Parent\s+Company", re.IGNORECASE)
 
 
-@dataclass
-class IFRSSectionData:
-    name: str
-    start_page: int  # 1-indexed inclusive
-    end_page: int  # 1-indexed inclusive
-    text: str = ""
-    tables: list[list[list[str]]] = field(default_factory=list)
+class IFRSSectionData(SectionData):
+    """An IFRS financial statement section; tables are gathered lazily from its pages."""
+
+    __slots__ = ()
 
 
 def _is_divider_page(page: PageData) -> bool:
@@ -88,16 +87,22 @@ def _is_parent_company_page(page: PageData) -> bool:
     return bool(_PARENT_COMPANY.search(page.text[:200]))
 
 
-def _find_ifrs_section_starts(pages: list[PageData]) -> list[tuple[str, int]]:
+def _find_ifrs_section_starts(
+    pages: list[PageData], index: PageIndex | None = None,
+) -> list[tuple[str, int]]:
     """Return (section_key, page_number) for the first consolidated match of each pattern."""
+    if index is None:
+        index = PageIndex()
     found: list[tuple[str, int]] = []
     seen_keys: set[str] = set()
 
     for page in pages:
+        if len(seen_keys) == len(IFRS_SECTION_PATTERNS):
+            break
         # Skip divider pages and parent company sections
-        if _is_divider_page(page):
+        if index.is_divider(page):
             continue
-        if _is_parent_company_page(page):
+        if index.is_parent_company(page):
             continue
 
         for key, pattern in IFRS_SECTION_PATTERNS:
@@ -111,36 +116,23 @@ def _find_ifrs_section_starts(pages: list[PageData]) -> list[tuple[str, int]]:
     return found
 
 
-def _split_page_text_at_header(
-    page_text: str, pattern: re.Pattern[str]
-) -> tuple[str, str]:
-    """Split page text at a section header match.
-
-    Returns (text_before, text_from_header).
-    If no match, returns (page_text, "").
-    """
-    m = pattern.search(page_text)
-    if not m:
-        return page_text, ""
-    line_start = page_text.rfind("\n", 0, m.start())
-    if line_start == -1:
-        line_start = 0
-    else:
-        line_start += 1
-    return page_text[:line_start], page_text[line_start:]
-
-
-def split_ifrs_sections(pages: list[PageData]) -> dict[str, IFRSSectionData]:
+def split_ifrs_sections(
+    pages: list[PageData], index: PageIndex | None = None,
+) -> dict[str, IFRSSectionData]:
     """Split extracted pages into IFRS financial statement sections.
 
     Returns a dict keyed by section name. Only returns consolidated
     financial statements — parent company financials are skipped.
+    *index* shares memoized page classifications with earlier steps.
     """
     if not pages:
         return {}
 
+    if index is None:
+        index = PageIndex()
     last_page = pages[-1].page_number
-    starts = _find_ifrs_section_starts(pages)
+    page_numbers = [p.page_number for p in pages]
+    starts = _find_ifrs_section_starts(pages, index)
 
     pattern_by_key: dict[str, re.Pattern[str]] = {
         key: pat for key, pat in IFRS_SECTION_PATTERNS
@@ -156,56 +148,47 @@ def split_ifrs_sections(pages: list[PageData]) -> dict[str, IFRSSectionData]:
             # For the last section (Notes), extend to end of document
             # but stop at parent company financials
             end_pg = last_page
-            for page in pages:
-                if page.page_number > start_pg and _is_parent_company_page(page):
+            for page in pages[bisect_right(page_numbers, start_pg):]:
+                if index.is_parent_company(page):
                     end_pg = page.page_number - 1
                     break
 
         next_key = starts[i + 1][0] if i + 1 < len(starts) else None
         next_start_pg = starts[i + 1][1] if i + 1 < len(starts) else None
 
-        section_text_parts: list[str] = []
-        section_tables: list[list[list[str]]] = []
-
-        for page in pages:
-            if start_pg <= page.page_number <= end_pg:
-                text = page.text
-
-                # Skip divider pages within the range
-                if _is_divider_page(page) and page.page_number != start_pg:
-                    continue
-
-                # On start page, trim text to start from this section's header
-                if page.page_number == start_pg and i > 0:
-                    prev_key, prev_pg = starts[i - 1]
-                    if prev_pg == start_pg:
-                        pat = pattern_by_key.get(key)
-                        if pat:
-                            _, text_from_header = _split_page_text_at_header(text, pat)
-                            if text_from_header:
-                                text = text_from_header
-
-                # On end page, trim before next section header
-                if (
-                    next_key
-                    and next_start_pg == page.page_number
-                    and next_start_pg == end_pg
-                ):
-                    next_pat = pattern_by_key.get(next_key)
-                    if next_pat:
-                        text_before, _ = _split_page_text_at_header(text, next_pat)
-                        if text_before.strip():
-                            text = text_before
-
-                section_text_parts.append(text)
-                section_tables.extend(page.tables)
+        section_spans: list[tuple[int, int]] = []
+        section_pages: list[PageData] = []
+
+        for page in _pages_between(pages, page_numbers, start_pg, end_pg):
+            start_pat = end_pat = None
+
+            # Skip divider pages within the range
+            if index.is_divider(page) and page.page_number != start_pg:
+                continue
+
+            # On start page, trim text to start from this section's header
+            if page.page_number == start_pg and i > 0:
+                prev_key, prev_pg = starts[i - 1]
+                if prev_pg == start_pg:
+                    start_pat = pattern_by_key.get(key)
+
+            # On end page, trim before next section header
+            if (
+                next_key
+                and next_start_pg == page.page_number
+                and next_start_pg == end_pg
+            ):
+                end_pat = pattern_by_key.get(next_key)
+
+            section_spans.append(_trimmed_span(page.text, start_pat, end_pat))
+            section_pages.append(page)
 
         sections[key] = IFRSSectionData(
             name=key,
             start_page=start_pg,
             end_page=end_pg,
-            text="\n\n".join(section_text_parts),
-            tables=section_tables,
+            pages=section_pages,
+            spans=section_spans,
         )
 
     return sections
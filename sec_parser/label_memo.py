@@ -0,0 +1,102 @@
+"""Persistent memo of line-item label normalization results.
+
+Issuer-specific labels recur in every filing of a company and in every run.
+A :class:`LabelMemo` maps normalized label text to its :class:`NormResult`
+in a local SQLite file under the sec-parse cache directory, one namespace
+per taxonomy version, so repeated labels skip fuzzy matching and mappings
+learned in earlier batches carry over.  Like the extraction cache, the memo
+is an optimization: an unreadable or unwritable file just means no memo.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+from .extract_cache import cache_root
+from .normalize import NormResult
+
+# Bump whenever match_line_item's results change for the same taxonomy
+MEMO_FORMAT = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS labels (
+    version TEXT NOT NULL,
+    label TEXT NOT NULL,
+    canonical TEXT,
+    confidence REAL NOT NULL,
+    method TEXT NOT NULL,
+    PRIMARY KEY (version, label)
+)
+"""
+
+
+def memo_path() -> Path:
+    return cache_root() / "labels.sqlite3"
+
+
+def label_key(label: str) -> str:
+    """Memo key for *label*: the text ``match_line_item`` actually compares."""
+    return label.strip().lower()
+
+
+class LabelMemo:
+    """Label -> NormResult memo for one taxonomy version.
+
+    Entries for the version are read once when the memo is opened; new
+    results are buffered by :meth:`put` and written in one transaction by
+    :meth:`flush`.
+    """
+
+    def __init__(self, taxonomy_version: str, path: Path | None = None) -> None:
+        self.version = f"{MEMO_FORMAT}:{taxonomy_version}"
+        self.path = path if path is not None else memo_path()
+        self._entries: dict[str, NormResult] = {}
+        self._pending: dict[str, NormResult] = {}
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    "SELECT label, canonical, confidence, method FROM labels WHERE version = ?",
+                    (self.version,),
+                ).fetchall()
+        except (OSError, sqlite3.Error):
+            return
+        for label, canonical, confidence, method in rows:
+            self._entries[label] = NormResult(canonical, confidence, method)
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute(_SCHEMA)
+        return conn
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, label: str) -> NormResult | None:
+        return self._entries.get(label_key(label))
+
+    def put(self, label: str, result: NormResult) -> None:
+        key = label_key(label)
+        if self._entries.get(key) != result:
+            self._entries[key] = result
+            self._pending[key] = result
+
+    def flush(self) -> None:
+        """Write buffered results; write failures are ignored."""
+        if not self._pending:
+            return
+        rows = [
+            (self.version, label, r.canonical, r.confidence, r.method)
+            for label, r in self._pending.items()
+        ]
+        try:
+            with self._connect() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO labels (version, label, canonical, confidence, method) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+        except (OSError, sqlite3.Error):
+            return
+        self._pending.clear()
@@ -0,0 +1,157 @@
+"""Content-addressed on-disk cache of Gemini responses.
+
+Entries are keyed by a SHA-256 of the model name, the prompt template
+version, the output token limit and the full prompt text, so a warm rerun of
+the same filing replays every Notes, prose, table and cover page response
+without calling the API.  Each entry is zlib-compressed JSON holding the
+response text, response metadata such as its output token count, and the
+time it was created; entries older than the TTL are misses, and the
+directory is trimmed to a size budget by evicting least-recently-used
+entries.
+
+``SEC_PARSER_LLM_CACHE`` selects the mode: ``on`` (default) reads and
+writes, ``readonly`` serves hits but never writes, touches or evicts (for CI
+runs against a prepared cache), and ``off`` bypasses the cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+import zlib
+from pathlib import Path
+from typing import Iterator
+
+from .extract_cache import cache_root
+from .prompts import PROMPT_VERSION
+
+MODES = ("on", "readonly", "off")
+
+DEFAULT_TTL_DAYS = 30.0
+DEFAULT_MAX_MB = 512.0
+
+
+def _llm_dir() -> Path:
+    return cache_root() / "llm"
+
+
+def cache_mode() -> str:
+    """Current mode from ``SEC_PARSER_LLM_CACHE``; unknown values mean ``on``."""
+    mode = os.environ.get("SEC_PARSER_LLM_CACHE", "on").strip().lower()
+    return mode if mode in MODES else "on"
+
+
+def _ttl_seconds() -> float:
+    """Entry lifetime (``SEC_PARSER_LLM_CACHE_TTL_DAYS``; 0 = never expire)."""
+    days = float(os.environ.get("SEC_PARSER_LLM_CACHE_TTL_DAYS", DEFAULT_TTL_DAYS))
+    return days * 86400 if days > 0 else float("inf")
+
+
+def _max_bytes() -> int:
+    """Size budget (``SEC_PARSER_LLM_CACHE_MAX_MB``)."""
+    return int(float(os.environ.get("SEC_PARSER_LLM_CACHE_MAX_MB", DEFAULT_MAX_MB)) * 1024 ** 2)
+
+
+def response_key(model: str, prompt: str, max_output_tokens: int) -> str:
+    """Cache key for one request: model + template version + token limit + prompt."""
+    header = json.dumps(
+        {"model": model, "prompt_version": PROMPT_VERSION, "max_output_tokens": max_output_tokens},
+        sort_keys=True,
+    )
+    return hashlib.sha256(f"{header}\n{prompt}".encode("utf-8")).hexdigest()
+
+
+def _entry_path(key: str) -> Path:
+    return _llm_dir() / f"{key}.json.z"
+
+
+def load_entry(key: str) -> tuple[str, dict] | None:
+    """Return the cached ``(text, meta)`` for *key*, or None on a miss, expiry or unreadable entry."""
+    mode = cache_mode()
+    if mode == "off":
+        return None
+    entry = _entry_path(key)
+    try:
+        payload = json.loads(zlib.decompress(entry.read_bytes()))
+        text = payload["text"]
+        meta = payload.get("meta") or {}
+        created = float(payload["created"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError, zlib.error):
+        return None
+    if time.time() - created > _ttl_seconds():
+        return None
+    if mode == "on":
+        # Touch so eviction treats this entry as recently used
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+    return text, meta
+
+
+def load_response(key: str) -> str | None:
+    """Return the cached response text for *key*, or None."""
+    entry = load_entry(key)
+    return entry[0] if entry is not None else None
+
+
+def iter_meta() -> Iterator[dict]:
+    """Yield the metadata of every readable entry, without touching or expiring any."""
+    for entry in _llm_dir().glob("*.json.z"):
+        try:
+            meta = json.loads(zlib.decompress(entry.read_bytes())).get("meta")
+        except (OSError, ValueError, AttributeError, zlib.error):
+            continue
+        if isinstance(meta, dict):
+            yield meta
+
+
+def store_response(key: str, text: str | None, meta: dict | None = None) -> None:
+    """Cache *text* (and JSON-serializable *meta*) under *key*, then evict down to the size budget.
+
+    Empty responses are not cached, and nothing is written unless the mode
+    is ``on``.  Write failures are ignored.
+    """
+    if not text or cache_mode() != "on":
+        return
+    payload = {"created": time.time(), "text": text, "meta": meta or {}}
+    data = zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"), 6)
+    entry = _entry_path(key)
+    try:
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        tmp = entry.with_suffix(f".{os.getpid()}.{os.urandom(4).hex()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, entry)
+    except OSError:
+        return
+    evict(_max_bytes())
+
+
+def evict(max_bytes: int | None = None) -> int:
+    """Delete expired entries, then least-recently-used ones until the cache fits *max_bytes*.
+
+    An entry whose file has not been written or read within the TTL cannot
+    be live, so expiry is judged by mtime without decompressing it.
+    Returns the number of entries removed.
+    """
+    if max_bytes is None:
+        max_bytes = _max_bytes()
+    try:
+        entries = [(e.stat().st_mtime, e.stat().st_size, e) for e in _llm_dir().glob("*.json.z")]
+    except OSError:
+        return 0
+    cutoff = time.time() - _ttl_seconds()
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for mtime, size, entry in sorted(entries):
+        if total <= max_bytes and mtime >= cutoff:
+            break
+        try:
+            entry.unlink()
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
@@ -142,6 +142,38 @@ def assemble_markdown(
     return "\n".join(parts) + "\n"
 
 
+def _cell_key(label: str) -> str:
+    """Label as a rendered table cell compares: whitespace collapsed, lowercase."""
+    return " ".join(label.split()).lower()
+
+
+def fill_canonical_column(content: str, canonical_by_label: dict[str, str]) -> str:
+    """Fill empty Canonical cells of normalized statement tables in *content*.
+
+    *canonical_by_label* keys are matched ignoring case and whitespace, since
+    rendering collapses a multi-line or multi-space label into single spaces.
+    Only tables whose header's second column is "Canonical" are touched.
+    """
+    canonical_by_label = {_cell_key(k): v for k, v in canonical_by_label.items()}
+    lines = content.split("\n")
+    in_canonical_table = False
+    prev_is_row = False
+    for i, line in enumerate(lines):
+        is_row = line.startswith("| ")
+        if is_row and not prev_is_row:
+            cells = line.split(" | ")
+            in_canonical_table = len(cells) > 1 and cells[1].strip(" |") == "Canonical"
+        elif is_row and in_canonical_table:
+            cells = line.split(" | ")
+            if len(cells) > 2 and cells[1] == "":
+                canonical = canonical_by_label.get(_cell_key(cells[0][2:]))
+                if canonical:
+                    cells[1] = canonical
+                    lines[i] = " | ".join(cells)
+        prev_is_row = is_row
+    return "\n".join(lines)
+
+
 def write_markdown(output_path: Path, content: str) -> None:
     """Write markdown content to a file, creating parent directories as needed."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import difflib
 import re
+from collections import Counter
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import yaml
+if TYPE_CHECKING:
+    from .label_memo import LabelMemo
 
 
 @dataclass
@@ -19,11 +21,14 @@ class NormResult:
 
 
 def load_taxonomy(path: str | Path | None = None) -> dict:
-    """Load taxonomy YAML. Default path: taxonomy.yaml next to this file."""
-    if path is None:
-        path = Path(__file__).parent / "taxonomy.yaml"
-    with open(path, "r") as f:
-        return yaml.safe_load(f)
+    """Load taxonomy YAML. Default path: taxonomy.yaml next to this file.
+
+    The parsed taxonomy is compiled once per process and shared between
+    calls (see ``taxonomy_cache``), so callers must not mutate it.
+    """
+    from .taxonomy_cache import compiled_taxonomy
+
+    return compiled_taxonomy(path).taxonomy
 
 
 def _build_alias_index(taxonomy: dict) -> dict[str, str]:
@@ -46,6 +51,111 @@ def _build_alias_index(taxonomy: dict) -> dict[str, str]:
     return index
 
 
+# Aliases sharing the most trigrams with a label are scored first, so the
+# bounds below prune the rest of the index against a strong best score
+_FUZZY_SEED_CANDIDATES = 8
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _char_masks(text: str) -> dict[str, int]:
+    """Bit i of masks[c] is set when text[i] == c (for :func:`_lcs_length`)."""
+    masks: dict[str, int] = {}
+    for i, c in enumerate(text):
+        masks[c] = masks.get(c, 0) | (1 << i)
+    return masks
+
+
+def _lcs_length(a: str, b_masks: dict[str, int], b_len: int) -> int:
+    """Longest common subsequence of *a* and b, bit-parallel over b's positions."""
+    full = (1 << b_len) - 1
+    v = full
+    for c in a:
+        u = v & b_masks.get(c, 0)
+        v = ((v + u) | (v - u)) & full
+    return b_len - bin(v).count("1")
+
+
+class FuzzyMatcher:
+    """Best ``SequenceMatcher.ratio`` of a label against every alias, pruned.
+
+    Gives exactly the result of scoring every alias in index order and
+    keeping the first highest ratio, but only computes the full ratio for
+    aliases whose length bound (``real_quick_ratio``), character-count
+    bound (``quick_ratio``) and longest-common-subsequence bound could still
+    beat the best score so far.  SequenceMatcher's matching blocks form a
+    common subsequence, so each bound is at least the ratio.  Trigram
+    postings pick the first candidates to score.
+    """
+
+    def __init__(self, alias_index: dict[str, str]) -> None:
+        self.aliases = list(alias_index)
+        self.canonicals = list(alias_index.values())
+        self._counts = [Counter(alias) for alias in self.aliases]
+        self._masks = [_char_masks(alias) for alias in self.aliases]
+        self._by_length: dict[int, list[int]] = {}
+        self._postings: dict[str, list[int]] = {}
+        for pos, alias in enumerate(self.aliases):
+            self._by_length.setdefault(len(alias), []).append(pos)
+            for gram in _trigrams(alias):
+                self._postings.setdefault(gram, []).append(pos)
+
+    def best(self, label: str) -> tuple[float, str | None]:
+        """(score, canonical) of the best-scoring alias for lowercase *label*.
+
+        Ties go to the alias earliest in the index; canonical is None when
+        no alias scores above 0.
+        """
+        best_score, best_pos = 0.0, -1
+        scored: set[int] = set()
+        label_len = len(label)
+        label_counts = Counter(label)
+
+        def can_win(bound: float, pos: int) -> bool:
+            return bound > best_score or (bound == best_score and 0 <= pos < best_pos)
+
+        def score(pos: int) -> None:
+            nonlocal best_score, best_pos
+            scored.add(pos)
+            ratio = difflib.SequenceMatcher(None, label, self.aliases[pos]).ratio()
+            if ratio > best_score or (ratio == best_score and 0 <= pos < best_pos):
+                best_score, best_pos = ratio, pos
+
+        hits: Counter[int] = Counter()
+        for gram in _trigrams(label):
+            hits.update(self._postings.get(gram, ()))
+        for pos, _ in hits.most_common(_FUZZY_SEED_CANDIDATES):
+            score(pos)
+
+        # Character-count bounds for every alias the length bound keeps,
+        # scored best bound first until no remaining alias can win
+        bounds: list[tuple[float, int]] = []
+        for length, positions in self._by_length.items():
+            total = label_len + length
+            if 2.0 * min(label_len, length) / total < best_score:
+                continue
+            for pos in positions:
+                if pos in scored:
+                    continue
+                counts = self._counts[pos]
+                common = sum(min(n, counts[c]) for c, n in label_counts.items() if c in counts)
+                bounds.append((-2.0 * common / total, pos))
+        bounds.sort()
+        for neg_bound, pos in bounds:
+            if not can_win(-neg_bound, pos):
+                break
+            alias_len = len(self.aliases[pos])
+            common = _lcs_length(label, self._masks[pos], alias_len)
+            if can_win(2.0 * common / (label_len + alias_len), pos):
+                score(pos)
+
+        if best_pos < 0:
+            return best_score, None
+        return best_score, self.canonicals[best_pos]
+
+
 def match_line_item(
     label: str, taxonomy: dict, alias_index: dict[str, str] | None = None,
 ) -> NormResult:
@@ -54,21 +164,19 @@ def match_line_item(
         return NormResult(None, 0.0, "none")
 
     if alias_index is None:
-        alias_index = _build_alias_index(taxonomy)
+        from .taxonomy_cache import alias_index_for
+
+        alias_index = alias_index_for(taxonomy)
     label_lower = label.strip().lower()
 
     # Exact match
     if label_lower in alias_index:
         return NormResult(alias_index[label_lower], 1.0, "exact")
 
-    # Fuzzy match against all aliases
-    best_score = 0.0
-    best_canonical = None
-    for alias, canonical in alias_index.items():
-        score = difflib.SequenceMatcher(None, label_lower, alias).ratio()
-        if score > best_score:
-            best_score = score
-            best_canonical = canonical
+    # Fuzzy match against all aliases (pruned by the index's matcher)
+    from .taxonomy_cache import fuzzy_matcher_for
+
+    best_score, best_canonical = fuzzy_matcher_for(alias_index).best(label_lower)
 
     if best_score >= 0.85:
         return NormResult(best_canonical, best_score, "fuzzy")
@@ -97,17 +205,25 @@ _CONTEXT_OVERRIDES: dict[str, dict[str, str]] = {
 
 
 def normalize_table_rows(
-    rows: list[list[str]], taxonomy: dict
+    rows: list[list[str]],
+    taxonomy: dict,
+    alias_index: dict[str, str] | None = None,
+    memo: LabelMemo | None = None,
 ) -> list[list[str]]:
     """Add 'Canonical' column at index 1 to each row.
 
     Tracks current vs non-current context from section header rows
     (e.g. "Current assets:", "Non-current liabilities:") to disambiguate
     labels that appear in both sections (e.g. "Marketable securities").
+
+    With a *memo* (opened for this taxonomy), labels it already knows skip
+    matching, and new fuzzy and unmatched results are recorded in it.
     """
     from .programmatic import _is_numeric
+    from .taxonomy_cache import alias_index_for
 
-    alias_index = _build_alias_index(taxonomy)
+    if alias_index is None:
+        alias_index = alias_index_for(taxonomy)
     result = []
     context = ""  # "current" or "non-current"
 
@@ -138,7 +254,12 @@ def normalize_table_rows(
                 if context and context in override:
                     canonical = override[context]
                 else:
-                    match = match_line_item(stripped, taxonomy, alias_index=alias_index)
+                    match = memo.get(stripped) if memo is not None else None
+                    if match is None:
+                        match = match_line_item(stripped, taxonomy, alias_index=alias_index)
+                        # Exact hits are as cheap as the memo; keep it to real work
+                        if memo is not None and match.method != "exact":
+                            memo.put(stripped, match)
                     canonical = match.canonical if match.canonical else ""
 
         new_row = [row[0], canonical] + row[1:]
@@ -161,6 +282,58 @@ def collect_unmapped(rows: list[list[str]], taxonomy: dict) -> list[str]:
     return unmapped
 
 
+# Labels per LLM call in the batch-level tier; one call covers many filings
+LLM_LABEL_BATCH = 300
+
+
+def llm_normalize_labels(
+    labels: list[str],
+    taxonomy: dict,
+    memo: LabelMemo | None = None,
+    batch_size: int = LLM_LABEL_BATCH,
+    verbose: bool = False,
+) -> dict[str, str]:
+    """Resolve unmapped labels gathered across filings in a few large LLM calls.
+
+    Labels are deduplicated on their normalized text; labels *memo* already
+    holds an LLM answer for are not sent again.  Only answers naming a
+    canonical from the taxonomy are kept; they and explicit UNMAPPED answers
+    are recorded in *memo*, so unresolvable labels are not asked about again.
+    Returns ``{label_key(label): canonical}`` for every resolved label.
+    """
+    from .label_memo import label_key
+    from .taxonomy_cache import canonical_names_for
+
+    resolved: dict[str, str] = {}
+    pending: dict[str, str] = {}  # key -> first spelling seen
+    for label in labels:
+        key = label_key(label)
+        if not key or key in pending or key in resolved:
+            continue
+        known = memo.get(label) if memo is not None else None
+        if known is not None and known.method == "llm":
+            if known.canonical:
+                resolved[key] = known.canonical
+            continue
+        pending[key] = label.strip()
+
+    canonical_names = set(canonical_names_for(taxonomy))
+    batch = list(pending.values())
+    for start in range(0, len(batch), batch_size):
+        answers = llm_normalize_batch(batch[start:start + batch_size], taxonomy, verbose=verbose)
+        for label, canonical in answers.items():
+            key = label_key(label)
+            if key not in pending:
+                continue
+            if canonical in canonical_names:
+                resolved[key] = canonical
+                if memo is not None:
+                    memo.put(label, NormResult(canonical, 1.0, "llm"))
+            elif not canonical and memo is not None:
+                memo.put(label, NormResult(None, 0.0, "llm"))
+    return resolved
+
+
 def llm_normalize_batch(
     unmapped_labels: list[str],
     taxonomy: dict,
@@ -168,22 +341,15 @@ def llm_normalize_batch(
 ) -> dict[str, str]:
     """Send unmapped labels to Gemini for classification.
 
-    Returns a dict mapping original labels to canonical names.
-    Labels the LLM cannot classify are omitted from the result.
+    Returns a dict mapping original labels to canonical names.  Labels the
+    LLM answers UNMAPPED map to an empty string; labels missing from the
+    response (or every label, if the call fails) are omitted.
     """
     try:
         from .gemini_client import generate
+        from .taxonomy_cache import canonical_names_for
 
-        # Collect all canonical names
-        canonical_names = []
-        for section in taxonomy.values():
-            if not isinstance(section, dict):
-                continue
-            for item in section.values():
-                if not isinstance(item, dict):
-                    continue
-                canonical_names.append(item.get("canonical", ""))
-
+        canonical_names = canonical_names_for(taxonomy)
         canonical_list = "\n".join(f"- {name}" for name in canonical_names)
         label_list = "\n".join(f"- {label}" for label in unmapped_labels)
 
@@ -211,11 +377,11 @@ def llm_normalize_batch(
             if len(parts) == 2:
                 src = parts[0].strip().strip("- ")
                 dst = parts[1].strip()
-                if dst != "UNMAPPED":
-                    result[src] = dst
+                result[src] = "" if dst == "UNMAPPED" else dst
 
         if verbose:
-            print(f"[LLM] Mapped {len(result)} of {len(unmapped_labels)} labels")
+            mapped = sum(1 for dst in result.values() if dst)
+            print(f"[LLM] Mapped {mapped} of {len(unmapped_labels)} labels")
 
         return result
 
@@ -0,0 +1,149 @@
+"""Per-company store of extracted notes, reused across a company's filings.
+
+Consecutive 10-Qs repeat most notes word for word.  Each note is
+fingerprinted after normalizing what varies between filings without
+changing its content — whitespace, page footers, thousands separators
+and the note's own number — and its extracted markdown is kept in a local
+SQLite file under the sec-parse cache directory, keyed by CIK.  A later
+filing from the same CIK reuses the stored output for every note whose
+fingerprint matches, so only new or changed notes go to the LLM.  Amounts
+are part of the fingerprint: a note whose figures changed is re-extracted.
+
+Like the label memo, the store is an optimization: an unreadable or
+unwritable file just means every note is extracted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import sqlite3
+from pathlib import Path
+
+from .extract_cache import cache_root
+
+# Bump whenever note splitting or fingerprinting changes
+NOTE_STORE_FORMAT = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS notes (
+    cik TEXT NOT NULL,
+    version TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    number TEXT,
+    output TEXT NOT NULL,
+    PRIMARY KEY (cik, version, fingerprint)
+)
+"""
+
+_NOTE_NUMBER_RE = re.compile(r"^(\s*(?:Note|NOTE)\s+)(\d+)")
+# A page footer is a bare number ending a page; section pages are joined by a blank line
+_PAGE_FOOTER_RE = re.compile(
+    r"^[ \t]*(?:Page )?\d{1,3}[ \t]*(?=\n\n|\Z)", re.MULTILINE | re.IGNORECASE,
+)
+_RUNNING_HEADER_RE = re.compile(
+    r"^[ \t]*Table of Contents[ \t]*$", re.MULTILINE | re.IGNORECASE,
+)
+_THOUSANDS_RE = re.compile(r"(?<=\d)[,\s](?=\d{3}(?!\d))")
+_PAREN_NUMBER_RE = re.compile(r"\(\s*([\d.,]+)\s*\)")
+_CURRENCY_SPACE_RE = re.compile(r"([$€£])\s+(?=\d)")
+
+
+def store_path() -> Path:
+    return cache_root() / "notes.sqlite3"
+
+
+def note_number(note: str) -> str | None:
+    """The number in *note*'s leading ``Note N`` heading, if any."""
+    m = _NOTE_NUMBER_RE.match(note)
+    return m.group(2) if m else None
+
+
+def note_fingerprint(note: str) -> str:
+    """Hex SHA-256 of *note* with filing-to-filing noise normalized away."""
+    text = _NOTE_NUMBER_RE.sub(r"\1#", note, count=1)
+    text = _PAGE_FOOTER_RE.sub("", text)
+    text = _RUNNING_HEADER_RE.sub("", text)
+    text = _THOUSANDS_RE.sub("", text)
+    text = _PAREN_NUMBER_RE.sub(r"(\1)", text)
+    text = _CURRENCY_SPACE_RE.sub(r"\1", text)
+    return hashlib.sha256(" ".join(text.split()).encode("utf-8")).hexdigest()
+
+
+def renumber(output: str, old: str | None, new: str | None) -> str:
+    """Rewrite the note number in a reused *output*'s heading from *old* to *new*."""
+    if old is None or new is None or old == new:
+        return output
+    pattern = re.compile(rf"\b((?:Note|NOTE)\s+){re.escape(old)}\b")
+    return pattern.sub(rf"\g<1>{new}", output, count=1)
+
+
+class NoteStore:
+    """Fingerprint -> extracted note output for one CIK and extraction setup.
+
+    *version* identifies what produced the outputs (model and prompt
+    version), so a different model never reuses another's notes.  Entries
+    are read once when the store is opened; :meth:`flush` writes new ones in
+    one transaction.
+    """
+
+    def __init__(self, cik: str, version: str, path: Path | None = None) -> None:
+        self.cik = cik.lstrip("0") or "0"
+        self.version = f"{NOTE_STORE_FORMAT}:{version}"
+        self.path = path if path is not None else store_path()
+        self._entries: dict[str, tuple[str | None, str]] = {}
+        self._pending: dict[str, tuple[str | None, str]] = {}
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    "SELECT fingerprint, number, output FROM notes WHERE cik = ? AND version = ?",
+                    (self.cik, self.version),
+                ).fetchall()
+        except (OSError, sqlite3.Error):
+            return
+        for fingerprint, number, output in rows:
+            self._entries[fingerprint] = (number, output)
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute(_SCHEMA)
+        return conn
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, note: str) -> str | None:
+        """Stored output for a note matching *note*, renumbered to its heading."""
+        entry = self._entries.get(note_fingerprint(note))
+        if entry is None:
+            return None
+        number, output = entry
+        return renumber(output, number, note_number(note))
+
+    def put(self, note: str, output: str) -> None:
+        if not output:
+            return
+        entry = (note_number(note), output)
+        fingerprint = note_fingerprint(note)
+        self._entries[fingerprint] = entry
+        self._pending[fingerprint] = entry
+
+    def flush(self) -> None:
+        """Write buffered outputs; write failures are ignored."""
+        if not self._pending:
+            return
+        rows = [
+            (self.cik, self.version, fingerprint, number, output)
+            for fingerprint, (number, output) in self._pending.items()
+        ]
+        try:
+            with self._connect() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO notes (cik, version, fingerprint, number, output) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+        except (OSError, sqlite3.Error):
+            return
+        self._pending.clear()
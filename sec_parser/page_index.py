@@ -0,0 +1,103 @@
+"""Per-document index of page facts shared by detection and section splitting.
+
+Report-type detection, 10-K start detection, SEC and IFRS section splitting
+each classify the same pages (TOC, divider, parent-company) and locate the
+line around a heading match.  A :class:`PageIndex` computes each of these
+once per page, on first use, and every consumer reads the memoized value.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from typing import Callable
+
+from .pdf_extract import PageData
+
+
+class PageIndex:
+    """Memoized per-page facts for one document, keyed by page number.
+
+    Only the computed facts are held, never the pages themselves; facts for
+    pages that are no longer needed are dropped with :meth:`retain_from`.
+    """
+
+    def __init__(self) -> None:
+        self._newlines: dict[int, list[int]] = {}
+        self._flags: dict[tuple[str, int], object] = {}
+
+    def retain_from(self, page_number: int) -> None:
+        """Forget everything memoized for pages before *page_number*."""
+        self._newlines = {n: v for n, v in self._newlines.items() if n >= page_number}
+        self._flags = {k: v for k, v in self._flags.items() if k[1] >= page_number}
+
+    def _memo(self, name: str, page: PageData, compute: Callable[[PageData], object]):
+        key = (name, page.page_number)
+        try:
+            return self._flags[key]
+        except KeyError:
+            value = self._flags[key] = compute(page)
+            return value
+
+    # -- line lookup ---------------------------------------------------------
+
+    def newlines(self, page: PageData) -> list[int]:
+        """Offsets of every newline in *page*'s text, ascending."""
+        offsets = self._newlines.get(page.page_number)
+        if offsets is None:
+            offsets = [m.start() for m in re.finditer("\n", page.text)]
+            self._newlines[page.page_number] = offsets
+        return offsets
+
+    def line_bounds(self, page: PageData, start: int, end: int) -> tuple[int, int]:
+        """(line start, line end) around text[start:end], as rfind/find would give.
+
+        The span runs from just after the last newline before *start* to the
+        first newline at or after *end* (or the end of the text).
+        """
+        offsets = self.newlines(page)
+        i = bisect_left(offsets, start)
+        line_start = offsets[i - 1] + 1 if i else 0
+        j = bisect_left(offsets, end, i)
+        line_end = offsets[j] if j < len(offsets) else len(page.text)
+        return line_start, line_end
+
+    # -- SEC section splitting -----------------------------------------------
+
+    def section_matches(self, page: PageData) -> dict[str, list[re.Match[str]]]:
+        """Section-pattern matches on *page* (see ``section_split._section_matches``)."""
+        from .section_split import _section_matches
+
+        return self._memo("section_matches", page, lambda p: _section_matches(p.text))
+
+    def is_toc(self, page: PageData) -> bool:
+        """``section_split._is_toc_page`` for *page*."""
+        from .section_split import _is_toc_page
+
+        return self._memo("toc", page, lambda p: _is_toc_page(p, self.section_matches(p)))
+
+    # -- report-type and 10-K start detection --------------------------------
+
+    def is_detect_toc(self, page: PageData) -> bool:
+        """``detect._is_toc_page`` for *page* (the stricter cover-page TOC check)."""
+        from .detect import _is_toc_page
+
+        return self._memo("detect_toc", page, lambda p: _is_toc_page(p.text))
+
+    def report_markers(self, page: PageData) -> tuple[frozenset[int], frozenset[int]]:
+        """Indices of the SEC and IFRS marker patterns found on *page*."""
+        from .detect import _report_markers
+
+        return self._memo("report_markers", page, lambda p: _report_markers(p.text))
+
+    # -- IFRS section splitting ----------------------------------------------
+
+    def is_divider(self, page: PageData) -> bool:
+        from .ifrs_section_split import _is_divider_page
+
+        return self._memo("divider", page, _is_divider_page)
+
+    def is_parent_company(self, page: PageData) -> bool:
+        from .ifrs_section_split import _is_parent_company_page
+
+        return self._memo("parent_company", page, _is_parent_company_page)
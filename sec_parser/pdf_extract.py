@@ -2,18 +2,72 @@
 
 from __future__ import annotations
 
+import os
 import re
-from dataclasses import dataclass, field
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable, Iterable, Iterator
 
 import pdfplumber
 
 
-@dataclass
 class PageData:
-    page_number: int
-    text: str
-    tables: list[list[list[str]]] = field(default_factory=list)
+    """Text and tables extracted from a single PDF page.
+
+    Tables are either supplied up front or produced on first access by
+    *table_loader*, a callable that receives the page and returns its cleaned
+    tables (see ``extract_pdf(lazy_tables=True)``).
+    """
+
+    # Long filings hold thousands of pages; no per-instance __dict__
+    __slots__ = ("page_number", "text", "_tables", "_table_loader")
+
+    def __init__(
+        self,
+        page_number: int,
+        text: str,
+        tables: list[list[list[str]]] | None = None,
+        table_loader: Callable[[PageData], list[list[list[str]]]] | None = None,
+    ) -> None:
+        self.page_number = page_number
+        self.text = text
+        if tables is None and table_loader is None:
+            tables = []
+        self._tables = tables
+        self._table_loader = table_loader if tables is None else None
+
+    @property
+    def tables(self) -> list[list[list[str]]]:
+        if self._tables is None:
+            self._tables = self._table_loader(self)
+            self._table_loader = None
+        return self._tables
+
+    @tables.setter
+    def tables(self, value: list[list[list[str]]]) -> None:
+        self._tables = value
+        self._table_loader = None
+
+    @property
+    def tables_loaded(self) -> bool:
+        """True once tables are available without running the loader."""
+        return self._tables is not None
+
+    def __repr__(self) -> str:
+        tables = repr(self._tables) if self._tables is not None else "<lazy>"
+        return f"PageData(page_number={self.page_number!r}, text={self.text!r}, tables={tables})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PageData):
+            return NotImplemented
+        return (
+            self.page_number == other.page_number
+            and self.text == other.text
+            and self.tables == other.tables
+        )
 
 
 # Patterns suggesting a page contains financial statement data
@@ -32,6 +86,16 @@ _TEXT_TABLE_SETTINGS = {
     "horizontal_strategy": "text",
 }
 
+# Pages with at least this many vector/image objects, more of them than
+# characters, and no financial-statement wording are charts and artwork:
+# line-based table detection crawls every edge and never finds a statement
+DECORATIVE_MIN_GRAPHICS = 300
+_GRAPHIC_KINDS = ("rect", "curve", "line", "image")
+
+# Below this many pages, worker start-up and PDF re-parsing in every worker
+# cost more than parallel extraction saves
+PARALLEL_MIN_PAGES = 40
+
 
 def _collapse_repeated_chars(text: str) -> str:
     """Collapse character-tripled/doubled text from bold PDF rendering.
@@ -51,83 +115,73 @@ def _collapse_repeated_chars(text: str) -> str:
     return '\n'.join(result)
 
 
+# A run of one repeated character (cells may contain newlines)
+_CHAR_RUN = re.compile(r"(.)\1*", re.DOTALL)
+
+# A run of 2+ of the same non-space character — the only runs any factor can match
+_REPEATED_RUN = re.compile(r"([^ ])\1+")
+
+
 def _try_collapse_line(line: str) -> str:
     """Try to collapse a single line of repeated characters.
 
     Tries multiple repeat factors (2-15) and picks the best one.
     Some PDFs overlay glyphs varying numbers of times for bold/emphasis.
+
+    The line is run-length encoded once and every factor is scored from that
+    encoding.  A run of non-space characters *matches* a factor when its
+    length is a multiple of it; a factor is accepted when at least 70% of the
+    (3 or more) non-space runs match.  Space runs always collapse to one
+    space.  Among accepted factors the one giving the shortest result wins
+    (the smallest factor on ties).
     """
     if len(line) < 6:
         return line
 
-    # Try each factor and collect candidates with their match quality
-    best: tuple[float, int, str] | None = None  # (match_ratio, factor, result)
-    for factor in range(2, 16):
-        if len(line) < factor * 3:
-            continue
-        collapsed = _collapse_with_factor(line, factor)
-        if collapsed is not None:
-            # Score by compression ratio — real repeated text compresses a lot
-            ratio = len(collapsed) / len(line)
-            # Prefer higher factors when ratio is similar (more compression = more likely)
-            score = ratio  # lower is better (more compression)
-            if best is None or score < best[0]:
-                best = (score, factor, collapsed)
-
-    if best is not None:
-        return best[2]
-    return line
-
-
-def _collapse_with_factor(line: str, factor: int) -> str | None:
-    """Try to collapse a line assuming each char is repeated `factor` times.
-
-    Returns the collapsed string if successful, None if the pattern doesn't match.
-    """
-    # Check if the line can be evenly divided
-    # Build the collapsed version and verify it matches
-    chars = list(line)
-    if not chars:
-        return None
-
-    collapsed = []
-    i = 0
-    matches = 0
-    total_groups = 0
-
-    while i < len(chars):
-        ch = chars[i]
-        # Count consecutive occurrences of this character
-        j = i
-        while j < len(chars) and chars[j] == ch:
-            j += 1
-        run_length = j - i
-
-        if ch == ' ':
-            # Spaces may not be exactly repeated — be lenient
-            collapsed.append(' ')
-            i = j
-            continue
+    # Cheap pre-check: only runs of 2+ can match a factor, so they bound the
+    # match ratio before the line is fully encoded
+    repeated = extra = 0
+    for m in _REPEATED_RUN.finditer(line):
+        repeated += 1
+        extra += m.end() - m.start() - 1
+    if not repeated:
+        return line
+    total_groups = len(line) - line.count(" ") - extra  # non-space runs
+    if total_groups < 3 or repeated / total_groups < 0.7:
+        return line
 
-        total_groups += 1
-        if run_length == factor:
-            matches += 1
-            collapsed.append(ch)
-            i = j
-        elif run_length % factor == 0:
-            # Multiple of factor — might be legitimate repeated chars
-            matches += 1
-            collapsed.append(ch * (run_length // factor))
-            i = j
+    runs = [(m.group(1), m.end() - m.start()) for m in _CHAR_RUN.finditer(line)]
+    space_runs = 0
+    run_lengths: dict[int, int] = {}  # run length -> number of non-space runs
+    for ch, length in runs:
+        if ch == " ":
+            space_runs += 1
         else:
-            # Doesn't match the pattern
-            collapsed.append(ch * run_length)
-            i = j
+            run_lengths[length] = run_lengths.get(length, 0) + 1
 
-    # Only accept if a high proportion of character groups match the pattern
-    if total_groups > 0 and matches / total_groups >= 0.7 and total_groups >= 3:
-        return ''.join(collapsed)
-    return None
+    # Score by compression — real repeated text compresses a lot
+    best: tuple[int, int] | None = None  # (collapsed_length, factor)
+    for factor in range(2, 16):
+        if len(line) < factor * 3:
+            break
+        matches = 0
+        collapsed_len = space_runs
+        for length, count in run_lengths.items():
+            if length % factor == 0:
+                matches += count
+                collapsed_len += count * (length // factor)
+            else:
+                collapsed_len += count * length
+        if matches / total_groups >= 0.7 and (best is None or collapsed_len < best[0]):
+            best = (collapsed_len, factor)
+
+    if best is None:
+        return line
+    factor = best[1]
+    return "".join(
+        " " if ch == " " else ch * (length // factor if length % factor == 0 else length)
+        for ch, length in runs
+    )
 
 
 # Financial terms used for de-interleave scoring
@@ -145,6 +199,26 @@ _COMMON_WORDS = set(_FINANCIAL_TERMS + [
 ])
 
 
+# Letter set per financial term, built once: a term can only occur in a
+# de-interleaved stream if the cell contains all of its letters
+_TERM_LETTER_SETS: list[tuple[str, frozenset[str]]] = [
+    (term, frozenset(term)) for term in _FINANCIAL_TERMS
+]
+
+# De-interleaved text is accepted at this score (term characters matched)
+_MIN_DEINTERLEAVE_SCORE = 10
+
+
+def _candidate_terms(text_lower: str) -> list[str]:
+    """Financial terms whose letters all occur in *text_lower*.
+
+    Streams only rearrange the cell's characters, so no other term can be
+    found in any stream split; clean cells usually leave few or none.
+    """
+    letters = set(text_lower)
+    return [term for term, term_letters in _TERM_LETTER_SETS if term_letters <= letters]
+
+
 def _try_deinterleave(text: str) -> str:
     """Try to de-interleave garbled text from rotated PDF headers.
 
@@ -157,16 +231,24 @@ def _try_deinterleave(text: str) -> str:
     stripped = text.strip()
     if len(stripped) < 10 or len(stripped) >= 60:
         return text
-    # Skip if contains digits (likely financial values, not headers)
-    if any(c.isdigit() for c in stripped):
+    # Skip if contains digits (likely financial values, not headers); str.isdigit
+    # also covers superscript footnote markers, which \d does not
+    if any(map(str.isdigit, stripped)):
         return text
 
     # Check if text already looks reasonable (has recognizable words)
-    words_lower = stripped.lower().split()
+    lower = stripped.lower()
+    words_lower = lower.split()
     recognized = sum(1 for w in words_lower if w in _COMMON_WORDS)
     if len(words_lower) > 0 and recognized / len(words_lower) >= 0.4:
         return text  # Already looks fine
 
+    # Fast rejection before any streams are built: each candidate term can
+    # score in at most 3 streams
+    terms = _candidate_terms(lower)
+    if 3 * sum(len(term) for term in terms) < _MIN_DEINTERLEAVE_SCORE:
+        return text
+
     # Try splitting into 2 or 3 interleaved streams
     # Try both with and without spaces (spaces may be interleaved too)
     best_result = None
@@ -181,16 +263,13 @@ def _try_deinterleave(text: str) -> str:
         for n_streams in (2, 3):
             if len(candidate) < n_streams * 4:
                 continue
-            streams = [[] for _ in range(n_streams)]
-            for idx, ch in enumerate(candidate):
-                streams[idx % n_streams].append(ch)
-            parts = ["".join(s).strip() for s in streams]
+            parts = [candidate[k::n_streams].strip() for k in range(n_streams)]
 
             # Score: count how many financial terms appear in the parts
             score = 0
             for part in parts:
                 part_lower = part.lower()
-                for term in _FINANCIAL_TERMS:
+                for term in terms:
                     if term in part_lower:
                         score += len(term)  # Weight by term length
 
@@ -200,7 +279,7 @@ def _try_deinterleave(text: str) -> str:
 
     # Require a meaningful score to accept the de-interleaved version
     # At least 2 financial terms worth of characters matched
-    if best_score >= 10 and best_result:
+    if best_score >= _MIN_DEINTERLEAVE_SCORE and best_result:
         return best_result
 
     return text
@@ -214,40 +293,365 @@ def _clean_tables(raw_tables: list) -> list[list[list[str]]]:
     ]
 
 
-def extract_pdf(path: Path) -> list[PageData]:
-    """Extract text and tables from every page of a PDF.
+def _clean_cells(tables: list[list[list[str]]]) -> list[list[list[str]]]:
+    """Apply character collapse then de-interleaving to every table cell.
+
+    Cells are interned: "", "$", ")" and repeated labels make up most of a
+    statement page's cells, and every page then shares one copy of each.
+    """
+    return [
+        [[sys.intern(_try_deinterleave(_try_collapse_line(cell))) for cell in row] for row in table]
+        for table in tables
+    ]
+
+
+def intern_tables(tables: list[list[list[str]]]) -> list[list[list[str]]]:
+    """Intern every cell of already-cleaned *tables* (e.g. loaded from a cache)."""
+    return [[[sys.intern(cell) for cell in row] for row in table] for table in tables]
+
+
+def _extract_page_text(page) -> str:
+    """Extract a page's text with bold-rendering artifacts collapsed."""
+    text = page.extract_text() or ""
+    return _collapse_repeated_chars(text)  # Fix character-tripled bold text
+
+
+@dataclass
+class ExtractionStats:
+    """Counters gathered while extracting a document's pages and tables."""
+    pages: int = 0
+    table_pages: int = 0
+    table_seconds: float = 0.0
+    table_graphics: int = 0
+    decorative_skipped: int = 0
+    skipped_graphics: int = 0
+
+    @property
+    def estimated_seconds_saved(self) -> float:
+        """Table time avoided on skipped pages, at the per-object rate observed."""
+        if not self.table_graphics:
+            return 0.0
+        return self.skipped_graphics * self.table_seconds / self.table_graphics
+
+    def merge(self, other: ExtractionStats) -> None:
+        """Add *other*'s counters (e.g. from a worker process) to these."""
+        self.pages += other.pages
+        self.table_pages += other.table_pages
+        self.table_seconds += other.table_seconds
+        self.table_graphics += other.table_graphics
+        self.decorative_skipped += other.decorative_skipped
+        self.skipped_graphics += other.skipped_graphics
+
+
+def _page_object_counts(page) -> tuple[int, int]:
+    """(characters, vector and image objects) on a pdfplumber page."""
+    objects = page.objects
+    graphics = sum(len(objects.get(kind, ())) for kind in _GRAPHIC_KINDS)
+    return len(objects.get("char", ())), graphics
+
+
+def is_decorative_page(chars: int, graphics: int, text: str) -> bool:
+    """True for chart/artwork pages that cannot hold a statement table."""
+    return (
+        graphics >= DECORATIVE_MIN_GRAPHICS
+        and graphics > chars
+        and not _FINANCIAL_HINT.search(text)
+    )
+
+
+def _extract_page_tables(
+    page, text: str, stats: ExtractionStats | None = None,
+) -> list[list[list[str]]]:
+    """Run table detection on a page whose (collapsed) text is *text*.
 
     Uses pdfplumber's default (line-based) table detection first.  When that
     finds no tables on a page whose text hints at financial data, retries with
-    text-based table detection as a fallback.
+    text-based table detection as a fallback.  Decorative (graphics-heavy)
+    pages are skipped entirely; *stats* records skips and table timings.
     """
-    pages: list[PageData] = []
+    chars, graphics = _page_object_counts(page)
+    if is_decorative_page(chars, graphics, text):
+        if stats is not None:
+            stats.decorative_skipped += 1
+            stats.skipped_graphics += graphics
+        return []
+
+    start = time.perf_counter()
+    tables = _clean_cells(_clean_tables(page.extract_tables() or []))
+
+    # Fallback: if default strategy found nothing and the page looks
+    # like it contains financial data, retry with text-based strategy
+    if not tables and _FINANCIAL_HINT.search(text):
+        tables = _clean_cells(_clean_tables(page.extract_tables(_TEXT_TABLE_SETTINGS) or []))
+
+    if stats is not None:
+        stats.table_pages += 1
+        stats.table_seconds += time.perf_counter() - start
+        stats.table_graphics += graphics
+    return tables
+
+
+def _release_page(page) -> None:
+    """Drop pdfplumber's cached layout objects for a processed page.
+
+    pdfplumber keeps every parsed page's chars, rects and text map alive until
+    the PDF is closed; releasing them as we go keeps memory flat on long
+    combined reports.
+    """
+    page.close()
+
+
+def rss_mb() -> float:
+    """Resident set size of the current process in MiB (0.0 if unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    # No /proc (macOS): fall back to peak RSS, reported in bytes there
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 1024
+
+
+def _check_rss(max_rss_mb: float | None, path: Path, page_number: int) -> None:
+    """Raise RuntimeError if RSS exceeds *max_rss_mb* after *page_number*."""
+    if max_rss_mb is None:
+        return
+    rss = rss_mb()
+    if rss > max_rss_mb:
+        raise RuntimeError(
+            f"Memory limit exceeded: RSS {rss:.0f} MB > {max_rss_mb:.0f} MB "
+            f"after page {page_number} of {Path(path).name}"
+        )
+
+
+class _TableLoader:
+    """Run table detection for pages of a PDF on demand.
+
+    A single ``page.tables`` access reopens the PDF for that one page;
+    :func:`load_tables` batches many pending pages into one open.
+    """
+
+    def __init__(
+        self, path: Path, max_rss_mb: float | None = None, stats: ExtractionStats | None = None,
+    ) -> None:
+        self.path = path
+        self.max_rss_mb = max_rss_mb
+        self.stats = stats
+
+    def __call__(self, page: PageData) -> list[list[list[str]]]:
+        with pdfplumber.open(self.path) as pdf:
+            return _extract_page_tables(pdf.pages[page.page_number - 1], page.text, self.stats)
+
+    def load_many(self, pages: list[PageData]) -> None:
+        with pdfplumber.open(self.path) as pdf:
+            for page in pages:
+                pdf_page = pdf.pages[page.page_number - 1]
+                page.tables = _extract_page_tables(pdf_page, page.text, self.stats)
+                _release_page(pdf_page)
+                _check_rss(self.max_rss_mb, self.path, page.page_number)
+
+
+def load_tables(pages: Iterable[PageData]) -> None:
+    """Run pending table extraction for *pages* in as few PDF opens as possible.
+
+    Pages whose tables are already loaded are skipped, so this is safe to
+    call with overlapping page sets.
+    """
+    pending: dict[int, tuple[_TableLoader, list[PageData]]] = {}
+    for page in pages:
+        loader = page._table_loader
+        if page.tables_loaded or not isinstance(loader, _TableLoader):
+            continue
+        pending.setdefault(id(loader), (loader, []))[1].append(page)
+    for loader, batch in pending.values():
+        # Deduplicate while keeping page order for sequential access
+        unique = {p.page_number: p for p in batch}
+        loader.load_many([unique[n] for n in sorted(unique)])
+
+
+def _extract_page_range(
+    path: Path, start: int, stop: int, lazy_tables: bool, max_rss_mb: float | None = None,
+) -> tuple[list[tuple[str, list[list[list[str]]] | None]], ExtractionStats]:
+    """Extract (text, tables) for 0-indexed pages ``start``..``stop - 1``.
+
+    Runs in worker processes, so it opens the PDF itself and returns plain
+    data plus the shard's stats; tables are None when *lazy_tables* defers
+    them.  Each worker enforces *max_rss_mb* on its own process.
+    """
+    results: list[tuple[str, list[list[list[str]]] | None]] = []
+    stats = ExtractionStats()
+    with pdfplumber.open(path) as pdf:
+        for i in range(start, stop):
+            page = pdf.pages[i]
+            text = _extract_page_text(page)
+            tables = None if lazy_tables else _extract_page_tables(page, text, stats)
+            _release_page(page)
+            _check_rss(max_rss_mb, path, i + 1)
+            stats.pages += 1
+            results.append((text, tables))
+    return results, stats
+
+
+def _page_shards(page_count: int, workers: int) -> list[tuple[int, int]]:
+    """Split ``range(page_count)`` into contiguous shards, a few per worker.
+
+    More shards than workers keeps every process busy when some page ranges
+    (statement tables) are much slower than others (prose).
+    """
+    n_shards = min(page_count, workers * 4)
+    size, extra = divmod(page_count, n_shards)
+    shards: list[tuple[int, int]] = []
+    start = 0
+    for i in range(n_shards):
+        stop = start + size + (1 if i < extra else 0)
+        shards.append((start, stop))
+        start = stop
+    return shards
+
+
+def iter_pages(
+    path: Path,
+    lazy_tables: bool = False,
+    max_rss_mb: float | None = None,
+    stats: ExtractionStats | None = None,
+    eager_tables: Callable[[int], bool] | None = None,
+) -> Iterator[PageData]:
+    """Yield pages one at a time, in order, as they are extracted.
+
+    Lets callers run detection on early pages while later pages are still
+    being parsed.  *lazy_tables*, *max_rss_mb* and *stats* behave as in
+    :func:`extract_pdf`.
+
+    With *lazy_tables*, *eager_tables* is asked for each page number (after
+    the caller has consumed every earlier page) and pages it accepts get
+    their tables in this pass, so a caller can switch from a text-only
+    pre-scan to full extraction part-way through the document.
+    """
+    loader = _TableLoader(path, max_rss_mb, stats) if lazy_tables else None
     with pdfplumber.open(path) as pdf:
         for i, page in enumerate(pdf.pages):
-            text = page.extract_text() or ""
-            text = _collapse_repeated_chars(text)  # Fix character-tripled bold text
-            raw_tables = page.extract_tables() or []
-            tables = _clean_tables(raw_tables)
-            # Apply character collapse to table cells (bold rendering artifacts)
-            # then try de-interleaving rotated header text
-            tables = [
-                [[_try_deinterleave(_try_collapse_line(cell)) for cell in row] for row in table]
-                for table in tables
-            ]
-
-            # Fallback: if default strategy found nothing and the page looks
-            # like it contains financial data, retry with text-based strategy
-            if not tables and _FINANCIAL_HINT.search(text):
-                raw_tables = page.extract_tables(_TEXT_TABLE_SETTINGS) or []
-                tables = _clean_tables(raw_tables)
-                # Apply character collapse then de-interleave to table cells
-                tables = [
-                    [[_try_deinterleave(_try_collapse_line(cell)) for cell in row] for row in table]
-                    for table in tables
-                ]
-
-            pages.append(PageData(page_number=i + 1, text=text, tables=tables))
-    return pages
+            text = _extract_page_text(page)
+            if loader is None or (eager_tables is not None and eager_tables(i + 1)):
+                tables = _extract_page_tables(page, text, stats)
+            else:
+                tables = None
+            _release_page(page)
+            _check_rss(max_rss_mb, path, i + 1)
+            if stats is not None:
+                stats.pages += 1
+            yield PageData(page_number=i + 1, text=text, tables=tables, table_loader=loader)
+
+
+def extract_pdf(
+    path: Path,
+    lazy_tables: bool = False,
+    workers: int = 1,
+    max_rss_mb: float | None = None,
+    stats: ExtractionStats | None = None,
+) -> list[PageData]:
+    """Extract text and tables from every page of a PDF.
+
+    With *lazy_tables*, only the (fast) text pass runs here.  Table detection
+    is deferred until a page's ``tables`` is first read, or until
+    :func:`load_tables` is called for the pages that actually need tables —
+    typically the statement and prose ranges found by ``split_sections``.
+
+    With *workers* > 1 (0 means one per CPU), the page range is sharded across
+    worker processes that each open the PDF on their own.  Documents shorter
+    than ``PARALLEL_MIN_PAGES`` are always extracted serially.
+
+    Each page's pdfplumber layout cache is released as soon as its text and
+    tables are captured.  With *max_rss_mb*, a RuntimeError naming the page
+    is raised once the extracting process's resident memory exceeds that
+    many MiB.
+
+    Table detection is skipped on decorative pages (see
+    :func:`is_decorative_page`).  Pass an :class:`ExtractionStats` as *stats*
+    to collect page counts, skips and table timings, including tables loaded
+    lazily later.
+    """
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        return list(iter_pages(path, lazy_tables, max_rss_mb, stats))
+
+    with pdfplumber.open(path) as pdf:
+        page_count = len(pdf.pages)
+    if page_count < PARALLEL_MIN_PAGES:
+        return list(iter_pages(path, lazy_tables, max_rss_mb, stats))
+
+    shards = _page_shards(page_count, workers)
+    with ProcessPoolExecutor(max_workers=min(workers, len(shards))) as pool:
+        futures = [
+            pool.submit(_extract_page_range, path, start, stop, lazy_tables, max_rss_mb)
+            for start, stop in shards
+        ]
+        extracted = []
+        for future in futures:
+            shard, shard_stats = future.result()
+            extracted.extend(shard)
+            if stats is not None:
+                stats.merge(shard_stats)
+
+    loader = _TableLoader(path, max_rss_mb, stats) if lazy_tables else None
+    return [
+        PageData(page_number=i + 1, text=text, tables=tables, table_loader=loader)
+        for i, (text, tables) in enumerate(extracted)
+    ]
+
+
+def check_scanned(
+    sparse_count: int, page_count: int, threshold: float = 0.8, min_chars: int = 50,
+) -> None:
+    """Raise RuntimeError if *sparse_count* of *page_count* pages marks a scanned PDF.
+
+    For callers that count :func:`is_sparse_page` while streaming pages;
+    *min_chars* only feeds the error message.
+    """
+    if page_count and sparse_count / page_count > threshold:
+        raise RuntimeError(
+            f"PDF appears to be scanned ({sparse_count}/{page_count} pages have <{min_chars} chars). "
+            "OCR support is not implemented yet."
+        )
+
+
+def is_sparse_page(page: PageData, min_chars: int = 50) -> bool:
+    """True if the page has too little text to be a text-based PDF page."""
+    return len(page.text.strip()) < min_chars
+
+
+def _sample_indices(page_count: int, sample_size: int) -> list[int]:
+    """Evenly spaced 0-indexed pages covering the start, middle and end."""
+    if page_count <= sample_size:
+        return list(range(page_count))
+    step = (page_count - 1) / (sample_size - 1)
+    return sorted({round(i * step) for i in range(sample_size)})
+
+
+def preflight_scanned(path: Path, sample_size: int = 12, min_chars: int = 50) -> None:
+    """Raise RuntimeError early if a stratified page sample is entirely sparse.
+
+    Extracts the text of only *sample_size* evenly spaced pages, so an
+    image-only document is rejected before the expensive extraction pass.
+    Only an unambiguous sample — every sampled page sparse — is rejected;
+    a partly sparse sample is left to the full-document check, which sees
+    every page.
+    """
+    with pdfplumber.open(path) as pdf:
+        sparse_count = sample_count = 0
+        for i in _sample_indices(len(pdf.pages), sample_size):
+            page = pdf.pages[i]
+            sample = PageData(page_number=i + 1, text=_extract_page_text(page))
+            _release_page(page)
+            sample_count += 1
+            sparse_count += is_sparse_page(sample, min_chars)
+    if sample_count and sparse_count == sample_count:
+        check_scanned(sparse_count, sample_count, min_chars=min_chars)
 
 
 def detect_scanned(pages: list[PageData], threshold: float = 0.8, min_chars: int = 50) -> None:
@@ -258,9 +662,5 @@ def detect_scanned(pages: list[PageData], threshold: float = 0.8, min_chars: int
     """
     if not pages:
         return
-    sparse_count = sum(1 for p in pages if len(p.text.strip()) < min_chars)
-    if sparse_count / len(pages) > threshold:
-        raise RuntimeError(
-            f"PDF appears to be scanned ({sparse_count}/{len(pages)} pages have <{min_chars} chars). "
-            "OCR support is not implemented yet."
-        )
+    sparse_count = sum(1 for p in pages if is_sparse_page(p, min_chars))
+    check_scanned(sparse_count, len(pages), threshold, min_chars)
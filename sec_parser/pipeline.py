@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import os
 import re
 import sys
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Callable
 
-from .detect import detect_10k_start_page, detect_report_type
+from .detect import ReportTypeDetector, TenKStartDetector
 from .edgar_client import (
     EdgarFetchError,
     clear_cache as clear_edgar_cache,
@@ -18,7 +23,7 @@ from .edgar_client import (
     load_xbrl_taxonomy_map,
     render_xbrl_statement,
 )
-from .gemini_client import extract_notes
+from .gemini_client import CallScope, CallStats, call_scope, call_stats, current_scope, extract_notes
 from .ifrs_section_split import (
     IFRS_BALANCE_SHEET,
     IFRS_CASH_FLOW,
@@ -34,8 +39,9 @@ from .confidence import (
     cross_validate,
     render_confidence_markdown,
 )
+from .label_memo import LabelMemo, label_key
 from .metadata import extract_metadata
-from .normalize import load_taxonomy
+from .normalize import collect_unmapped, llm_normalize_labels, load_taxonomy
 from .programmatic import (
     _extract_column_headers,
     _parse_text_as_table,
@@ -51,9 +57,24 @@ from .markdown_writer import (
     IFRS_REQUIRED_SECTIONS,
     IFRS_SECTION_ORDER,
     assemble_markdown,
+    fill_canonical_column,
     write_markdown,
 )
-from .pdf_extract import detect_scanned, extract_pdf
+from .extract_cache import (
+    cache_key as extract_cache_key,
+    load_pages as load_cached_pages,
+    store_pages as store_cached_pages,
+)
+from .page_index import PageIndex
+from .pdf_extract import (
+    ExtractionStats,
+    check_scanned,
+    extract_pdf,
+    is_sparse_page,
+    iter_pages,
+    load_tables,
+    preflight_scanned,
+)
 from .section_split import (
     BALANCE_SHEET,
     CASH_FLOW,
@@ -70,6 +91,7 @@ from .section_split import (
     SECTION_TITLES,
     SIGNATURES,
     STOCKHOLDERS_EQUITY,
+    SectionStartScanner,
     split_sections,
 )
 
@@ -81,6 +103,8 @@ class ProcessingResult:
     metadata: dict = field(default_factory=dict)
     data_sources: dict[str, str] = field(default_factory=dict)  # section -> "xbrl"|"pdf"
     confidences: list = field(default_factory=list)  # list[ExtractionConfidence]
+    unmapped: list[str] = field(default_factory=list)  # line-item labels left for the LLM tier
+    gemini: CallStats = field(default_factory=CallStats)  # Gemini calls made for this PDF
 
 
 IFRS_FINANCIAL_STATEMENTS = [
@@ -111,16 +135,284 @@ XBRL_STATEMENT_MAP = {
 }
 
 
+@dataclass
+class _ScannedDocument:
+    """Pages plus the detection results gathered while they were extracted."""
+    pages: list
+    page_count: int
+    report_type: str
+    tenk_start: int = 1
+    pre_10k_text: str = ""
+    # None when starts must be recomputed on the trimmed pages
+    section_starts: list[tuple[str, int]] | None = None
+    stats: ExtractionStats = field(default_factory=ExtractionStats)
+    # Page classifications memoized during detection, reused by the splitters
+    index: PageIndex = field(default_factory=PageIndex)
+
+
+def _pre_10k_text(pages: list, tenk_start: int) -> str:
+    """First ~5000 chars of the pages before *tenk_start*, for metadata fallback."""
+    pre_parts = []
+    for p in pages:
+        if p.page_number >= tenk_start:
+            break
+        pre_parts.append(p.text)
+        if sum(len(t) for t in pre_parts) > 5000:
+            break
+    return "\n".join(pre_parts)[:5000]
+
+
+def _prescan_done(report: ReportTypeDetector, tenk: TenKStartDetector) -> bool:
+    """True once the pages still to be extracted will be kept and need tables."""
+    if report.done and report.result() == "ifrs":
+        return True
+    return tenk.started
+
+
+def _scan_document(
+    pdf_path: Path,
+    verbose: bool,
+    lazy_tables: bool,
+    page_workers: int,
+    use_extract_cache: bool,
+    max_rss_mb: float | None = None,
+) -> _ScannedDocument:
+    """Extract pages while running report-type, 10-K start and section detection.
+
+    Pages are consumed as they are produced (from the extraction cache, the
+    worker pool, or the streaming ``iter_pages`` generator), so detection is
+    finished when extraction is.  Once an SEC cover page settles the 10-K
+    start, earlier pages of a combined document are released immediately,
+    keeping only the small metadata window — unless the complete document
+    is needed for the extraction cache.
+
+    Eager serial extraction pre-scans text only until a 10-K start (cover
+    page or Form 10-K footer) or an IFRS report is recognised, and extracts
+    tables in the same pass from there on; pages kept after detection that
+    were pre-scanned get their tables before returning.  The pre-10-K pages
+    of a combined document never go through table detection.
+    """
+    # Hash the PDF once; the key serves both the lookup and the store
+    key = extract_cache_key(pdf_path) if use_extract_cache else None
+    source = load_cached_pages(pdf_path, key) if use_extract_cache else None
+    fresh = source is None
+    stats = ExtractionStats()
+    index = PageIndex()
+    report = ReportTypeDetector(index=index)
+    tenk = TenKStartDetector(index)
+    scanner = SectionStartScanner(index)
+    prescan = fresh and page_workers == 1 and not lazy_tables
+    if fresh:
+        # Reject image-only PDFs from a page sample before extracting anything
+        preflight_scanned(pdf_path)
+    if fresh and page_workers != 1:
+        source = extract_pdf(
+            pdf_path, lazy_tables=lazy_tables, workers=page_workers, max_rss_mb=max_rss_mb,
+            stats=stats,
+        )
+    elif fresh:
+        source = iter_pages(
+            pdf_path, lazy_tables=lazy_tables or prescan, max_rss_mb=max_rss_mb, stats=stats,
+            eager_tables=(lambda n: _prescan_done(report, tenk)) if prescan else None,
+        )
+    elif verbose:
+        print("  Using cached page extraction", file=sys.stderr)
+    # Lazy extraction is never cached, so only eager fresh runs keep every page
+    store = fresh and use_extract_cache and not lazy_tables
+    pages: list = []
+    page_count = sparse_count = 0
+    pre_10k_text = ""
+    released = False
+
+    for page in source:
+        pages.append(page)
+        page_count += 1
+        sparse_count += is_sparse_page(page)
+        report.feed(page)
+        if tenk.cover_page is None:
+            tenk.feed(page)
+            if tenk.cover_page == page.page_number:
+                # Sections of a combined document are searched from the 10-K start
+                scanner = SectionStartScanner(index)
+        scanner.feed(page)
+
+        if (
+            not store
+            and not released
+            and tenk.cover_page is not None
+            and report.done
+            and report.result() == "sec"
+        ):
+            released = True
+            if tenk.cover_page > 1:
+                pre_10k_text = _pre_10k_text(pages, tenk.cover_page)
+                pages = [p for p in pages if p.page_number >= tenk.cover_page]
+                index.retain_from(tenk.cover_page)
+
+    check_scanned(sparse_count, page_count)
+    keep_from = tenk.result() if report.result() == "sec" else 1
+    if prescan:
+        load_tables(p for p in pages if p.page_number >= keep_from)
+    if store:
+        store_cached_pages(pdf_path, pages, text_only_before=keep_from, key=key)
+
+    doc = _ScannedDocument(
+        pages=pages, page_count=page_count, report_type=report.result(), stats=stats,
+        index=index,
+    )
+    if doc.report_type == "ifrs":
+        return doc
+
+    doc.tenk_start = tenk.result()
+    if doc.tenk_start > 1 and not released:
+        doc.pre_10k_text = _pre_10k_text(pages, doc.tenk_start)
+        doc.pages = [p for p in pages if p.page_number >= doc.tenk_start]
+        index.retain_from(doc.tenk_start)
+    else:
+        doc.pre_10k_text = pre_10k_text
+    # The scanner restarted at the cover page; a footer-detected start needs a rescan
+    if tenk.cover_page is not None or doc.tenk_start == 1:
+        doc.section_starts = scanner.starts
+    return doc
+
+
+def open_label_memo() -> LabelMemo:
+    """Label memo for the shipped taxonomy's current version."""
+    from .taxonomy_cache import compiled_taxonomy
+
+    return LabelMemo(compiled_taxonomy().source_hash)
+
+
+def resolve_unmapped_labels(
+    results: list[ProcessingResult],
+    memo: LabelMemo | None = None,
+    verbose: bool = False,
+) -> int:
+    """Batch-level LLM normalization tier for a whole run.
+
+    Unmapped labels from every filing are deduplicated and resolved in a few
+    large LLM calls; the answers are added to each filing's mappings and
+    filled into the Canonical column of its written markdown.  Returns the
+    number of distinct labels resolved.
+    """
+    labels = [label for result in results for label in result.unmapped]
+    if not labels:
+        return 0
+    if verbose:
+        print(
+            f"LLM normalization: {len(set(labels))} unmapped label(s) across {len(results)} filing(s)",
+            file=sys.stderr,
+        )
+    resolved = llm_normalize_labels(labels, load_taxonomy(), memo=memo, verbose=verbose)
+    if memo is not None:
+        memo.flush()
+    if not resolved:
+        return 0
+
+    for result in results:
+        hits = {
+            label: resolved[label_key(label)] for label in result.unmapped if label_key(label) in resolved
+        }
+        if not hits:
+            continue
+        result.mappings.update(hits)
+        result.unmapped = [label for label in result.unmapped if label not in hits]
+        content = result.output_path.read_text(encoding="utf-8")
+        write_markdown(result.output_path, fill_canonical_column(content, resolved))
+    return len(resolved)
+
+
+def _load_section_tables(sections: dict, keys: list[str]) -> None:
+    """Run deferred table extraction for the pages of the given sections only."""
+    load_tables(page for key in keys if key in sections for page in sections[key].pages)
+
+
+def _report_table_skips(stats: ExtractionStats | None) -> None:
+    """Print decorative-page table skips (verbose mode)."""
+    if stats is None or not stats.decorative_skipped:
+        return
+    print(
+        f"  Skipped table detection on {stats.decorative_skipped} graphics-heavy page(s) "
+        f"(~{stats.estimated_seconds_saved:.1f}s saved)",
+        file=sys.stderr,
+    )
+
+
+# Seconds from the start of Notes extraction until assembly falls back to
+# programmatic Notes (SEC_PARSER_NOTES_TIMEOUT overrides; 0 = wait indefinitely)
+DEFAULT_NOTES_TIMEOUT = 600.0
+
+
+class _NotesJob:
+    """LLM Notes extraction running in a background thread.
+
+    Started as soon as sections are split, so the programmatic stages run
+    while the Gemini requests are in flight; :meth:`result` joins it at
+    assembly.  On failure or timeout the *fallback* rendering is used.  The
+    job's Gemini calls run in their own :class:`CallScope` with the timeout
+    as its deadline, so a timed-out job stops calling the API and its
+    daemon thread never holds up interpreter exit.
+    """
+
+    def __init__(
+        self, text: str, fallback: Callable[[], str], verbose: bool, cik: str | None = None,
+    ) -> None:
+        self._fallback = fallback
+        timeout = float(os.environ.get("SEC_PARSER_NOTES_TIMEOUT", DEFAULT_NOTES_TIMEOUT))
+        deadline = time.monotonic() + timeout if timeout > 0 else None
+        self._scope = CallScope(current_scope(), deadline)
+        self._future: Future[str] = Future()
+        threading.Thread(
+            target=self._run, args=(text, verbose, cik), name="notes", daemon=True,
+        ).start()
+
+    def _run(self, text: str, verbose: bool, cik: str | None) -> None:
+        self._future.set_running_or_notify_cancel()
+        with call_scope(self._scope):
+            try:
+                self._future.set_result(extract_notes(text, verbose=verbose, cik=cik))
+            except BaseException as exc:
+                self._future.set_exception(exc)
+
+    def result(self) -> str:
+        remaining = self._scope.remaining()
+        try:
+            return self._future.result(timeout=None if remaining is None else max(0.0, remaining))
+        except FuturesTimeoutError:
+            self._scope.cancel()
+            print("  WARNING: Notes extraction timed out, using raw text", file=sys.stderr)
+        except Exception as exc:
+            print(
+                f"  WARNING: Notes extraction failed ({exc}), using raw text",
+                file=sys.stderr,
+            )
+        return self._fallback()
+
+
 def _process_ifrs(
     pages: list,
     pdf_path: Path,
     output_dir: Path,
     verbose: bool,
+    stats: ExtractionStats | None = None,
+    index: PageIndex | None = None,
 ) -> ProcessingResult:
     """Process an IFRS report PDF into markdown."""
-    sections = split_ifrs_sections(pages)
+    sections = split_ifrs_sections(pages, index)
+
+    # Notes — LLM in the background while the statements are rendered
+    notes_job = None
+    if IFRS_NOTES in sections:
+        if verbose:
+            print(f"  Processing {IFRS_SECTION_TITLES[IFRS_NOTES]}...", file=sys.stderr)
+        notes_text = sections[IFRS_NOTES].text
+        notes_job = _NotesJob(notes_text, lambda: notes_text, verbose)
+
+    # Only the statements render tables — load them in a single batch
+    _load_section_tables(sections, IFRS_FINANCIAL_STATEMENTS)
 
     if verbose:
+        _report_table_skips(stats)
         found = [IFRS_SECTION_TITLES.get(k, k) for k in sections]
         print(f"  Sections found: {', '.join(found)}", file=sys.stderr)
 
@@ -142,20 +434,9 @@ def _process_ifrs(
                 print(f"  Processing {IFRS_SECTION_TITLES[key]}...", file=sys.stderr)
             processed[key] = tables_to_markdown(section.text, section.tables)
 
-    # Notes — LLM if available, raw text fallback
-    if IFRS_NOTES in sections:
-        if verbose:
-            print(f"  Processing {IFRS_SECTION_TITLES[IFRS_NOTES]}...", file=sys.stderr)
-        try:
-            processed[IFRS_NOTES] = extract_notes(
-                sections[IFRS_NOTES].text, verbose=verbose
-            )
-        except Exception as exc:
-            print(
-                f"  WARNING: Notes extraction failed ({exc}), using raw text",
-                file=sys.stderr,
-            )
-            processed[IFRS_NOTES] = sections[IFRS_NOTES].text
+    # Notes — LLM result if it succeeded in time, raw text otherwise
+    if notes_job is not None:
+        processed[IFRS_NOTES] = notes_job.result()
 
     # Assemble with IFRS ordering
     md_content = assemble_markdown(
@@ -179,6 +460,12 @@ def process_pdf(
     output_dir: Path,
     verbose: bool = False,
     use_xbrl: bool = True,
+    lazy_tables: bool = False,
+    page_workers: int = 1,
+    use_extract_cache: bool = True,
+    max_rss_mb: float | None = None,
+    use_label_memo: bool = True,
+    use_note_store: bool = True,
 ) -> ProcessingResult:
     """Process a financial report PDF into a structured markdown file.
 
@@ -188,62 +475,82 @@ def process_pdf(
 
     When use_xbrl=True (default), attempts to fetch XBRL data from SEC EDGAR
     for financial statements. Falls back to PDF extraction on failure.
+
+    When lazy_tables=True, extraction is two-pass: a text-only pass drives
+    report-type, 10-K start and section detection, then table detection runs
+    only on pages of sections whose tables are rendered.
+
+    page_workers > 1 shards page extraction across that many processes
+    (0 = one per CPU); short documents are still extracted serially.
+
+    When use_extract_cache=True (default), previously extracted pages are
+    loaded from the content-addressed cache and pdfplumber is skipped.
+
+    max_rss_mb aborts extraction with a RuntimeError naming the page at which
+    the process's resident memory first exceeded that many MiB.
+
+    When use_label_memo=True (default), line-item normalization results are
+    read from and recorded in the persistent label memo.
+
+    When use_note_store=True (default), notes unchanged since an earlier
+    filing with the same CIK reuse that filing's extracted output.
+
+    The result's ``gemini`` field counts the Gemini requests, cache hits and
+    throttling retries made while processing this PDF.
     """
+    with call_scope() as calls:
+        result = _process_pdf(
+            pdf_path, output_dir, verbose, use_xbrl, lazy_tables, page_workers,
+            use_extract_cache, max_rss_mb, use_label_memo, use_note_store,
+        )
+    result.gemini = call_stats(calls)
+    return result
+
+
+def _process_pdf(
+    pdf_path: Path,
+    output_dir: Path,
+    verbose: bool,
+    use_xbrl: bool,
+    lazy_tables: bool,
+    page_workers: int,
+    use_extract_cache: bool,
+    max_rss_mb: float | None,
+    use_label_memo: bool,
+    use_note_store: bool,
+) -> ProcessingResult:
     if verbose:
         print(f"Extracting text from {pdf_path.name}...", file=sys.stderr)
 
-    pages = extract_pdf(pdf_path)
-    detect_scanned(pages)
+    doc = _scan_document(
+        pdf_path, verbose, lazy_tables, page_workers, use_extract_cache, max_rss_mb,
+    )
 
     if verbose:
-        print(f"  {len(pages)} pages extracted", file=sys.stderr)
+        print(f"  {doc.page_count} pages extracted", file=sys.stderr)
 
-    report_type = detect_report_type(pages)
+    report_type = doc.report_type
     if verbose:
         print(f"  Detected report type: {report_type.upper()}", file=sys.stderr)
 
     if report_type == "ifrs":
-        return _process_ifrs(pages, pdf_path, output_dir, verbose)
+        return _process_ifrs(doc.pages, pdf_path, output_dir, verbose, doc.stats, doc.index)
 
     # === SEC pipeline ===
 
-    # Detect combined document (annual report + 10-K)
-    tenk_start = detect_10k_start_page(pages)
-    pre_10k_text = ""
-    if tenk_start > 1:
-        if verbose:
-            print(f"  Combined document detected: 10-K starts at page {tenk_start}", file=sys.stderr)
-        # Save first ~5000 chars of pre-10K pages for metadata fallback
-        pre_parts = []
-        for p in pages:
-            if p.page_number >= tenk_start:
-                break
-            pre_parts.append(p.text)
-            if sum(len(t) for t in pre_parts) > 5000:
-                break
-        pre_10k_text = "\n".join(pre_parts)[:5000]
-        pages = [p for p in pages if p.page_number >= tenk_start]
-
-    sections = split_sections(pages)
-
-    if verbose:
-        found = [SECTION_TITLES.get(k, k) for k in sections]
-        print(f"  Sections found: {', '.join(found)}", file=sys.stderr)
-
-    # Warn about missing required sections
-    required = [INCOME_STATEMENT, BALANCE_SHEET, CASH_FLOW, NOTES]
-    for key in required:
-        if key not in sections:
-            print(
-                f"  WARNING: {SECTION_TITLES.get(key, key)} not found in {pdf_path.name}",
-                file=sys.stderr,
-            )
-
+    # Combined document (annual report + 10-K): pre-10K pages were dropped,
+    # keeping ~5000 chars for metadata fallback
+    tenk_start = doc.tenk_start
+    pre_10k_text = doc.pre_10k_text
+    if tenk_start > 1 and verbose:
+        print(f"  Combined document detected: 10-K starts at page {tenk_start}", file=sys.stderr)
+
+    sections = split_sections(doc.pages, starts=doc.section_starts, index=doc.index)
+    # From here on each section holds its own pages; a page is released once
+    # every section spanning it has been rendered
+    doc.pages = []
     processed: dict[str, str] = {}
 
-    # Load taxonomy for line-item normalization
-    taxonomy = load_taxonomy()
-
     # Cover page — programmatic regex extraction (extract early for XBRL matching)
     cover_fields: list[tuple[str, str]] = []
     if COVER_PAGE in sections:
@@ -262,6 +569,42 @@ def process_pdf(
                     cover_fields.append((label, value))
                     field_labels.add(label)
 
+    # Notes — the only remaining API call, run in the background while the
+    # programmatic stages below proceed; with the CIK known, notes unchanged
+    # since an earlier filing of the company are reused
+    notes_job = None
+    if NOTES in sections:
+        if verbose:
+            print(f"  Processing {SECTION_TITLES[NOTES]}...", file=sys.stderr)
+        notes = sections[NOTES]
+        notes_cik = dict(cover_fields).get("CIK") if use_note_store else None
+        notes_job = _NotesJob(
+            notes.text, lambda: process_notes_fallback(notes.text), verbose,
+            cik=notes_cik,
+        )
+
+    # Statements and prose sections render tables; cover, notes and
+    # passthrough sections only use text
+    _load_section_tables(sections, FINANCIAL_STATEMENTS + PROSE_SECTIONS)
+
+    if verbose:
+        _report_table_skips(doc.stats)
+        found = [SECTION_TITLES.get(k, k) for k in sections]
+        print(f"  Sections found: {', '.join(found)}", file=sys.stderr)
+
+    # Warn about missing required sections
+    required = [INCOME_STATEMENT, BALANCE_SHEET, CASH_FLOW, NOTES]
+    for key in required:
+        if key not in sections:
+            print(
+                f"  WARNING: {SECTION_TITLES.get(key, key)} not found in {pdf_path.name}",
+                file=sys.stderr,
+            )
+
+    # Load taxonomy for line-item normalization
+    taxonomy = load_taxonomy()
+    label_memo = open_label_memo() if use_label_memo else None
+
     # --- XBRL fetch (if enabled and CIK available) ---
     xbrl_facts_by_section: dict[str, object] = {}  # section_key -> XBRLStatementData
     data_sources: dict[str, str] = {}
@@ -331,7 +674,7 @@ def process_pdf(
                 rows_out: list[list[str]] = []
                 tables_to_markdown(
                     sections[key].text, sections[key].tables,
-                    taxonomy=taxonomy, normalized_data_out=rows_out,
+                    taxonomy=taxonomy, normalized_data_out=rows_out, label_memo=label_memo,
                 )
                 normalized_rows[key] = rows_out
         elif key in sections:
@@ -341,7 +684,7 @@ def process_pdf(
             rows_out = []
             result = tables_to_markdown(
                 section.text, section.tables,
-                taxonomy=taxonomy, normalized_data_out=rows_out,
+                taxonomy=taxonomy, normalized_data_out=rows_out, label_memo=label_memo,
             )
             # If tables_to_markdown returned plain text (no markdown table),
             # try parsing the text itself as a table (for PDFs like XOM where
@@ -358,23 +701,10 @@ def process_pdf(
                 normalized_rows[key] = rows_out
             data_sources[XBRL_STATEMENT_MAP.get(key, key)] = "pdf"
 
-    # Notes — keep LLM (only remaining API call)
-    if NOTES in sections:
-        if verbose:
-            print(f"  Processing {SECTION_TITLES[NOTES]}...", file=sys.stderr)
-        try:
-            processed[NOTES] = extract_notes(sections[NOTES].text, verbose=verbose)
-        except Exception as exc:
-            print(
-                f"  WARNING: Notes extraction failed ({exc}), using raw text",
-                file=sys.stderr,
-            )
-            processed[NOTES] = process_notes_fallback(sections[NOTES].text, sections[NOTES].tables)
-
     # Prose sections — programmatic cleanup (no LLM)
     for key in PROSE_SECTIONS:
         if key in sections:
-            section = sections[key]
+            section = sections.pop(key)
             if verbose:
                 print(f"  Processing {SECTION_TITLES[key]}...", file=sys.stderr)
             processed[key] = clean_prose(section.text, section.tables)
@@ -382,10 +712,11 @@ def process_pdf(
     # Passthrough sections (light cleanup, no LLM)
     for key in PASSTHROUGH_SECTIONS:
         if key in sections:
+            section = sections.pop(key)
             if key == EXHIBITS:
-                processed[key] = format_exhibits(sections[key].text)
+                processed[key] = format_exhibits(section.text)
             else:
-                processed[key] = clean_prose(sections[key].text)
+                processed[key] = clean_prose(section.text)
 
     # Search for scale hint in financial statement text
     scale_hint: str | None = None
@@ -422,6 +753,8 @@ def process_pdf(
                 break
 
     cover_text = sections[COVER_PAGE].text if COVER_PAGE in sections else ""
+    # Every remaining section has been rendered
+    sections.clear()
     metadata = extract_metadata(
         cover_fields=cover_fields,
         scale_hint=scale_hint,
@@ -512,6 +845,21 @@ def process_pdf(
                 if label and canonical:
                     mappings[label] = canonical
 
+    # Labels no tier matched, for the batch-level LLM pass (value rows only)
+    unmapped: list[str] = []
+    for rows in normalized_rows.values():
+        value_rows = [r for r in rows if any(c.strip() for c in r[2:])]
+        for label in collect_unmapped(value_rows, taxonomy):
+            if not label.strip().endswith(":"):
+                unmapped.append(label.strip())
+
+    if label_memo is not None:
+        label_memo.flush()
+
+    # Join the background Notes extraction
+    if notes_job is not None:
+        processed[NOTES] = notes_job.result()
+
     # Assemble and write output
     md_content = assemble_markdown(
         pdf_path.name, processed, metadata=metadata,
@@ -530,4 +878,5 @@ def process_pdf(
         metadata=metadata,
         data_sources=data_sources,
         confidences=confidences,
+        unmapped=list(dict.fromkeys(unmapped)),
     )
@@ -1200,6 +1200,7 @@ def tables_to_markdown(
     tables: list[list[list[str]]],
     taxonomy: dict | None = None,
     normalized_data_out: list | None = None,
+    label_memo=None,
 ) -> str:
     """Convert pdfplumber tables into clean markdown.
 
@@ -1209,6 +1210,7 @@ def tables_to_markdown(
     - Renders aligned markdown tables with proper headers
     - When taxonomy is provided, normalizes line items and adds a Canonical column
     - When normalized_data_out is provided (a list), appends normalized rows to it
+    - label_memo (a ``LabelMemo``) is passed on to line-item normalization
     """
     if not tables:
         return _clean_raw_text(section_text)
@@ -1445,7 +1447,7 @@ def tables_to_markdown(
         if taxonomy is not None:
             from .normalize import normalize_table_rows
 
-            all_data_rows = normalize_table_rows(all_data_rows, taxonomy)
+            all_data_rows = normalize_table_rows(all_data_rows, taxonomy, memo=label_memo)
             if normalized_data_out is not None:
                 normalized_data_out.extend(all_data_rows)
             col_count += 1
@@ -1466,7 +1468,7 @@ def tables_to_markdown(
 
 def process_notes_fallback(
     section_text: str,
-    tables: list[list[list[str]]],
+    tables: list[list[list[str]]] | None = None,
 ) -> str:
     """Process Notes section without LLM — clean prose only.
 
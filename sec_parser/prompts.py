@@ -1,5 +1,8 @@
 """Prompt templates for Gemini API calls."""
 
+# Bump whenever a template changes in a way that should invalidate cached responses
+PROMPT_VERSION = 1
+
 _ANTI_HALLUCINATION_BLOCK = """\
 CRITICAL CONSTRAINT — NEVER FABRICATE DATA:
 - Only output numbers, labels, and dates that appear verbatim in the source text below.
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass, field
+from bisect import bisect_left, bisect_right
 
+from .page_index import PageIndex
 from .pdf_extract import PageData
 
 # Keys used throughout the pipeline
@@ -143,13 +144,124 @@ SECTION_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
 ]
 
 
-@dataclass
+# Every section pattern can only start at one of these words (matched
+# case-insensitively), so candidate heading positions are found with plain
+# substring search on the lowercased page and each pattern is then tried
+# only at its own anchors.
+_STATEMENT_KEYS = [INCOME_STATEMENT, COMPREHENSIVE_INCOME, BALANCE_SHEET, CASH_FLOW, STOCKHOLDERS_EQUITY]
+_SECTION_ANCHORS: dict[str, list[str]] = {
+    "condensed": _STATEMENT_KEYS,
+    "consolidated": _STATEMENT_KEYS,
+    "notes": [NOTES],
+    "item": [MDA, CONTROLS, LEGAL_PROCEEDINGS, RISK_FACTORS, EXHIBITS],
+    "management": [MDA],
+    "quantitative": [MARKET_RISK],
+    "controls": [CONTROLS],
+    "signature": [SIGNATURES],
+}
+_SECTION_PATTERN_BY_KEY = dict(SECTION_PATTERNS)
+
+# Characters IGNORECASE matches to an ASCII letter that str.lower() does not
+# map to one (or maps to two characters); pages containing them are scanned
+# pattern by pattern instead
+_CASEFOLD_ODDITIES = re.compile("[\u0130\u0131\u017f\u212a]")
+
+
+def _section_matches(text: str) -> dict[str, list[re.Match[str]]]:
+    """Matches of each section pattern in *text*, keyed by section key.
+
+    Each list equals ``list(pattern.finditer(text))`` for that key; keys
+    without a match are omitted.  One pass over the lowercased page collects
+    anchor-word positions, and each pattern is matched only at its anchors,
+    skipping positions inside its own previous match as ``finditer`` does.
+    """
+    if _CASEFOLD_ODDITIES.search(text):
+        return {key: ms for key, pat in SECTION_PATTERNS if (ms := list(pat.finditer(text)))}
+
+    lower = text.lower()
+    candidates: list[tuple[int, list[str]]] = []
+    for word, keys in _SECTION_ANCHORS.items():
+        i = lower.find(word)
+        while i != -1:
+            candidates.append((i, keys))
+            i = lower.find(word, i + 1)
+    candidates.sort(key=lambda c: c[0])
+
+    found: dict[str, list[re.Match[str]]] = {}
+    resume: dict[str, int] = {}
+    for start, keys in candidates:
+        for key in keys:
+            if resume.get(key, 0) > start:
+                continue
+            m = _SECTION_PATTERN_BY_KEY[key].match(text, start)
+            if m:
+                found.setdefault(key, []).append(m)
+                resume[key] = m.end()
+    return found
+
+
 class SectionData:
-    name: str
-    start_page: int  # 1-indexed inclusive
-    end_page: int  # 1-indexed inclusive
-    text: str = ""
-    tables: list[list[list[str]]] = field(default_factory=list)
+    """A filing section spanning pages ``start_page``..``end_page`` (1-indexed, inclusive).
+
+    When built from *pages*, ``tables`` is gathered from those pages on first
+    access, so sections whose tables are never read do not force table
+    extraction on lazily extracted pages.  The gathered list holds the
+    pages' own table objects, not copies.
+
+    With *spans* — one ``(start, end)`` offset pair into each page's text —
+    the section stores no text until ``text`` is first read, which joins
+    the page slices once and keeps the result; sections that are never
+    read never duplicate the document.
+    """
+
+    __slots__ = ("name", "start_page", "end_page", "pages", "spans", "_text", "_tables")
+
+    def __init__(
+        self,
+        name: str,
+        start_page: int,
+        end_page: int,
+        text: str = "",
+        tables: list[list[list[str]]] | None = None,
+        pages: list[PageData] | None = None,
+        spans: list[tuple[int, int]] | None = None,
+    ) -> None:
+        self.name = name
+        self.start_page = start_page
+        self.end_page = end_page
+        self.pages = pages if pages is not None else []
+        self.spans = spans
+        self._text = text if spans is None else None
+        self._tables = tables if tables is not None or pages is not None else []
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = "\n\n".join(
+                page.text[start:end] for page, (start, end) in zip(self.pages, self.spans)
+            )
+        return self._text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self._text = value
+        self.spans = None
+
+    @property
+    def tables(self) -> list[list[list[str]]]:
+        if self._tables is None:
+            self._tables = [table for page in self.pages for table in page.tables]
+        return self._tables
+
+    @tables.setter
+    def tables(self, value: list[list[list[str]]]) -> None:
+        self._tables = value
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(name={self.name!r}, start_page={self.start_page!r}, "
+            f"end_page={self.end_page!r}, text={self.text!r})"
+        )
 
 
 _TOC_PATTERN = re.compile(
@@ -160,7 +272,9 @@ _TOC_PATTERN = re.compile(
 _TOC_LINE_NUMBER = re.compile(r"\s+\d{1,3}\s*$")
 
 
-def _is_heading_match(page_text: str, match: re.Match[str]) -> bool:
+def _is_heading_match(
+    page_text: str, match: re.Match[str], line_bounds: tuple[int, int] | None = None,
+) -> bool:
     """Check that a regex match falls on a standalone heading line.
 
     A valid heading line must be:
@@ -168,13 +282,19 @@ def _is_heading_match(page_text: str, match: re.Match[str]) -> bool:
     - The match starts within the first 10 characters of the line
     - The line does NOT end with a bare page number (TOC entry heuristic)
     - After the match, the remaining text on the line is short (not prose)
+
+    *line_bounds* may carry the (start, end) of the match's line, as looked
+    up in a :class:`PageIndex`.
     """
     # Find the line containing the match
-    line_start = page_text.rfind("\n", 0, match.start())
-    line_start = 0 if line_start == -1 else line_start + 1
-    line_end = page_text.find("\n", match.end())
-    if line_end == -1:
-        line_end = len(page_text)
+    if line_bounds is not None:
+        line_start, line_end = line_bounds
+    else:
+        line_start = page_text.rfind("\n", 0, match.start())
+        line_start = 0 if line_start == -1 else line_start + 1
+        line_end = page_text.find("\n", match.end())
+        if line_end == -1:
+            line_end = len(page_text)
     line = page_text[line_start:line_end]
 
     if len(line) > 120:
@@ -242,8 +362,14 @@ def _has_toc_entries(text: str) -> bool:
     return leading_count >= 5
 
 
-def _is_toc_page(page: PageData) -> bool:
-    """Detect Table of Contents pages — these list section names with page numbers."""
+def _is_toc_page(
+    page: PageData, matches: dict[str, list[re.Match[str]]] | None = None,
+) -> bool:
+    """Detect Table of Contents pages — these list section names with page numbers.
+
+    *matches* may carry the page's :func:`_section_matches` when the caller
+    already scanned it.
+    """
     text = page.text
     has_toc_heading = bool(_TOC_PATTERN.search(text))
 
@@ -295,30 +421,77 @@ def _is_toc_page(page: PageData) -> bool:
         return True
 
     # Heuristic: if 4+ section patterns match on a single page, it's likely a TOC
-    matches = sum(1 for _, pat in SECTION_PATTERNS if pat.search(text))
-    return matches >= 4
+    if matches is None:
+        matches = _section_matches(text)
+    return len(matches) >= 4
 
 
-def _find_section_starts(pages: list[PageData]) -> list[tuple[str, int]]:
-    """Return (section_key, page_number) for the first match of each pattern."""
-    found: list[tuple[str, int]] = []
-    seen_keys: set[str] = set()
+class SectionStartScanner:
+    """Incremental :func:`_find_section_starts` over pages fed in order.
 
-    for page in pages:
-        if _is_toc_page(page):
-            continue
-        for key, pattern in SECTION_PATTERNS:
-            if key in seen_keys:
+    Lets section-start detection run while later pages are still being
+    extracted; ``starts`` is valid for the pages fed so far.  With *index*,
+    page scans and line lookups are memoized for later splitting steps.
+    """
+
+    def __init__(self, index: PageIndex | None = None) -> None:
+        self.index = index
+        self._found: list[tuple[str, int]] = []
+        self._seen_keys: set[str] = set()
+
+    @property
+    def complete(self) -> bool:
+        """True once every section pattern has been found."""
+        return len(self._seen_keys) == len(SECTION_PATTERNS)
+
+    def feed(self, page: PageData) -> None:
+        if self.complete:
+            return
+        # One combined scan serves both the TOC heuristic and the heading search
+        index = self.index
+        if index is not None:
+            matches = index.section_matches(page)
+            if not matches or index.is_toc(page):
+                return
+        else:
+            matches = _section_matches(page.text)
+            if not matches or _is_toc_page(page, matches):
+                return
+        for key, _ in SECTION_PATTERNS:
+            if key in self._seen_keys:
                 continue
-            for m in pattern.finditer(page.text):
-                if _is_heading_match(page.text, m):
-                    found.append((key, page.page_number))
-                    seen_keys.add(key)
+            for m in matches.get(key, ()):
+                bounds = index.line_bounds(page, m.start(), m.end()) if index is not None else None
+                if _is_heading_match(page.text, m, bounds):
+                    self._found.append((key, page.page_number))
+                    self._seen_keys.add(key)
                     break
 
-    # Sort by page number so boundary logic works correctly
-    found.sort(key=lambda x: x[1])
-    return found
+    @property
+    def starts(self) -> list[tuple[str, int]]:
+        # Sort by page number so boundary logic works correctly
+        return sorted(self._found, key=lambda x: x[1])
+
+
+def _find_section_starts(
+    pages: list[PageData], index: PageIndex | None = None,
+) -> list[tuple[str, int]]:
+    """Return (section_key, page_number) for the first match of each pattern."""
+    scanner = SectionStartScanner(index)
+    for page in pages:
+        scanner.feed(page)
+    return scanner.starts
+
+
+def _pages_between(
+    pages: list[PageData], page_numbers: list[int], first: int, last: int,
+) -> list[PageData]:
+    """Pages numbered *first*..*last* (inclusive) from page-ordered *pages*.
+
+    *page_numbers* is ``[p.page_number for p in pages]``, built once per
+    document so each section range is two bisects instead of a full scan.
+    """
+    return pages[bisect_left(page_numbers, first):bisect_right(page_numbers, last)]
 
 
 def _detect_cover_page(
@@ -332,57 +505,76 @@ def _detect_cover_page(
     if first_section_page <= pages[0].page_number:
         return None  # no pages before first section
 
-    text_parts: list[str] = []
-    tables: list[list[list[str]]] = []
-    for page in pages:
-        if page.page_number < first_section_page:
-            text_parts.append(page.text)
-            tables.extend(page.tables)
-
-    if not text_parts:
+    page_numbers = [p.page_number for p in pages]
+    cover_pages = pages[:bisect_left(page_numbers, first_section_page)]
+    if not cover_pages:
         return None
 
     return SectionData(
         name=COVER_PAGE,
         start_page=pages[0].page_number,
         end_page=first_section_page - 1,
-        text="\n\n".join(text_parts),
-        tables=tables,
+        pages=cover_pages,
+        spans=[(0, len(page.text)) for page in cover_pages],
     )
 
 
-def _split_page_text_at_header(
-    page_text: str, pattern: re.Pattern[str]
-) -> tuple[str, str]:
-    """Split page text at a section header match.
-
-    Returns (text_before, text_from_header).
-    If no match, returns (page_text, "").
-    """
+def _header_line_start(page_text: str, pattern: re.Pattern[str]) -> int | None:
+    """Offset of the start of the line holding the first *pattern* match, or None."""
     m = pattern.search(page_text)
     if not m:
-        return page_text, ""
-    # Find the start of the line containing the match
-    line_start = page_text.rfind("\n", 0, m.start())
-    if line_start == -1:
-        line_start = 0
-    else:
-        line_start += 1  # skip the newline itself
-    return page_text[:line_start], page_text[line_start:]
+        return None
+    # rfind gives -1 when the match is on the first line
+    return page_text.rfind("\n", 0, m.start()) + 1
 
 
-def split_sections(pages: list[PageData]) -> dict[str, SectionData]:
+def _trimmed_span(
+    page_text: str,
+    start_pattern: re.Pattern[str] | None,
+    end_pattern: re.Pattern[str] | None,
+) -> tuple[int, int]:
+    """Offsets of the part of a shared page that belongs to one section.
+
+    With *start_pattern*, the span starts at that header's line (if found);
+    with *end_pattern*, it then ends before the next section's header line,
+    unless that would leave only whitespace.
+    """
+    start, end = 0, len(page_text)
+    if start_pattern is not None:
+        cut = _header_line_start(page_text, start_pattern)
+        if cut is not None and cut < end:
+            start = cut
+    if end_pattern is not None:
+        rest = page_text[start:] if start else page_text
+        cut = _header_line_start(rest, end_pattern)
+        if cut is not None and rest[:cut].strip():
+            end = start + cut
+    return start, end
+
+
+def split_sections(
+    pages: list[PageData],
+    starts: list[tuple[str, int]] | None = None,
+    index: PageIndex | None = None,
+) -> dict[str, SectionData]:
     """Split extracted pages into SEC filing sections.
 
     Returns a dict keyed by section name. Missing sections are omitted.
     When sections share a start page, text is split at the header boundary
     to avoid duplicating content.
+
+    *starts* may carry section starts already found for these pages by a
+    :class:`SectionStartScanner` during extraction, and *index* the
+    :class:`PageIndex` it filled.
     """
     if not pages:
         return {}
 
+    if index is None:
+        index = PageIndex()
     last_page = pages[-1].page_number
-    starts = _find_section_starts(pages)
+    page_numbers = [p.page_number for p in pages]
+    starts = list(starts) if starts is not None else _find_section_starts(pages, index)
 
     # Fix: when MDA is detected but covers ≤1 page before the next section,
     # it may be a "reference forward" stub (e.g. XOM: "Item 7. MDA — see
@@ -393,14 +585,11 @@ def split_sections(pages: list[PageData]) -> dict[str, SectionData]:
         next_pg = starts[mda_idx + 1][1] if mda_idx + 1 < len(starts) else last_page + 1
         if next_pg - mda_pg <= 1:
             # MDA is a stub — search for a second heading match
-            mda_pattern = next(pat for k, pat in SECTION_PATTERNS if k == MDA)
-            for page in pages:
-                if page.page_number <= mda_pg:
+            for page in pages[bisect_right(page_numbers, mda_pg):]:
+                if index.is_toc(page):
                     continue
-                if _is_toc_page(page):
-                    continue
-                for m in mda_pattern.finditer(page.text):
-                    if _is_heading_match(page.text, m):
+                for m in index.section_matches(page).get(MDA, ()):
+                    if _is_heading_match(page.text, m, index.line_bounds(page, m.start(), m.end())):
                         starts[mda_idx] = (MDA, page.page_number)
                         starts.sort(key=lambda x: x[1])
                         break
@@ -408,9 +597,6 @@ def split_sections(pages: list[PageData]) -> dict[str, SectionData]:
                     continue
                 break
 
-    # Build a lookup: page_number -> PageData
-    page_by_num: dict[int, PageData] = {p.page_number: p for p in pages}
-
     # Build a lookup: section key -> pattern (for text splitting)
     pattern_by_key: dict[str, re.Pattern[str]] = {
         key: pat for key, pat in SECTION_PATTERNS
@@ -450,47 +636,37 @@ def split_sections(pages: list[PageData]) -> dict[str, SectionData]:
         next_key = starts[i + 1][0] if i + 1 < len(starts) else None
         next_start_pg = starts[i + 1][1] if i + 1 < len(starts) else None
 
-        # Collect text and tables for the page range
-        section_text_parts: list[str] = []
-        section_tables: list[list[list[str]]] = []
-        for page in pages:
-            if start_pg <= page.page_number <= end_pg:
-                text = page.text
-
-                # On the start page, if a previous section also ends here,
-                # trim text to start from this section's header
-                if page.page_number == start_pg and i > 0:
-                    prev_key, prev_pg = starts[i - 1]
-                    if prev_pg == start_pg or (prev_pg < start_pg and start_pg <= max(prev_pg, start_pg)):
-                        # Previous section also touches this page — trim from our header
-                        pat = pattern_by_key.get(key)
-                        if pat:
-                            _, text_from_header = _split_page_text_at_header(text, pat)
-                            if text_from_header:
-                                text = text_from_header
-
-                # On the end page, if the next section starts here too,
-                # trim text to end before the next section's header
-                if (
-                    next_key
-                    and next_start_pg == page.page_number
-                    and next_start_pg == end_pg
-                ):
-                    next_pat = pattern_by_key.get(next_key)
-                    if next_pat:
-                        text_before, _ = _split_page_text_at_header(text, next_pat)
-                        if text_before.strip():
-                            text = text_before
-
-                section_text_parts.append(text)
-                section_tables.extend(page.tables)
+        # Collect page spans for the range; text is joined only when read
+        section_spans: list[tuple[int, int]] = []
+        section_pages = _pages_between(pages, page_numbers, start_pg, end_pg)
+        for page in section_pages:
+            start_pat = end_pat = None
+
+            # On the start page, if a previous section also ends here,
+            # trim text to start from this section's header
+            if page.page_number == start_pg and i > 0:
+                prev_key, prev_pg = starts[i - 1]
+                if prev_pg == start_pg or (prev_pg < start_pg and start_pg <= max(prev_pg, start_pg)):
+                    # Previous section also touches this page — trim from our header
+                    start_pat = pattern_by_key.get(key)
+
+            # On the end page, if the next section starts here too,
+            # trim text to end before the next section's header
+            if (
+                next_key
+                and next_start_pg == page.page_number
+                and next_start_pg == end_pg
+            ):
+                end_pat = pattern_by_key.get(next_key)
+
+            section_spans.append(_trimmed_span(page.text, start_pat, end_pat))
 
         sections[key] = SectionData(
             name=key,
             start_page=start_pg,
             end_page=end_pg,
-            text="\n\n".join(section_text_parts),
-            tables=section_tables,
+            pages=section_pages,
+            spans=section_spans,
         )
 
     return sections
@@ -0,0 +1,207 @@
+"""Compiled line-item taxonomy shared by every PDF in a process.
+
+``taxonomy.yaml`` and ``xbrl_taxonomy_map.yaml`` are parsed once into a
+:class:`CompiledTaxonomy` holding the raw taxonomy, its alias index,
+canonical names and the XBRL concept map.  The compiled object is reused
+until either source file's mtime or size changes, and is also pickled
+under the sec-parse cache directory so new processes skip the YAML parse
+when the sources' SHA-256 still matches.
+
+The artifact starts with a header line holding the source hash and the
+SHA-256 of the pickle that follows; both are checked before anything is
+unpickled, so a stale, truncated or foreign file is never loaded.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from dataclasses import dataclass
+from pathlib import Path
+
+import yaml
+
+from .extract_cache import cache_root
+from .normalize import FuzzyMatcher, _build_alias_index
+
+TAXONOMY_PATH = Path(__file__).parent / "taxonomy.yaml"
+XBRL_MAP_PATH = Path(__file__).parent / "xbrl_taxonomy_map.yaml"
+
+# Bump whenever CompiledTaxonomy's fields or their construction change
+COMPILED_FORMAT = 3
+
+_ARTIFACT_MAGIC = b"sec-parse-taxonomy"
+
+
+@dataclass(frozen=True)
+class CompiledTaxonomy:
+    """Parsed taxonomy plus the lookups derived from it.
+
+    Shared across callers; treat every field as read-only.
+    """
+    taxonomy: dict
+    alias_index: dict[str, str]  # lowercase alias or canonical -> canonical
+    canonical_names: list[str]
+    xbrl_map: dict[str, dict[str, str]]  # statement type -> {concept: canonical}
+    source_hash: str
+    matcher: FuzzyMatcher  # fuzzy lookups over alias_index
+
+
+# (taxonomy path, xbrl map path) -> (source stamps, compiled taxonomy)
+_compiled: dict[tuple[Path, Path], tuple[tuple, CompiledTaxonomy]] = {}
+
+# id(alias index) -> (alias index, matcher) for indexes other than the
+# compiled one; holding the index keeps its id from being reused
+_matchers: dict[int, tuple[dict[str, str], FuzzyMatcher]] = {}
+_MAX_MATCHERS = 8
+
+
+def _stamp(paths: tuple[Path, ...]) -> tuple:
+    stats = [p.stat() for p in paths]
+    return tuple((s.st_mtime_ns, s.st_size) for s in stats)
+
+
+def _source_hash(paths: tuple[Path, ...]) -> str:
+    digest = hashlib.sha256(str(COMPILED_FORMAT).encode())
+    for path in paths:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def artifact_path(source_hash: str) -> Path:
+    """Where the pickled compiled taxonomy for sources hashing to *source_hash* is kept."""
+    return cache_root() / "taxonomy" / f"{source_hash}.pickle"
+
+
+def _canonical_names(taxonomy: dict) -> list[str]:
+    names = []
+    for section in taxonomy.values():
+        if not isinstance(section, dict):
+            continue
+        for item in section.values():
+            if not isinstance(item, dict):
+                continue
+            names.append(item.get("canonical", ""))
+    return names
+
+
+def _compile(taxonomy_path: Path, xbrl_map_path: Path, source_hash: str) -> CompiledTaxonomy:
+    with open(taxonomy_path, "r") as f:
+        taxonomy = yaml.safe_load(f)
+    with open(xbrl_map_path, encoding="utf-8") as f:
+        raw = yaml.safe_load(f)
+    xbrl_map = {
+        statement_type: dict(concepts) for statement_type, concepts in raw.items()
+    }
+    alias_index = _build_alias_index(taxonomy)
+    return CompiledTaxonomy(
+        taxonomy=taxonomy,
+        alias_index=alias_index,
+        canonical_names=_canonical_names(taxonomy),
+        xbrl_map=xbrl_map,
+        source_hash=source_hash,
+        matcher=FuzzyMatcher(alias_index),
+    )
+
+
+def _load_artifact(path: Path, source_hash: str) -> CompiledTaxonomy | None:
+    try:
+        header, payload = path.read_bytes().split(b"\n", 1)
+        magic, artifact_hash, payload_hash = header.split(b" ")
+    except (OSError, ValueError):  # missing or not an artifact
+        return None
+    if (
+        magic != _ARTIFACT_MAGIC
+        or artifact_hash.decode("ascii", "replace") != source_hash
+        or hashlib.sha256(payload).hexdigest().encode() != payload_hash
+    ):
+        return None
+    try:
+        compiled = pickle.loads(payload)
+    except Exception:  # written by an incompatible build
+        return None
+    if not isinstance(compiled, CompiledTaxonomy) or compiled.source_hash != source_hash:
+        return None
+    return compiled
+
+
+def _store_artifact(path: Path, compiled: CompiledTaxonomy) -> None:
+    """Write the artifact atomically; an unwritable location is ignored."""
+    payload = pickle.dumps(compiled, protocol=pickle.HIGHEST_PROTOCOL)
+    header = b" ".join(
+        (_ARTIFACT_MAGIC, compiled.source_hash.encode(), hashlib.sha256(payload).hexdigest().encode())
+    )
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(header + b"\n" + payload)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def compiled_taxonomy(
+    taxonomy_path: str | Path | None = None,
+    xbrl_map_path: str | Path | None = None,
+    persist: bool = True,
+) -> CompiledTaxonomy:
+    """Return the compiled taxonomy, building it at most once per source change.
+
+    Defaults to the ``taxonomy.yaml`` and ``xbrl_taxonomy_map.yaml`` shipped
+    next to this module.  With *persist*, a pickled artifact in the cache
+    directory is read when its source hash matches and written otherwise.
+    """
+    tax_path = Path(taxonomy_path) if taxonomy_path is not None else TAXONOMY_PATH
+    map_path = Path(xbrl_map_path) if xbrl_map_path is not None else XBRL_MAP_PATH
+    key = (tax_path, map_path)
+    stamp = _stamp(key)
+    cached = _compiled.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    source_hash = _source_hash(key)
+    artifact = artifact_path(source_hash)
+    compiled = _load_artifact(artifact, source_hash) if persist else None
+    if compiled is None:
+        compiled = _compile(tax_path, map_path, source_hash)
+        if persist:
+            _store_artifact(artifact, compiled)
+    _compiled[key] = (stamp, compiled)
+    return compiled
+
+
+def alias_index_for(taxonomy: dict) -> dict[str, str]:
+    """Alias index for *taxonomy*, reusing the compiled one when it is shared."""
+    for _, compiled in _compiled.values():
+        if compiled.taxonomy is taxonomy:
+            return compiled.alias_index
+    return _build_alias_index(taxonomy)
+
+
+def canonical_names_for(taxonomy: dict) -> list[str]:
+    """Canonical names in *taxonomy*, reusing the compiled list when it is shared."""
+    for _, compiled in _compiled.values():
+        if compiled.taxonomy is taxonomy:
+            return compiled.canonical_names
+    return _canonical_names(taxonomy)
+
+
+def fuzzy_matcher_for(alias_index: dict[str, str]) -> FuzzyMatcher:
+    """Fuzzy matcher over *alias_index*, reusing the compiled one when it is shared.
+
+    Matchers for other indexes are built once per index object and kept
+    for the most recent few indexes.  Treat *alias_index* as read-only once
+    it has been matched against.
+    """
+    for _, compiled in _compiled.values():
+        if compiled.alias_index is alias_index:
+            return compiled.matcher
+    cached = _matchers.get(id(alias_index))
+    if cached is not None and cached[0] is alias_index:
+        return cached[1]
+    matcher = FuzzyMatcher(alias_index)
+    if len(_matchers) >= _MAX_MATCHERS:
+        del _matchers[next(iter(_matchers))]
+    _matchers[id(alias_index)] = (alias_index, matcher)
+    return matcher
@@ -8,6 +8,7 @@ Usage:
     python -m sec_parser.test_runner --eval-only              # evaluate existing output only
     python -m sec_parser.test_runner --report quality.md      # write markdown report
     python -m sec_parser.test_runner --pdf-dir my-pdfs/       # custom PDF directory
+    python -m sec_parser.test_runner --no-extract-cache       # force fresh pdfplumber extraction
 """
 
 from __future__ import annotations
@@ -452,6 +453,10 @@ def main() -> int:
     parser.add_argument("--output-dir", default="output", help="Directory for markdown output")
     parser.add_argument("--eval-only", action="store_true", help="Only evaluate existing output")
     parser.add_argument("--report", metavar="PATH", help="Write markdown report to file")
+    parser.add_argument(
+        "--no-extract-cache", action="store_true",
+        help="Re-run pdfplumber instead of using cached page extraction",
+    )
     args = parser.parse_args()
 
     pdf_dir = Path(args.pdf_dir)
@@ -470,7 +475,10 @@ def main() -> int:
         for pdf_path in pdfs:
             print(f"Processing {pdf_path.name}...", file=sys.stderr)
             try:
-                process_pdf(pdf_path, output_dir, verbose=True)
+                process_pdf(
+                    pdf_path, output_dir, verbose=True,
+                    use_extract_cache=not args.no_extract_cache,
+                )
             except Exception as exc:
                 print(f"  ERROR: {exc}", file=sys.stderr)
 
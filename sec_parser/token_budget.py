@@ -0,0 +1,105 @@
+"""Tokenizer-free token estimates and per-model chunk budgets for Gemini calls.
+
+:func:`estimate_tokens` approximates Gemini's SentencePiece tokenizer
+without loading it: every digit, punctuation mark and newline is a token of
+its own, a word costs one token per eight letters, and every two layout
+spaces cost one.  Numeric notes therefore estimate several times denser per
+character than prose, which is what made a fixed character limit truncate
+some chunks and underfill others.
+
+:func:`chunk_budget` sizes chunks so the expected response fits the output
+token limit, from a fixed output/input ratio per kind of request.  It is a
+function of the model and request kind only, never of earlier responses:
+chunk boundaries decide the prompts, and so the LLM cache keys, and a
+rerun must split a filing exactly as the first run did.  Responses record
+Gemini's own token counts, and :func:`fit_output_ratio` refits the ratios
+from them (``python -m sec_parser.benchmark calibrate``).
+"""
+
+from __future__ import annotations
+
+import math
+import string
+from typing import Iterable, NamedTuple
+
+# Characters that are a token each; everything else between spaces is a word
+_ASCII_SINGLES = (string.digits + string.punctuation + "\n").encode()
+_SINGLES_TO_SPACE = bytes.maketrans(_ASCII_SINGLES, b" " * len(_ASCII_SINGLES))
+_UNICODE_SINGLES = "—–€£§•’“”"
+_LETTERS_PER_TOKEN = 8
+
+
+class ModelLimits(NamedTuple):
+    input_tokens: int
+    output_tokens: int
+
+
+# Longest matching prefix wins, so dated or preview variants share a family's limits
+MODEL_TOKEN_LIMITS = {
+    "gemini-2.5-pro": ModelLimits(1_048_576, 65_536),
+    "gemini-2.5-flash": ModelLimits(1_048_576, 65_536),
+    "gemini-2.0-flash": ModelLimits(1_048_576, 8_192),
+    "gemini-1.5-pro": ModelLimits(2_097_152, 8_192),
+    "gemini-1.5-flash": ModelLimits(1_048_576, 8_192),
+}
+DEFAULT_LIMITS = ModelLimits(131_072, 8_192)
+
+# Expected response tokens per estimated chunk token; refit with
+# ``python -m sec_parser.benchmark calibrate`` and update by hand
+OUTPUT_RATIO = {"notes": 1.1, "prose": 0.9}
+# Share of the output limit a chunk's expected response may fill
+OUTPUT_HEADROOM = 0.8
+# Quantile of observed ratios a refit uses, so most chunks fit on the first try
+CALIBRATION_QUANTILE = 0.9
+MIN_CHUNK_TOKENS = 1_000
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate Gemini token count of *text*.
+
+    Counts with bytes.translate/split on the UTF-8 encoding rather than a
+    regex scan, so estimating a whole Notes section takes milliseconds.
+    Multi-byte letters count by byte, which slightly overestimates
+    non-English words.
+    """
+    data = text.encode("utf-8")
+    singles = len(data) - len(data.translate(None, _ASCII_SINGLES))
+    singles += sum(map(text.count, _UNICODE_SINGLES))
+    words = data.translate(_SINGLES_TO_SPACE).split()
+    long_extra = sum(
+        (n - 1) // _LETTERS_PER_TOKEN for n in map(len, words) if n > _LETTERS_PER_TOKEN
+    )
+    return singles + len(words) + long_extra + data.count(b"  ")
+
+
+def model_limits(model: str) -> ModelLimits:
+    """Input and output token limits for *model*."""
+    matches = [name for name in MODEL_TOKEN_LIMITS if model.startswith(name)]
+    if not matches:
+        return DEFAULT_LIMITS
+    return MODEL_TOKEN_LIMITS[max(matches, key=len)]
+
+
+def chunk_budget(model: str, kind: str, max_output_tokens: int, overhead: int = 0) -> int:
+    """Estimated input tokens per chunk so its response fits *max_output_tokens*.
+
+    *overhead* is the prompt template's own size, which counts against the
+    model's input limit.
+    """
+    by_output = max_output_tokens * OUTPUT_HEADROOM / OUTPUT_RATIO.get(kind, 1.0)
+    by_input = model_limits(model).input_tokens - overhead
+    return max(MIN_CHUNK_TOKENS, int(min(by_output, by_input)))
+
+
+def fit_output_ratio(
+    samples: Iterable[tuple[int, int]], quantile: float = CALIBRATION_QUANTILE,
+) -> float | None:
+    """Output/input ratio covering *quantile* of ``(input_tokens, output_tokens)`` samples.
+
+    Only untruncated responses should be passed, since a truncated one
+    understates its ratio.  Returns None without samples.
+    """
+    ratios = sorted(output / inp for inp, output in samples if inp > 0)
+    if not ratios:
+        return None
+    return ratios[min(len(ratios) - 1, max(0, math.ceil(quantile * len(ratios)) - 1))]
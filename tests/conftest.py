@@ -15,6 +15,14 @@ CADELER_REPORTS = Path(
 )
 
 
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Point every sec-parse cache at a per-test directory, never the user's cache."""
+    path = tmp_path / "cache"
+    monkeypatch.setenv("SEC_PARSER_CACHE_DIR", str(path))
+    return path
+
+
 @pytest.fixture
 def cadeler_1q25():
     """Cadeler Q1 2025 quarterly report (14 pages)."""
@@ -31,3 +39,60 @@ def cadeler_ar24():
     if not path.exists():
         pytest.skip("Cadeler AR24.pdf not available")
     return path
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_text_pdf(path: Path, pages: list[str], rects: dict[int, int] | None = None) -> Path:
+    """Write a minimal PDF with one Helvetica text line per input line.
+
+    Lets extraction tests run against real pdfplumber output without
+    shipping binary fixtures.  *rects* maps 0-indexed pages to a number of
+    small filled rectangles drawn on them (chart-like vector art).
+    """
+    rects = rects or {}
+    objects: list[bytes] = []
+    n = len(pages)
+    font_id = 3 + 2 * n
+    kids = " ".join(f"{3 + 2 * i} 0 R" for i in range(n))
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {n} >>".encode())
+    for i, text in enumerate(pages):
+        ops = ["BT", "/F1 10 Tf", "14 TL", "50 750 Td"]
+        for line in text.split("\n"):
+            ops.append(f"({_pdf_escape(line)}) Tj T*")
+        ops.append("ET")
+        for r in range(rects.get(i, 0)):
+            ops.append(f"{20 + (r % 50) * 11} {20 + (r // 50) * 11} 8 8 re f")
+        stream = "\n".join(ops).encode("latin-1")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {4 + 2 * i} 0 R >>".encode()
+        )
+        objects.append(
+            b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream"
+        )
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % num + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for off in offsets:
+        out += b"%010d 00000 n \n" % off
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    path.write_bytes(bytes(out))
+    return path
+
+
+@pytest.fixture
+def make_text_pdf(tmp_path):
+    """Factory writing a minimal text PDF: ``make_text_pdf(["page 1", ...])``."""
+    def _make(pages: list[str], name: str = "sample.pdf", rects: dict[int, int] | None = None) -> Path:
+        return write_text_pdf(tmp_path / name, pages, rects)
+    return _make
@@ -126,3 +126,33 @@ def test_10k_start_page_footer_on_page1():
         PageData(page_number=2, text="More content"),
     ]
     assert detect_10k_start_page(pages) == 1
+
+
+# --- incremental detectors ---
+
+
+def test_tenk_detector_settles_on_cover_page():
+    from sec_parser.detect import TenKStartDetector
+
+    detector = TenKStartDetector()
+    detector.feed(PageData(page_number=1, text="Dear Fellow Shareholders"))
+    assert detector.cover_page is None
+    detector.feed(
+        PageData(
+            page_number=2,
+            text="UNITED STATES SECURITIES AND EXCHANGE COMMISSION\nFORM 10-K\n",
+        )
+    )
+    assert detector.cover_page == 2
+    assert detector.result() == 2
+
+
+def test_report_type_detector_stops_after_scan_pages():
+    from sec_parser.detect import ReportTypeDetector
+
+    detector = ReportTypeDetector(scan_pages=2)
+    detector.feed(PageData(page_number=1, text="Annual report"))
+    detector.feed(PageData(page_number=2, text="FORM 10-K"))
+    assert detector.done
+    detector.feed(PageData(page_number=3, text="IFRS NOK'000 Oslo Stock Exchange Euronext"))
+    assert detector.result() == "sec"
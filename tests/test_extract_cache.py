@@ -0,0 +1,56 @@
+"""Tests for sec_parser.extract_cache — on-disk page extraction cache."""
+
+from __future__ import annotations
+
+import os
+
+import sec_parser.extract_cache as extract_cache
+from sec_parser.extract_cache import cache_key, evict, load_pages, store_pages
+from sec_parser.pdf_extract import PageData, extract_pdf
+
+
+def test_round_trip(make_text_pdf):
+    path = make_text_pdf(["FORM 10-Q\nAcme Corp", "Total assets   1,000   900"])
+    pages = extract_pdf(path)
+    assert load_pages(path) is None
+    store_pages(path, pages)
+    assert load_pages(path) == pages
+
+
+def test_key_tracks_content_and_version(make_text_pdf, monkeypatch):
+    a = make_text_pdf(["page one"], name="a.pdf")
+    b = make_text_pdf(["page two"], name="b.pdf")
+    assert cache_key(a) != cache_key(b)
+    key = cache_key(a)
+    monkeypatch.setattr(extract_cache, "EXTRACTOR_VERSION", extract_cache.EXTRACTOR_VERSION + 1)
+    assert cache_key(a) != key
+
+
+def test_lazy_pages_not_stored(make_text_pdf):
+    path = make_text_pdf(["page one"])
+    store_pages(path, extract_pdf(path, lazy_tables=True))
+    assert load_pages(path) is None
+
+
+def test_text_only_prefix_round_trips_lazily(make_text_pdf):
+    path = make_text_pdf(["annual letter", "FORM 10-K\nAcme Corp", "Total assets   1,000   900"])
+    eager = extract_pdf(path)
+    pages = extract_pdf(path, lazy_tables=True)
+    pages[1].tables = eager[1].tables
+    pages[2].tables = eager[2].tables
+    store_pages(path, pages, text_only_before=2)
+    cached = load_pages(path)
+    assert [p.tables_loaded for p in cached] == [False, True, True]
+    assert cached == eager
+
+
+def test_evicts_least_recently_used(make_text_pdf, cache_dir):
+    paths = [make_text_pdf([f"document {i}\n" + "x" * 500], name=f"{i}.pdf") for i in range(3)]
+    for i, path in enumerate(paths):
+        store_pages(path, [PageData(page_number=1, text=f"text {i}" * 100)])
+        entry = cache_dir / "extract" / f"{cache_key(path)}.json.z"
+        os.utime(entry, (1000 + i, 1000 + i))
+    entry_size = max(e.stat().st_size for e in (cache_dir / "extract").iterdir())
+    assert evict(max_bytes=entry_size * 2) == 1
+    assert load_pages(paths[0]) is None
+    assert load_pages(paths[2]) is not None
@@ -0,0 +1,415 @@
+"""Tests for sec_parser.gemini_client against a local stub client (no network)."""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+import sec_parser.gemini_client as gemini_client
+from sec_parser.gemini_client import (
+    extract_cover_page,
+    extract_notes,
+    extract_prose_section,
+    normalize_table,
+)
+from sec_parser.token_budget import chunk_budget, estimate_tokens
+from google.genai import errors, types
+
+
+class StubModels:
+    """Answers ``Note NN done`` for each prompt's ``Note NN`` lines after *latency* seconds.
+
+    Responses report about as many output tokens as the prompt had, and stop
+    at the output limit when the prompt exceeds *truncate_over* tokens.
+    """
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.truncate_over: int | None = None
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def generate_content_stream(self, model, contents, config):
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            markers = [line[:7] for line in contents.splitlines() if re.match(r"Note \d\d", line)]
+            # Later chunks finish first, so ordering must not depend on completion
+            time.sleep(self.latency / int(markers[0][5:7]))
+            tokens = estimate_tokens(contents)
+            finish = types.FinishReason.STOP
+            if self.truncate_over is not None and tokens > self.truncate_over:
+                tokens, finish = config.max_output_tokens, types.FinishReason.MAX_TOKENS
+            last = SimpleNamespace(
+                text=" done",
+                usage_metadata=SimpleNamespace(
+                    candidates_token_count=tokens, prompt_token_count=len(contents) // 4,
+                ),
+                candidates=[SimpleNamespace(finish_reason=finish)],
+            )
+            parts = [SimpleNamespace(text=f"{marker} done\n\n") for marker in markers[:-1]]
+            return iter([*parts, SimpleNamespace(text=markers[-1]), last])
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def generate_content(self, model, contents, config):
+        with self._lock:
+            self.calls += 1
+        return SimpleNamespace(text=f"{model}:{config.max_output_tokens}")
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    models = StubModels(latency=0.2)
+    monkeypatch.setattr(gemini_client, "_get_client", lambda: SimpleNamespace(models=models))
+    monkeypatch.setattr(gemini_client, "_rate_limiter", gemini_client._RateLimiter(0))
+    return models
+
+
+def _budget(kind: str = "notes", max_output_tokens: int = 65536) -> int:
+    return chunk_budget(gemini_client.DEFAULT_MODEL, kind, max_output_tokens)
+
+
+def _notes(count: int, sep: str = "\n", tokens: int | None = None) -> str:
+    # By default each note fills 60% of a chunk, so every note is its own chunk
+    budget = _budget("prose", 16000) if sep == "\n\n\n" else _budget()
+    body = "word " * (tokens or int(budget * 0.6))
+    return "".join(f"{sep}Note {i:02d}. Policies\n{body}" for i in range(1, count + 1))
+
+
+def test_notes_chunks_run_concurrently_in_order(stub):
+    start = time.monotonic()
+    result = extract_notes(_notes(6), max_workers=3)
+    elapsed = time.monotonic() - start
+
+    assert result.split("\n\n") == [f"Note {i:02d} done" for i in range(1, 7)]
+    assert stub.calls == 6
+    assert stub.max_in_flight == 3
+    assert elapsed < 6 * 0.1
+
+
+def test_single_worker_is_sequential(stub):
+    extract_notes(_notes(3), max_workers=1)
+    assert stub.max_in_flight == 1
+
+
+def test_concurrency_from_environment(stub, monkeypatch):
+    monkeypatch.setenv("GEMINI_CONCURRENCY", "2")
+    result = extract_prose_section(_notes(4, sep="\n\n\n"))
+    assert result.split("\n\n") == [f"Note {i:02d} done" for i in range(1, 5)]
+    assert stub.max_in_flight == 2
+
+
+def test_rate_limiter_spaces_request_starts():
+    limiter = gemini_client._RateLimiter(rpm=1200)  # one start every 50 ms
+    starts = []
+    begin = time.monotonic()
+
+    def worker():
+        limiter.acquire()
+        starts.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # The k-th start can come no earlier than k slots in, however the
+    # threads are scheduled after acquiring
+    starts.sort()
+    assert all(start - begin >= k * 0.045 for k, start in enumerate(starts))
+
+
+def test_rate_limits_read_after_import(monkeypatch):
+    # cli loads .env after the package is imported
+    monkeypatch.setattr(gemini_client, "_rate_limiter", None)
+    monkeypatch.setenv("GEMINI_RPM", "1200")
+    monkeypatch.setenv("GEMINI_TPM", "6000")
+    limiter = gemini_client._get_rate_limiter()
+    assert limiter._requests.rate == 20
+    assert limiter._tokens.rate == 100
+    assert gemini_client._get_rate_limiter() is limiter
+
+
+def test_warm_rerun_makes_no_api_calls(stub, monkeypatch):
+    notes = _notes(3)
+    first = (extract_notes(notes), normalize_table("Revenue 100", []), extract_cover_page("Example Corp"))
+    assert stub.calls == 5
+
+    monkeypatch.setattr(gemini_client, "_get_client", lambda: pytest.fail("API called on warm rerun"))
+    second = (extract_notes(notes), normalize_table("Revenue 100", []), extract_cover_page("Example Corp"))
+    assert second == first
+
+
+def test_cache_keyed_by_model_and_content(stub, monkeypatch):
+    extract_notes(_notes(2))
+    extract_notes(_notes(3))  # the first two chunks are shared
+    assert stub.calls == 3
+
+    monkeypatch.setenv("GEMINI_MODEL", "gemini-2.5-pro")
+    extract_notes(_notes(2))
+    assert stub.calls == 5
+
+
+def test_readonly_mode_serves_hits_without_writing(stub, monkeypatch, cache_dir):
+    extract_notes(_notes(1))
+    monkeypatch.setenv("SEC_PARSER_LLM_CACHE", "readonly")
+    extract_notes(_notes(2))
+    assert stub.calls == 2
+    assert len(list((cache_dir / "llm").iterdir())) == 1
+
+
+def test_off_mode_bypasses_cache(stub, monkeypatch, cache_dir):
+    monkeypatch.setenv("SEC_PARSER_LLM_CACHE", "off")
+    extract_notes(_notes(1))
+    extract_notes(_notes(1))
+    assert stub.calls == 2
+    assert not cache_dir.exists()
+
+
+def test_token_bucket_limits_prompt_tokens():
+    limiter = gemini_client._RateLimiter(rpm=0, tpm=6000)  # 100 tokens per second
+    start = time.monotonic()
+    limiter.acquire(6000)  # a full bucket goes through at once
+    limiter.acquire(10)
+    assert 0.09 <= time.monotonic() - start < 0.5
+
+
+class StubGemini(BaseHTTPRequestHandler):
+    """Minimal Gemini REST endpoint that throttles the first *throttle* requests."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive
+    throttle = 0
+    retry_after = "0"
+    requests: list = []
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        type(self).requests.append((self.path, self.client_address, body))
+        if type(self).throttle:
+            type(self).throttle -= 1
+            error = {"error": {"code": 429, "message": "quota", "status": "RESOURCE_EXHAUSTED"}}
+            self._reply(429, "application/json", json.dumps(error), {"Retry-After": self.retry_after})
+            return
+        answer = {"candidates": [{"content": {"role": "model", "parts": [{"text": "| Revenue | 100 |"}]}}]}
+        if "stream" in self.path:
+            self._reply(200, "text/event-stream", f"data: {json.dumps(answer)}\r\n\r\n")
+        else:
+            self._reply(200, "application/json", json.dumps(answer))
+
+    def _reply(self, status, content_type, text, headers=None):
+        data = text.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(monkeypatch):
+    StubGemini.throttle = 0
+    StubGemini.retry_after = "0"
+    StubGemini.requests = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StubGemini)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    monkeypatch.setenv("GEMINI_BASE_URL", f"http://127.0.0.1:{httpd.server_port}")
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    monkeypatch.setattr(gemini_client, "_clients", {})
+    monkeypatch.setattr(gemini_client, "_rate_limiter", gemini_client._RateLimiter(0))
+    yield StubGemini
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_client_reused_across_requests(server):
+    assert gemini_client._get_client() is gemini_client._get_client()
+    normalize_table("Revenue 100", [])
+    extract_cover_page("Example Corp")
+    extract_notes("Note 1. Policies")
+    paths = [path for path, _, _ in server.requests]
+    assert paths[0].endswith(":generateContent")
+    assert paths[2].endswith(":streamGenerateContent?alt=sse")
+    assert len({address for _, address, _ in server.requests}) == 1  # one kept-alive connection
+
+
+def test_throttled_requests_back_off_and_retry(server):
+    server.throttle = 2
+    before = gemini_client.call_stats()
+    assert normalize_table("Revenue 100", []) == "| Revenue | 100 |"
+    assert extract_notes("Note 1. Policies") == "| Revenue | 100 |"
+    assert normalize_table("Revenue 100", []) == "| Revenue | 100 |"  # cached
+    assert gemini_client.call_stats() - before == gemini_client.CallStats(requests=4, cached=1, retries=2)
+
+
+def test_gives_up_after_max_retries(server, monkeypatch):
+    monkeypatch.setenv("GEMINI_MAX_RETRIES", "1")
+    server.throttle = 5
+    with pytest.raises(errors.ClientError) as exc_info:
+        extract_cover_page("Example Corp")
+    assert exc_info.value.code == 429
+    assert len(server.requests) == 2
+
+
+def test_scope_deadline_stops_backoff_and_retries(server):
+    server.throttle = 5
+    server.retry_after = "30"
+    scope = gemini_client.CallScope(deadline=time.monotonic() + 0.3)
+    start = time.monotonic()
+    with gemini_client.call_scope(scope), pytest.raises(gemini_client.CallCancelled):
+        extract_cover_page("Example Corp")
+    assert time.monotonic() - start < 2
+    assert len(server.requests) == 1
+    assert gemini_client.call_stats(scope) == gemini_client.CallStats(requests=1, retries=1)
+
+
+def test_cancelled_scope_stops_streaming_chunks(stub):
+    stub.latency = 1.0  # the first note's response outlasts the deadline
+    outer = gemini_client.CallScope()
+    scope = gemini_client.CallScope(outer, deadline=time.monotonic() + 0.5)
+    with gemini_client.call_scope(outer):
+        with gemini_client.call_scope(scope), pytest.raises(gemini_client.CallCancelled):
+            extract_notes(_notes(4), max_workers=1)
+        # The job's call counts in the enclosing scope too; later calls only there
+        extract_cover_page("Example Corp")
+    assert stub.calls == 2
+    assert gemini_client.call_stats(scope) == gemini_client.CallStats(requests=1)
+    assert gemini_client.call_stats(outer) == gemini_client.CallStats(requests=2)
+
+
+def test_chunks_follow_token_budget_not_characters(stub):
+    # Same length in characters; figures tokenize far denser than words
+    words = _notes(4, tokens=_budget() // 8)
+    figures = "".join(ch if ch in "\nNote" else "1" for ch in words)
+    assert len(figures) == len(words)
+    assert gemini_client._chunk_notes(words, _budget()) == [words]
+    assert len(gemini_client._chunk_notes(figures, _budget())) > 1
+
+
+def test_oversized_note_split_at_lines():
+    note = "Note 01. Leases\n" + "word word word\n" * 1000
+    chunks = gemini_client._chunk_notes(note, 1000)
+    assert "".join(chunks) == note
+    assert all(estimate_tokens(chunk) <= 1000 for chunk in chunks)
+
+
+def test_truncated_chunk_is_resplit_and_cached(stub, monkeypatch):
+    notes = _notes(3, tokens=int(_budget() * 0.3))  # packed into one chunk
+    stub.truncate_over = int(_budget() * 0.5)
+    result = extract_notes(notes)
+    assert result.split("\n\n") == [f"Note {i:02d} done" for i in range(1, 4)]
+    assert stub.calls == 4
+
+    # A new process replays the truncation from the cache and splits identically
+    monkeypatch.setattr(gemini_client, "_get_client", lambda: pytest.fail("API called on warm rerun"))
+    assert extract_notes(notes) == result
+
+
+def test_chunking_independent_of_earlier_filings(stub, monkeypatch):
+    small = _notes(2, tokens=int(_budget() * 0.3))
+    truncating = _notes(3, tokens=int(_budget() * 0.3))
+    stub.truncate_over = int(_budget() * 0.8)
+    first = extract_notes(small)
+    extract_notes(truncating)  # truncates and re-splits
+
+    # Rerunning one filing, after others or alone, hits the cache
+    monkeypatch.setattr(gemini_client, "_get_client", lambda: pytest.fail("API called on warm rerun"))
+    assert extract_notes(small) == first
+
+
+def test_responses_record_calibration_data(stub, cache_dir):
+    import sec_parser.llm_cache as llm_cache
+
+    extract_notes(_notes(1))
+    [entry] = (cache_dir / "llm").iterdir()
+    _, meta = llm_cache.load_entry(entry.name.removesuffix(".json.z"))
+    assert meta["kind"] == "notes"
+    assert meta["model"] == gemini_client.DEFAULT_MODEL
+    assert meta["estimated_tokens"] > 0
+    assert meta["prompt_tokens"] == len(gemini_client.NOTES_EXTRACTION_PROMPT.format(content=_notes(1))) // 4
+
+
+def test_verbose_reports_chunk_token_estimates(stub, capsys):
+    extract_notes(_notes(2), verbose=True)
+    err = capsys.readouterr().err
+    assert "Notes in 2 chunk(s) of ~" in err
+    assert f"(budget {_budget():,})" in err
+
+
+def _filing(*notes: str) -> str:
+    body = "".join(f"\nNote {i:02d}. {text}" for i, text in enumerate(notes, 1))
+    return "NOTES TO CONSOLIDATED FINANCIAL STATEMENTS\n" + body
+
+
+def test_split_notes_keeps_heading_with_first_note():
+    notes = gemini_client._split_notes(_filing("Basis\nText.", "Leases\nMore."))
+    assert notes == [
+        "NOTES TO CONSOLIDATED FINANCIAL STATEMENTS\n\nNote 01. Basis\nText.",
+        "\nNote 02. Leases\nMore.",
+    ]
+
+
+def test_unchanged_notes_reused_across_filings(stub):
+    basis, leases = "Basis\nPrepared under GAAP.", "Leases\nOffice leases expire in 2031."
+    first = extract_notes(_filing(basis, leases, "Debt\nNotes due 2030: 1,000."), cik="0000320193")
+    assert first.split("\n\n") == ["Note 01 done", "Note 02 done", "Note 03 done"]
+    assert stub.calls == 1
+
+    # Next quarter: a new note 2 shifts Leases to note 3, and the debt balance changed
+    second = extract_notes(
+        _filing(basis, "Revenue\nNew disclosure.", leases, "Debt\nNotes due 2030: 1,250."),
+        cik="320193",
+    )
+    assert stub.calls == 2  # only the new and the changed note were sent, together
+    assert second.split("\n\n") == ["Note 01 done", "Note 02 done", "Note 03 done", "Note 04 done"]
+
+
+def test_first_filing_notes_packed_into_chunks(stub):
+    notes = [f"Policy {i}\nDisclosure text for the year." for i in range(1, 26)]
+    result = extract_notes(_filing(*notes), cik="320193")
+    assert stub.calls == 1
+    assert result.split("\n\n") == [f"Note {i:02d} done" for i in range(1, 26)]
+
+    # Every note was stored on its own, so a rerun sends nothing
+    assert extract_notes(_filing(*notes), cik="320193") == result
+    assert stub.calls == 1
+
+
+def test_unsplittable_response_used_but_not_stored(stub, monkeypatch):
+    filing = _filing("Basis\nPrepared under GAAP.", "Leases\nOffice leases.")
+    split = gemini_client._split_note_output
+    monkeypatch.setattr(gemini_client, "_split_note_output", lambda output, numbers: None)
+    assert extract_notes(filing, cik="320193") == "Note 01 done\n\nNote 02 done"
+    monkeypatch.setattr(gemini_client, "_split_note_output", split)
+    # With the response cache off, only the note store could answer
+    monkeypatch.setenv("SEC_PARSER_LLM_CACHE", "off")
+    extract_notes(filing, cik="320193")
+    assert stub.calls == 2
+
+
+def test_split_note_output_at_markdown_headings():
+    output = (
+        "# Notes to Financial Statements\n\n## Note 1 — Basis\nSee Note 3 below.\n\n"
+        "## **Note 3** Debt\n### Note 3 maturities\nText."
+    )
+    assert gemini_client._split_note_output(output, [None, "03"]) == [
+        "# Notes to Financial Statements\n\n## Note 1 — Basis\nSee Note 3 below.",
+        "## **Note 3** Debt\n### Note 3 maturities\nText.",
+    ]
+    assert gemini_client._split_note_output(output, [None, "04"]) is None
@@ -1,6 +1,6 @@
 """Tests for IFRS section splitting."""
 
-from sec_parser.pdf_extract import extract_pdf
+from sec_parser.pdf_extract import PageData, extract_pdf
 from sec_parser.ifrs_section_split import (
     IFRS_INCOME_STATEMENT,
     IFRS_BALANCE_SHEET,
@@ -64,3 +64,24 @@ def test_ignores_parent_company_financials(cadeler_ar24):
     # Income statement should be the consolidated one (page ~143),
     # not the parent company one (page ~226)
     assert sections[IFRS_INCOME_STATEMENT].start_page < 200
+
+
+def test_notes_stop_before_parent_company_pages():
+    """Notes run to the page before the parent company statements, skipping dividers."""
+    body = "Revenue and operating costs are described in this note in detail. " * 3
+    pages = [
+        PageData(1, "Consolidated Statement of Profit or Loss\n" + body),
+        PageData(2, "Consolidated Statement of Financial Position\n" + body),
+        PageData(3, "Notes to the Consolidated Financial Statements\n" + body),
+        PageData(4, body),
+        PageData(5, "Notes"),
+        PageData(6, body),
+        PageData(7, "Parent Company Statement of Profit or Loss\n" + body),
+        PageData(8, body),
+    ]
+    sections = split_ifrs_sections(pages)
+
+    notes = sections[IFRS_NOTES]
+    assert (notes.start_page, notes.end_page) == (3, 6)
+    assert [p.page_number for p in notes.pages] == [3, 4, 6]
+    assert [p.page_number for p in sections[IFRS_BALANCE_SHEET].pages] == [2]
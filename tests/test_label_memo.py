@@ -0,0 +1,50 @@
+"""Tests for sec_parser.label_memo — persistent label normalization memo."""
+
+from __future__ import annotations
+
+import sec_parser.normalize as normalize
+from sec_parser.label_memo import LabelMemo
+from sec_parser.normalize import NormResult, load_taxonomy, normalize_table_rows
+
+
+def test_round_trip_per_taxonomy_version():
+    memo = LabelMemo("v1")
+    memo.put("  Lending- and deposit-related fees ", NormResult("Revenue", 0.9, "fuzzy"))
+    memo.put("Charter hire", NormResult(None, 0.4, "none"))
+    memo.flush()
+
+    reopened = LabelMemo("v1")
+    assert len(reopened) == 2
+    assert reopened.get("lending- and deposit-related fees") == NormResult("Revenue", 0.9, "fuzzy")
+    assert reopened.get("CHARTER HIRE") == NormResult(None, 0.4, "none")
+    assert LabelMemo("v2").get("charter hire") is None
+
+
+def test_unwritable_location_is_ignored(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    memo = LabelMemo("v1", path=blocker / "labels.sqlite3")
+    memo.put("Revenues, net", NormResult("Revenue", 0.9, "fuzzy"))
+    memo.flush()
+    assert memo.get("revenues, net") == NormResult("Revenue", 0.9, "fuzzy")
+
+
+def test_normalize_records_then_skips_matching(monkeypatch):
+    taxonomy = load_taxonomy()
+    rows = [["Net revenues", "100"], ["Revenues, net", "90"], ["Charter hire income", "5"]]
+    memo = LabelMemo("v1")
+    first = normalize_table_rows(rows, taxonomy, memo=memo)
+    memo.flush()
+    assert memo.get("net revenues") is None  # exact hits are not memoized
+    assert memo.get("revenues, net").method == "fuzzy"
+
+    match = normalize.match_line_item
+
+    def exact_only(label, taxonomy, alias_index=None):
+        result = match(label, taxonomy, alias_index=alias_index)
+        assert result.method == "exact", f"{label!r} was matched again"
+        return result
+
+    monkeypatch.setattr(normalize, "match_line_item", exact_only)
+    assert normalize_table_rows(rows, taxonomy, memo=LabelMemo("v1")) == first
+
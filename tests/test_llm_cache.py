@@ -0,0 +1,62 @@
+"""Tests for sec_parser.llm_cache — on-disk cache of Gemini responses."""
+
+from __future__ import annotations
+
+import os
+import time
+from types import SimpleNamespace
+
+import sec_parser.llm_cache as llm_cache
+from sec_parser.llm_cache import evict, load_response, response_key, store_response
+
+
+def test_key_covers_model_template_version_and_limit(monkeypatch):
+    key = response_key("gemini-2.5-flash", "prompt", 8192)
+    assert key == response_key("gemini-2.5-flash", "prompt", 8192)
+    assert key != response_key("gemini-2.5-pro", "prompt", 8192)
+    assert key != response_key("gemini-2.5-flash", "prompt ", 8192)
+    assert key != response_key("gemini-2.5-flash", "prompt", 4096)
+    monkeypatch.setattr(llm_cache, "PROMPT_VERSION", llm_cache.PROMPT_VERSION + 1)
+    assert key != response_key("gemini-2.5-flash", "prompt", 8192)
+
+
+def test_round_trip_skips_empty_responses():
+    store_response("a", "| Revenue | 100 |")
+    store_response("b", "")
+    store_response("c", None)
+    assert load_response("a") == "| Revenue | 100 |"
+    assert load_response("b") is None
+    assert load_response("c") is None
+
+
+def test_expired_entries_miss_and_are_evicted(monkeypatch):
+    store_response("old", "text")
+    monkeypatch.setenv("SEC_PARSER_LLM_CACHE_TTL_DAYS", "1")
+    later = time.time() + 2 * 86400
+    monkeypatch.setattr(llm_cache, "time", SimpleNamespace(time=lambda: later))
+    assert load_response("old") is None
+    assert evict() == 1
+
+    monkeypatch.setenv("SEC_PARSER_LLM_CACHE_TTL_DAYS", "0")  # never expire
+    store_response("kept", "text")
+    monkeypatch.setattr(llm_cache, "time", SimpleNamespace(time=lambda: later + 365 * 86400))
+    assert load_response("kept") == "text"
+
+
+def test_evicts_least_recently_used(cache_dir):
+    for key in ("a", "b", "c"):
+        store_response(key, "x" * 1000)
+    entries = cache_dir / "llm"
+    now = time.time()
+    for age, key in ((30, "a"), (20, "b"), (10, "c")):
+        os.utime(entries / f"{key}.json.z", (now - age, now - age))
+    assert load_response("a") == "x" * 1000  # touched: now most recent
+    budget = sum((entries / f"{key}.json.z").stat().st_size for key in ("a", "c"))
+    assert evict(max_bytes=budget) == 1
+    assert sorted(p.stem for p in entries.iterdir()) == ["a.json", "c.json"]
+
+
+def test_unreadable_entry_is_a_miss(cache_dir):
+    (cache_dir / "llm").mkdir(parents=True)
+    (cache_dir / "llm" / "bad.json.z").write_bytes(b"garbage")
+    assert load_response("bad") is None
@@ -1,14 +1,19 @@
 """Tests for sec_parser.normalize module."""
 
+import difflib
+import random
+
 import pytest
 
 from sec_parser.normalize import (
+    FuzzyMatcher,
     NormResult,
     load_taxonomy,
     _build_alias_index,
     match_line_item,
     normalize_table_rows,
     collect_unmapped,
+    llm_normalize_labels,
 )
 
 
@@ -82,6 +87,40 @@ def test_cash_flow_item(taxonomy):
     assert result.method == "exact"
 
 
+# --- FuzzyMatcher ---
+
+def _linear_best(label, alias_index):
+    best_score, best_canonical = 0.0, None
+    for alias, canonical in alias_index.items():
+        score = difflib.SequenceMatcher(None, label, alias).ratio()
+        if score > best_score:
+            best_score, best_canonical = score, canonical
+    return best_score, best_canonical
+
+
+def test_fuzzy_matcher_matches_linear_scan(taxonomy):
+    alias_index = _build_alias_index(taxonomy)
+    matcher = FuzzyMatcher(alias_index)
+    rng = random.Random(3)
+    aliases = list(alias_index)
+    labels = ["charter hire revenue", "gain on sale of vessel", "x", "zz"]
+    for _ in range(60):
+        chars = list(rng.choice(aliases))
+        for _ in range(rng.randint(1, 4)):
+            chars[rng.randrange(len(chars))] = rng.choice("aeiou xyz,")
+        labels.append("".join(chars))
+    for label in labels:
+        assert matcher.best(label) == _linear_best(label, alias_index), label
+
+
+def test_fuzzy_matcher_ties_go_to_first_alias():
+    alias_index = {"cost of sales": "A", "cost of sale": "B", "costs of sale": "C", "cost of sals": "D"}
+    matcher = FuzzyMatcher(alias_index)
+    for label in ["cost of salez", "cost f sale", "qqq"]:
+        assert matcher.best(label) == _linear_best(label, alias_index)
+    assert FuzzyMatcher({}).best("revenue") == (0.0, None)
+
+
 # --- normalize_table_rows ---
 
 def test_normalize_table_rows_adds_canonical(taxonomy):
@@ -126,3 +165,45 @@ def test_collect_unmapped(taxonomy):
     assert "Goodwill impairment charge adjustment" in unmapped
     assert "Some unknown item" in unmapped
     assert len(unmapped) == 2
+
+
+# --- llm_normalize_labels ---
+
+def test_llm_labels_deduplicated_and_batched(taxonomy, monkeypatch, tmp_path):
+    import sec_parser.normalize as normalize
+    from sec_parser.label_memo import LabelMemo
+
+    calls = []
+
+    def fake_batch(labels, taxonomy, verbose=False):
+        calls.append(list(labels))
+        answers = {
+            "Lending- and deposit-related fees": "Revenue", "Charter hire": "Not A Canonical", "Misc": "",
+        }
+        return {label: answers[label] for label in labels if label in answers}
+
+    monkeypatch.setattr(normalize, "llm_normalize_batch", fake_batch)
+    memo = LabelMemo("v1", path=tmp_path / "labels.sqlite3")
+    labels = ["Lending- and deposit-related fees", "LENDING- AND DEPOSIT-RELATED FEES ", "Charter hire", "Misc"]
+    resolved = llm_normalize_labels(labels, taxonomy, memo=memo, batch_size=2)
+
+    assert calls == [["Lending- and deposit-related fees", "Charter hire"], ["Misc"]]
+    assert resolved == {"lending- and deposit-related fees": "Revenue"}
+    assert memo.get("lending- and deposit-related fees") == NormResult("Revenue", 1.0, "llm")
+    assert memo.get("Misc") == NormResult(None, 0.0, "llm")
+
+    # UNMAPPED answers are remembered too; only the invalid answer is asked again
+    calls.clear()
+    assert llm_normalize_labels(labels, taxonomy, memo=memo) == resolved
+    assert calls == [["Charter hire"]]
+
+
+def test_llm_batch_reports_unmapped_answers(taxonomy, monkeypatch):
+    import sec_parser.gemini_client as gemini_client
+    from sec_parser.normalize import llm_normalize_batch
+
+    response = "- Charter hire -> Revenue\n- Misc -> UNMAPPED\n"
+    monkeypatch.setattr(gemini_client, "generate", lambda prompt: response)
+    assert llm_normalize_batch(["Charter hire", "Misc", "Other"], taxonomy) == {
+        "Charter hire": "Revenue", "Misc": "",
+    }
@@ -0,0 +1,56 @@
+"""Tests for sec_parser.note_store — per-company reuse of extracted notes."""
+
+from __future__ import annotations
+
+from sec_parser.note_store import NoteStore, note_fingerprint, note_number, renumber
+
+
+LEASES = (
+    "\nNote 6. Leases\nWe lease office space under operating leases.\n"
+    "Operating lease cost was $ 1,234 and ( 56 ) thousand.\n14\n\n"
+    "Table of Contents\nLeases expire through 2031."
+)
+
+
+def test_fingerprint_ignores_layout_and_note_number():
+    relaid = (
+        "\nNote 7.  Leases\nWe lease office space   under operating leases.\n"
+        "Operating lease cost was $1234 and (56) thousand.\n\n"
+        "Leases expire through 2031.\n22"
+    )
+    assert note_fingerprint(relaid) == note_fingerprint(LEASES)
+
+
+def test_fingerprint_keeps_amounts():
+    assert note_fingerprint(LEASES.replace("1,234", "1,243")) != note_fingerprint(LEASES)
+    assert note_fingerprint(LEASES.replace("2031", "2032")) != note_fingerprint(LEASES)
+
+
+def test_note_number_and_renumber():
+    assert note_number(LEASES) == "6"
+    assert note_number("Basis of presentation") is None
+    output = "## Note 6 — Leases\n\nSee Note 6 above."
+    assert renumber(output, "6", "7") == "## Note 7 — Leases\n\nSee Note 6 above."
+    assert renumber(output, "6", None) == output
+
+
+def test_round_trip_per_cik_and_version():
+    store = NoteStore("0000320193", "gemini-2.5-flash:1")
+    store.put(LEASES, "## Note 6 — Leases\n\n| Cost | 1,234 |")
+    store.flush()
+
+    renumbered = LEASES.replace("Note 6", "Note 7")
+    reopened = NoteStore("320193", "gemini-2.5-flash:1")
+    assert len(reopened) == 1
+    assert reopened.get(renumbered) == "## Note 7 — Leases\n\n| Cost | 1,234 |"
+    assert NoteStore("789019", "gemini-2.5-flash:1").get(LEASES) is None
+    assert NoteStore("320193", "gemini-2.5-pro:1").get(LEASES) is None
+
+
+def test_unwritable_location_is_ignored(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    store = NoteStore("320193", "v1", path=blocker / "notes.sqlite3")
+    store.put(LEASES, "## Note 6 — Leases")
+    store.flush()
+    assert store.get(LEASES) == "## Note 6 — Leases"
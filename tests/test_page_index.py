@@ -0,0 +1,57 @@
+"""Tests for sec_parser.page_index — shared per-document page facts."""
+
+from __future__ import annotations
+
+import random
+
+from sec_parser.detect import detect_10k_start_page, detect_report_type
+from sec_parser.ifrs_section_split import split_ifrs_sections
+from sec_parser.page_index import PageIndex
+from sec_parser.pdf_extract import PageData
+from sec_parser.section_split import split_sections
+
+
+def test_line_bounds_match_rfind_find():
+    rng = random.Random(3)
+    for _ in range(500):
+        text = "".join(rng.choice("ab \n") for _ in range(rng.randint(0, 40)))
+        page = PageData(1, text)
+        index = PageIndex()
+        start = rng.randint(0, len(text))
+        end = rng.randint(start, len(text))
+        line_start = text.rfind("\n", 0, start) + 1
+        line_end = text.find("\n", end)
+        expected = (line_start, len(text) if line_end == -1 else line_end)
+        assert index.line_bounds(page, start, end) == expected
+
+
+def test_flags_computed_once_and_released(monkeypatch):
+    import sec_parser.ifrs_section_split as ifrs
+
+    calls = []
+    monkeypatch.setattr(ifrs, "_is_divider_page", lambda p: calls.append(p.page_number) or True)
+    pages = [PageData(1, "x"), PageData(2, "y")]
+    index = PageIndex()
+    assert index.is_divider(pages[0]) and index.is_divider(pages[0])
+    assert calls == [1]
+    index.retain_from(2)
+    index.is_divider(pages[0])
+    assert calls == [1, 1]
+
+
+def test_shared_index_gives_same_results():
+    pages = [
+        PageData(1, "Annual review\nTABLE OF CONTENTS\nIntro ..... 3\nLetter ..... 4\nFinance ..... 9"),
+        PageData(2, "UNITED STATES SECURITIES AND EXCHANGE COMMISSION\nFORM 10-K\nAcme Corp"),
+        PageData(3, "Item 7. Management's Discussion and Analysis\nResults improved."),
+        PageData(4, "CONSOLIDATED BALANCE SHEETS\nTotal assets 1,000"),
+        PageData(5, "Notes to the Consolidated Financial Statements\nNote 1"),
+    ]
+    index = PageIndex()
+    assert detect_report_type(pages, index=index) == detect_report_type(pages)
+    assert detect_10k_start_page(pages, index) == detect_10k_start_page(pages) == 2
+    shared = split_sections(pages, index=index)
+    assert {k: (s.start_page, s.end_page, s.text) for k, s in shared.items()} == {
+        k: (s.start_page, s.end_page, s.text) for k, s in split_sections(pages).items()
+    }
+    assert split_ifrs_sections(pages, index).keys() == split_ifrs_sections(pages).keys()
@@ -0,0 +1,306 @@
+"""Tests for sec_parser.pdf_extract — page extraction modes."""
+
+from __future__ import annotations
+
+from sec_parser.pdf_extract import PageData, extract_pdf, load_tables
+from sec_parser.section_split import BALANCE_SHEET, COVER_PAGE, split_sections
+
+
+SAMPLE_PAGES = [
+    "UNITED STATES SECURITIES AND EXCHANGE COMMISSION\nFORM 10-Q\nAcme Corp",
+    "CONSOLIDATED BALANCE SHEETS\nTotal assets   1,000   900\nTotal liabilities   600   500",
+    "Item 4. Controls and Procedures\nManagement evaluated our disclosure controls.",
+]
+
+
+class TestPageDataLazyTables:
+    def test_loader_runs_once_on_first_access(self):
+        calls = []
+
+        def loader(page):
+            calls.append(page.page_number)
+            return [[["a", "b"]]]
+
+        page = PageData(page_number=3, text="x", table_loader=loader)
+        assert not page.tables_loaded
+        assert page.tables == [[["a", "b"]]]
+        assert page.tables == [[["a", "b"]]]
+        assert calls == [3]
+        assert page.tables_loaded
+
+    def test_default_is_empty_and_loaded(self):
+        page = PageData(page_number=1, text="x")
+        assert page.tables_loaded
+        assert page.tables == []
+
+    def test_split_sections_does_not_touch_tables(self):
+        def loader(page):
+            raise AssertionError(f"tables of page {page.page_number} were loaded")
+
+        pages = [
+            PageData(page_number=i + 1, text=text, table_loader=loader)
+            for i, text in enumerate(SAMPLE_PAGES)
+        ]
+        sections = split_sections(pages)
+        assert COVER_PAGE in sections and BALANCE_SHEET in sections
+        assert not any(p.tables_loaded for p in pages)
+
+
+class TestCompactRecords:
+    def test_slotted_records(self):
+        from sec_parser.ifrs_section_split import IFRSSectionData
+        from sec_parser.section_split import SectionData
+
+        for record in (PageData(1, "x"), SectionData("s", 1, 1), IFRSSectionData("s", 1, 1)):
+            assert not hasattr(record, "__dict__")
+
+    def test_cells_interned_and_sections_share_page_tables(self, make_text_pdf):
+        pages = extract_pdf(make_text_pdf([SAMPLE_PAGES[1], SAMPLE_PAGES[1]]))
+        first, second = pages[0].tables[0][0][0], pages[1].tables[0][0][0]
+        assert first == second and first is second
+        sections = split_sections(pages)
+        assert sections[BALANCE_SHEET].tables[0] is pages[0].tables[0]
+
+
+class TestLazyExtraction:
+    def test_lazy_matches_eager(self, make_text_pdf):
+        path = make_text_pdf(SAMPLE_PAGES)
+        eager = extract_pdf(path)
+        lazy = extract_pdf(path, lazy_tables=True)
+        assert not any(p.tables_loaded for p in lazy)
+        assert lazy == eager
+
+    def test_load_tables_only_requested_pages(self, make_text_pdf):
+        path = make_text_pdf(SAMPLE_PAGES)
+        eager = extract_pdf(path)
+        lazy = extract_pdf(path, lazy_tables=True)
+        sections = split_sections(lazy)
+        load_tables(sections[BALANCE_SHEET].pages)
+        assert [p.tables_loaded for p in lazy] == [False, True, False]
+        assert sections[BALANCE_SHEET].tables == eager[1].tables
+
+
+class TestParallelExtraction:
+    def test_shards_cover_every_page_in_order(self):
+        from sec_parser.pdf_extract import _page_shards
+
+        shards = _page_shards(103, 4)
+        assert shards[0][0] == 0 and shards[-1][1] == 103
+        assert all(a[1] == b[0] for a, b in zip(shards, shards[1:]))
+
+    def test_parallel_matches_serial(self, make_text_pdf, monkeypatch):
+        import sec_parser.pdf_extract as pdf_extract
+
+        path = make_text_pdf(SAMPLE_PAGES * 3)
+        serial = extract_pdf(path)
+        monkeypatch.setattr(pdf_extract, "PARALLEL_MIN_PAGES", 2)
+        parallel = extract_pdf(path, workers=2)
+        assert [p.page_number for p in parallel] == list(range(1, 10))
+        assert parallel == serial
+
+    def test_parallel_lazy_keeps_tables_deferred(self, make_text_pdf, monkeypatch):
+        import sec_parser.pdf_extract as pdf_extract
+
+        path = make_text_pdf(SAMPLE_PAGES * 2)
+        serial = extract_pdf(path)
+        monkeypatch.setattr(pdf_extract, "PARALLEL_MIN_PAGES", 2)
+        lazy = extract_pdf(path, lazy_tables=True, workers=2)
+        assert not any(p.tables_loaded for p in lazy)
+        load_tables(lazy)
+        assert lazy == serial
+
+
+def test_iter_pages_streams_same_pages(make_text_pdf):
+    from sec_parser.pdf_extract import iter_pages
+
+    path = make_text_pdf(SAMPLE_PAGES)
+    stream = iter_pages(path)
+    first = next(stream)
+    assert first.page_number == 1
+    assert [first, *stream] == extract_pdf(path)
+
+
+class TestBoundedMemory:
+    def test_releases_each_page_after_capture(self, make_text_pdf, monkeypatch):
+        import sec_parser.pdf_extract as pdf_extract
+
+        released = []
+        release = pdf_extract._release_page
+        monkeypatch.setattr(pdf_extract, "_release_page", lambda page: (released.append(page.page_number), release(page)))
+        pages = extract_pdf(make_text_pdf(SAMPLE_PAGES))
+        assert released == [1, 2, 3]
+        assert pages[1].tables  # captured before release
+
+    def test_rss_guard_names_page(self, make_text_pdf, monkeypatch):
+        import pytest
+
+        import sec_parser.pdf_extract as pdf_extract
+
+        monkeypatch.setattr(pdf_extract, "rss_mb", lambda: 4096.0)
+        with pytest.raises(RuntimeError, match=r"after page 1 of sample\.pdf"):
+            extract_pdf(make_text_pdf(SAMPLE_PAGES), max_rss_mb=1024)
+
+    def test_rss_guard_passes_under_limit(self, make_text_pdf):
+        path = make_text_pdf(SAMPLE_PAGES)
+        assert extract_pdf(path, max_rss_mb=1_000_000) == extract_pdf(path)
+
+
+class TestPreflightScanned:
+    def test_sample_is_spread_across_document(self):
+        from sec_parser.pdf_extract import _sample_indices
+
+        assert _sample_indices(5, 12) == [0, 1, 2, 3, 4]
+        sample = _sample_indices(300, 12)
+        assert len(sample) == 12
+        assert sample[0] == 0 and sample[-1] == 299
+
+    def test_rejects_image_only_pages(self, make_text_pdf):
+        import pytest
+
+        from sec_parser.pdf_extract import preflight_scanned
+
+        with pytest.raises(RuntimeError, match=r"12/12 pages have <50 chars"):
+            preflight_scanned(make_text_pdf([""] * 40))
+
+    def test_accepts_text_pages(self, make_text_pdf):
+        from sec_parser.pdf_extract import preflight_scanned
+
+        preflight_scanned(make_text_pdf(SAMPLE_PAGES * 10))
+
+    def test_agrees_with_detect_scanned(self, make_text_pdf):
+        import pytest
+
+        from sec_parser.pdf_extract import detect_scanned, extract_pdf, preflight_scanned
+
+        # Spaced-out glyphs: enough characters, too little text once stripped
+        for pages in (["a " * 30] * 12, ["word " * 12] * 12, ["x" * 49] * 12):
+            path = make_text_pdf(pages)
+            try:
+                detect_scanned(extract_pdf(path))
+            except RuntimeError:
+                with pytest.raises(RuntimeError):
+                    preflight_scanned(path)
+            else:
+                preflight_scanned(path)
+
+
+    def test_leaves_partly_sparse_sample_to_full_check(self, make_text_pdf):
+        import pytest
+
+        from sec_parser.pdf_extract import detect_scanned, extract_pdf, preflight_scanned
+
+        # 10 of 12 pages sparse: over the threshold, but not unambiguous
+        path = make_text_pdf([""] * 10 + SAMPLE_PAGES[:2])
+        preflight_scanned(path)
+        with pytest.raises(RuntimeError, match=r"10/12 pages"):
+            detect_scanned(extract_pdf(path))
+
+    def test_check_scanned_defaults_match_detect_scanned(self):
+        import pytest
+
+        from sec_parser.pdf_extract import check_scanned
+
+        check_scanned(8, 10)
+        with pytest.raises(RuntimeError, match=r"9/10 pages have <50 chars"):
+            check_scanned(9, 10)
+
+
+class TestDecorativePages:
+    def test_classification(self):
+        from sec_parser.pdf_extract import is_decorative_page
+
+        assert is_decorative_page(chars=120, graphics=800, text="Our fleet around the world")
+        assert not is_decorative_page(chars=120, graphics=800, text="Total assets by segment")
+        assert not is_decorative_page(chars=2000, graphics=800, text="Our fleet around the world")
+        assert not is_decorative_page(chars=10, graphics=50, text="Chart")
+
+    def test_skips_tables_on_chart_pages(self, make_text_pdf):
+        from sec_parser.pdf_extract import ExtractionStats
+
+        pages = ["Highlights of the year in pictures"] + SAMPLE_PAGES
+        path = make_text_pdf(pages, rects={0: 600, 2: 600})
+        stats = ExtractionStats()
+        extracted = extract_pdf(path, stats=stats)
+        assert stats.pages == 4
+        assert stats.decorative_skipped == 1  # the statement page keeps its tables
+        assert stats.table_pages == 3
+        assert extracted[0].tables == []
+        assert extracted[2].tables
+
+    def test_lazy_and_parallel_stats_match_serial(self, make_text_pdf, monkeypatch):
+        import sec_parser.pdf_extract as pdf_extract
+        from sec_parser.pdf_extract import ExtractionStats
+
+        path = make_text_pdf(["Highlights of the year in pictures"] * 3, rects={0: 600, 1: 600})
+        lazy_stats = ExtractionStats()
+        load_tables(extract_pdf(path, lazy_tables=True, stats=lazy_stats))
+        monkeypatch.setattr(pdf_extract, "PARALLEL_MIN_PAGES", 2)
+        parallel_stats = ExtractionStats()
+        extract_pdf(path, workers=2, stats=parallel_stats)
+        for stats in (lazy_stats, parallel_stats):
+            assert (stats.pages, stats.decorative_skipped, stats.table_pages) == (3, 2, 1)
+
+
+class TestCollapseEngine:
+    def test_matches_legacy_on_random_lines(self):
+        import random
+
+        from sec_parser.benchmark import legacy_try_collapse_line
+        from sec_parser.pdf_extract import _try_collapse_line
+
+        rng = random.Random(1234)
+        alphabet = "aabc $)(\n1,0"
+        for _ in range(5000):
+            factor = rng.choice((1, 1, 2, 3, 4, 7))
+            base = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+            line = "".join(ch * (factor if rng.random() < 0.8 else rng.randint(1, 5)) for ch in base)
+            assert _try_collapse_line(line) == legacy_try_collapse_line(line), repr(line)
+
+    def test_collapses_bold_overlay(self):
+        from sec_parser.pdf_extract import _collapse_repeated_chars, _try_collapse_line
+
+        assert _try_collapse_line("YYYeeeaaarrr") == "Year"
+        assert _try_collapse_line("TToottaall  aasssseettss") == "Total assets"
+        assert _collapse_repeated_chars("NNeett\n1,000") == "Net\n1,000"
+        assert _try_collapse_line("1,000,000") == "1,000,000"
+
+
+class TestDeinterleave:
+    def test_matches_legacy_on_random_cells(self):
+        import random
+
+        from sec_parser.benchmark import legacy_try_deinterleave
+        from sec_parser.pdf_extract import _FINANCIAL_TERMS, _try_deinterleave
+
+        rng = random.Random(99)
+        for _ in range(3000):
+            words = [rng.choice(_FINANCIAL_TERMS + ["foo", "q", "bar"]) for _ in range(rng.randint(1, 4))]
+            n = rng.choice((1, 2, 3))
+            if n == 1:
+                text = " ".join(words)
+            else:
+                streams = [" ".join(rng.sample(words, len(words))).title() for _ in range(n)]
+                width = max(len(s) for s in streams)
+                text = "".join("".join(s.ljust(width)[i] for s in streams) for i in range(width))
+            assert _try_deinterleave(text) == legacy_try_deinterleave(text), repr(text)
+
+    def test_matches_legacy_with_footnote_markers(self):
+        from sec_parser.benchmark import legacy_try_deinterleave
+        from sec_parser.pdf_extract import _try_deinterleave
+
+        for text in (
+            "TToottaall SShhaarreess¹",
+            "TToottaall SShhaarreess²³",
+            "CRoemtmaoinn eSdt oIcnkc⁽¹⁾",
+            "CRoemtmaoinn eSdt oIcnkc (1)",
+            "CRoemtmaoinn eSdt oIcnkc*",
+        ):
+            assert _try_deinterleave(text) == legacy_try_deinterleave(text), repr(text)
+        assert _try_deinterleave("TToottaall SShhaarreess¹") == "TToottaall SShhaarreess¹"
+
+    def test_rotated_header_split(self):
+        from sec_parser.pdf_extract import _try_deinterleave
+
+        assert _try_deinterleave("CRoemtmaoinn eSdt oIcnkc") == "Common Stock / Retained Inc"
+        assert _try_deinterleave("Total assets and liabilities") == "Total assets and liabilities"
+        assert _try_deinterleave("Xyzzy plugh qwerty") == "Xyzzy plugh qwerty"
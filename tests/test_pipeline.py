@@ -0,0 +1,296 @@
+"""Tests for sec_parser.pipeline — document scanning during extraction."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from sec_parser.detect import detect_10k_start_page, detect_report_type
+from sec_parser.pdf_extract import extract_pdf
+from sec_parser.pipeline import (
+    ProcessingResult,
+    _scan_document,
+    process_pdf,
+    resolve_unmapped_labels,
+)
+from sec_parser.section_split import _find_section_starts
+
+COVER = (
+    "UNITED STATES SECURITIES AND EXCHANGE COMMISSION\nFORM 10-K\n"
+    "Acme Corp\n(Exact name of registrant as specified in its charter)"
+)
+
+COMBINED_PAGES = (
+    ["Dear Fellow Shareholders, our year in review and highlights."] * 3
+    + ["CONSOLIDATED BALANCE SHEETS\nHighlights of our strong capital position this year."]
+    + ["Letter from the chairman continues with more annual report commentary."] * 8
+    + [
+        COVER,
+        "Item 1A. Risk Factors\nOur business is subject to many risks and uncertainties.",
+        "CONSOLIDATED BALANCE SHEETS\nTotal assets   1,000   900\nTotal liabilities   600   500",
+        "NOTES TO CONSOLIDATED FINANCIAL STATEMENTS\nNote 1. Basis of presentation and more.",
+    ]
+)
+
+
+def test_scan_releases_pre_10k_pages(make_text_pdf):
+    path = make_text_pdf(COMBINED_PAGES)
+    full = extract_pdf(path)
+    tenk_start = detect_10k_start_page(full)
+    assert tenk_start == 13
+
+    doc = _scan_document(path, False, lazy_tables=True, page_workers=1, use_extract_cache=False)
+    assert doc.page_count == len(full)
+    assert doc.report_type == detect_report_type(full)
+    assert doc.tenk_start == tenk_start
+    assert [p.page_number for p in doc.pages] == list(range(13, 17))
+    assert doc.pre_10k_text.startswith("Dear Fellow Shareholders")
+    trimmed = [p for p in full if p.page_number >= tenk_start]
+    assert doc.section_starts == _find_section_starts(trimmed)
+
+
+def test_scan_single_filing_matches_batch_detection(make_text_pdf):
+    path = make_text_pdf(COMBINED_PAGES[12:])
+    full = extract_pdf(path)
+    doc = _scan_document(path, False, lazy_tables=False, page_workers=1, use_extract_cache=False)
+    assert doc.tenk_start == 1
+    assert doc.pages == full
+    assert doc.section_starts == _find_section_starts(full)
+
+
+def test_scan_rejects_scanned_pdf_before_extraction(make_text_pdf, monkeypatch):
+    import sec_parser.pdf_extract as pdf_extract
+
+    path = make_text_pdf([""] * 30)
+    extract_page_text = pdf_extract._extract_page_text
+    extracted = []
+
+    def tracking(page):
+        extracted.append(page)
+        return extract_page_text(page)
+
+    monkeypatch.setattr(pdf_extract, "_extract_page_text", tracking)
+    with pytest.raises(RuntimeError, match="OCR support is not implemented yet"):
+        _scan_document(path, False, lazy_tables=False, page_workers=1, use_extract_cache=False)
+    # Only the preflight sample is read; full extraction never starts
+    assert len(extracted) == 12
+
+
+def test_eager_scan_skips_tables_before_10k_start(make_text_pdf, monkeypatch):
+    import sec_parser.pdf_extract as pdf_extract
+
+    path = make_text_pdf(COMBINED_PAGES)
+    full = extract_pdf(path)
+    table_pages = []
+    extract_tables = pdf_extract._extract_page_tables
+
+    def spy(page, text, stats=None):
+        table_pages.append(page.page_number)
+        return extract_tables(page, text, stats)
+
+    monkeypatch.setattr(pdf_extract, "_extract_page_tables", spy)
+    doc = _scan_document(path, False, lazy_tables=False, page_workers=1, use_extract_cache=False)
+    assert doc.tenk_start == 13
+    assert sorted(table_pages) == list(range(13, 17))
+    assert all(p.tables_loaded for p in doc.pages)
+    assert doc.pages == full[12:]
+
+
+def test_scan_hashes_pdf_once_per_cache_run(make_text_pdf, monkeypatch):
+    import sec_parser.extract_cache as extract_cache
+
+    path = make_text_pdf(COMBINED_PAGES[12:])
+    file_sha256 = extract_cache.file_sha256
+    hashed = []
+
+    def tracking(p):
+        hashed.append(p)
+        return file_sha256(p)
+
+    monkeypatch.setattr(extract_cache, "file_sha256", tracking)
+    fresh = _scan_document(path, False, lazy_tables=False, page_workers=1, use_extract_cache=True)
+    assert len(hashed) == 1
+    cached = _scan_document(path, False, lazy_tables=False, page_workers=1, use_extract_cache=True)
+    assert len(hashed) == 2
+    assert cached.pages == fresh.pages
+
+
+def test_resolve_unmapped_labels_across_filings(tmp_path, monkeypatch):
+    import sec_parser.normalize as normalize
+
+    calls = []
+
+    def fake_batch(labels, taxonomy, verbose=False):
+        calls.append(list(labels))
+        return {"Charter hire income": "Revenue"}
+
+    monkeypatch.setattr(normalize, "llm_normalize_batch", fake_batch)
+    table = (
+        "| | Canonical | 2024 |\n| :--- | :--- | ---: |\n"
+        "| Charter hire income |  | 100 |\n| Vessel costs |  | 40 |\n"
+    )
+    results = []
+    for name in ("a", "b"):
+        path = tmp_path / f"{name}.md"
+        path.write_text(table + "\n| Charter hire income |  | note |\n", encoding="utf-8")
+        results.append(ProcessingResult(path, unmapped=["Charter hire income", "Vessel costs"]))
+
+    assert resolve_unmapped_labels(results) == 1
+    assert calls == [["Charter hire income", "Vessel costs"]]
+    for result in results:
+        assert result.mappings == {"Charter hire income": "Revenue"}
+        assert result.unmapped == ["Vessel costs"]
+        lines = result.output_path.read_text(encoding="utf-8").splitlines()
+        assert lines[2] == "| Charter hire income | Revenue | 100 |"
+        assert lines[3] == "| Vessel costs |  | 40 |"
+        # Tables without a Canonical column are left alone
+        assert lines[-1] == "| Charter hire income |  | note |"
+
+
+def test_resolved_multiline_labels_filled_in_output(tmp_path, monkeypatch):
+    import sec_parser.normalize as normalize
+
+    monkeypatch.setattr(
+        normalize, "llm_normalize_batch",
+        lambda labels, taxonomy, verbose=False: {label: "Revenue" for label in labels},
+    )
+    path = tmp_path / "a.md"
+    # Rendering collapses the raw label's newline and double space
+    path.write_text(
+        "| | Canonical | 2024 |\n| :--- | :--- | ---: |\n| Charter hire income |  | 100 |\n",
+        encoding="utf-8",
+    )
+    result = ProcessingResult(path, unmapped=["Charter  hire\nincome"])
+    assert resolve_unmapped_labels([result]) == 1
+    assert result.output_path.read_text(encoding="utf-8").splitlines()[2] == (
+        "| Charter hire income | Revenue | 100 |"
+    )
+
+
+def _notes_pdf(make_text_pdf):
+    return make_text_pdf(COMBINED_PAGES[12:])
+
+
+def _process(path, tmp_path):
+    return process_pdf(
+        path, tmp_path / "out", use_xbrl=False, use_extract_cache=False, use_label_memo=False,
+    )
+
+
+def test_rendered_sections_release_their_pages(make_text_pdf, tmp_path, monkeypatch):
+    import sec_parser.pipeline as pipeline
+
+    split_sections = pipeline.split_sections
+    scan_document = pipeline._scan_document
+    captured = {}
+
+    def tracking_scan(*args, **kwargs):
+        captured["doc"] = scan_document(*args, **kwargs)
+        return captured["doc"]
+
+    def tracking_split(*args, **kwargs):
+        captured["sections"] = split_sections(*args, **kwargs)
+        return captured["sections"]
+
+    monkeypatch.setattr(pipeline, "_scan_document", tracking_scan)
+    monkeypatch.setattr(pipeline, "split_sections", tracking_split)
+    monkeypatch.setattr(pipeline, "extract_notes", lambda text, verbose=False, cik=None: "NOTES")
+    result = _process(_notes_pdf(make_text_pdf), tmp_path)
+    assert "Risk Factors" in result.output_path.read_text(encoding="utf-8")
+    assert captured["doc"].pages == []
+    assert captured["sections"] == {}
+
+
+def test_notes_extracted_alongside_programmatic_stages(make_text_pdf, tmp_path, monkeypatch):
+    import sec_parser.pipeline as pipeline
+
+    prose_started = threading.Event()
+    clean_prose = pipeline.clean_prose
+
+    def tracking_clean_prose(*args, **kwargs):
+        prose_started.set()
+        return clean_prose(*args, **kwargs)
+
+    def fake_notes(text, verbose=False, cik=None):
+        # Only returns if the prose stage runs while Notes are in flight
+        assert prose_started.wait(5)
+        return "LLM-EXTRACTED NOTES"
+
+    monkeypatch.setattr(pipeline, "clean_prose", tracking_clean_prose)
+    monkeypatch.setattr(pipeline, "extract_notes", fake_notes)
+    result = _process(_notes_pdf(make_text_pdf), tmp_path)
+    assert "LLM-EXTRACTED NOTES" in result.output_path.read_text(encoding="utf-8")
+
+
+def test_notes_timeout_falls_back_to_programmatic(make_text_pdf, tmp_path, monkeypatch):
+    import sec_parser.pipeline as pipeline
+
+    release = threading.Event()
+
+    def stalled_notes(text, verbose=False, cik=None):
+        release.wait(5)
+        return "LLM-EXTRACTED NOTES"
+
+    monkeypatch.setattr(pipeline, "extract_notes", stalled_notes)
+    monkeypatch.setenv("SEC_PARSER_NOTES_TIMEOUT", "0.2")
+    try:
+        start = time.monotonic()
+        result = _process(_notes_pdf(make_text_pdf), tmp_path)
+        assert time.monotonic() - start < 4
+    finally:
+        release.set()
+    content = result.output_path.read_text(encoding="utf-8")
+    assert "LLM-EXTRACTED NOTES" not in content
+    assert "Basis of presentation" in content
+
+
+def test_timed_out_notes_job_does_not_block_exit():
+    script = (
+        "import os, threading\n"
+        "import sec_parser.pipeline as pipeline\n"
+        "os.environ['SEC_PARSER_NOTES_TIMEOUT'] = '0.2'\n"
+        "pipeline.extract_notes = lambda text, verbose=False, cik=None: threading.Event().wait()\n"
+        "print(pipeline._NotesJob('text', lambda: 'fallback', False).result())\n"
+    )
+    # The stalled job never finishes; the interpreter must exit regardless
+    done = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, timeout=30,
+        cwd=Path(__file__).resolve().parents[1],
+    )
+    assert done.stdout.strip() == "fallback", done.stderr
+
+
+def test_notes_fallback_never_loads_lazy_tables(make_text_pdf, tmp_path, monkeypatch):
+    import sec_parser.pipeline as pipeline
+    from sec_parser.pdf_extract import _TableLoader
+
+    loaded: list[int] = []
+    load_many = _TableLoader.load_many
+
+    def tracking_call(self, page):
+        loaded.append(page.page_number)
+        return []
+
+    def tracking_load_many(self, pages):
+        loaded.extend(p.page_number for p in pages)
+        load_many(self, pages)
+
+    def failing_notes(text, verbose=False, cik=None):
+        raise RuntimeError("no API key")
+
+    monkeypatch.setattr(_TableLoader, "__call__", tracking_call)
+    monkeypatch.setattr(_TableLoader, "load_many", tracking_load_many)
+    monkeypatch.setattr(pipeline, "extract_notes", failing_notes)
+    result = process_pdf(
+        _notes_pdf(make_text_pdf), tmp_path / "out", use_xbrl=False, lazy_tables=True,
+        use_extract_cache=False, use_label_memo=False,
+    )
+    assert "Basis of presentation" in result.output_path.read_text(encoding="utf-8")
+    # Page 4 holds the Notes; only the balance sheet page renders tables
+    assert 4 not in loaded
+    assert 3 in loaded
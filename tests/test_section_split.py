@@ -0,0 +1,60 @@
+"""Tests for sec_parser.section_split — section-start scanning."""
+
+from __future__ import annotations
+
+import random
+
+from sec_parser.section_split import SECTION_PATTERNS, _find_section_starts, _section_matches
+
+FRAGMENTS = [
+    "CONSOLIDATED STATEMENTS OF OPERATIONS", "Condensed Consolidated Balance Sheets",
+    "consolidated statements of comprehensive income (loss)", "CONSOLIDATED STATEMENTS OF CASH FLOWS",
+    "Consolidated Statements of Stockholders’ Equity", "CONDENSED  CONSOLIDATED",
+    "Notes to the Condensed Consolidated Financial Statements", "Item 7. Management's Discussion and Analysis",
+    "Item 2.MANAGEMENT’S DISCUSSION AND ANALYSIS", "Quantitative and Qualitative Disclosures About Market Risk",
+    "Item 4. Controls and Procedures", "ITEM 3. LEGAL PROCEEDINGS", "Item 1A. Risk Factors",
+    "Item 15. Exhibits", "\nSIGNATURES\n", "\nSignature \n", "items", "notes", "management",
+    "the", " ", "\n", "12", "Conſolidated", "İtem 1A. Risk Factors",
+]
+
+
+def test_section_matches_equal_per_pattern_finditer():
+    rng = random.Random(5)
+    for _ in range(2000):
+        text = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 12)))
+        expected = {
+            key: [m.span() for m in pat.finditer(text)] for key, pat in SECTION_PATTERNS
+        }
+        found = _section_matches(text)
+        got = {key: [m.span() for m in found.get(key, [])] for key, _ in SECTION_PATTERNS}
+        assert got == expected, repr(text)
+
+
+def test_find_section_starts_matches_legacy_scan():
+    from sec_parser.benchmark import legacy_find_section_starts, synthetic_filing
+
+    pages = synthetic_filing(120)
+    starts = _find_section_starts(pages)
+    assert len(starts) == len(SECTION_PATTERNS)
+    assert starts == legacy_find_section_starts(pages)
+
+
+def test_sections_join_spans_on_first_read():
+    from sec_parser.pdf_extract import PageData
+    from sec_parser.section_split import BALANCE_SHEET, CASH_FLOW, split_sections
+
+    pages = [
+        PageData(1, "Acme Corp annual report"),
+        PageData(2, "CONSOLIDATED BALANCE SHEETS\nTotal assets 1,000\nCONSOLIDATED STATEMENTS OF CASH FLOWS\nNet cash 5"),
+        PageData(3, "Operating activities 7"),
+    ]
+    sections = split_sections(pages)
+    balance, cash = sections[BALANCE_SHEET], sections[CASH_FLOW]
+    assert balance._text is None and balance.spans == [(0, 47)]
+    assert balance.text == "CONSOLIDATED BALANCE SHEETS\nTotal assets 1,000\n"
+    assert cash.text == "CONSOLIDATED STATEMENTS OF CASH FLOWS\nNet cash 5\n\nOperating activities 7"
+    # Joined once, then reused
+    assert balance._text is not None and balance.text is balance.text
+
+    cash.text = "replaced"
+    assert cash.text == "replaced" and cash.spans is None
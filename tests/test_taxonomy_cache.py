@@ -0,0 +1,130 @@
+"""Tests for sec_parser.taxonomy_cache — compiled taxonomy shared per process."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+import sec_parser.taxonomy_cache as taxonomy_cache
+from sec_parser.normalize import _build_alias_index, load_taxonomy, normalize_table_rows
+from sec_parser.taxonomy_cache import (
+    TAXONOMY_PATH,
+    XBRL_MAP_PATH,
+    alias_index_for,
+    artifact_path,
+    compiled_taxonomy,
+    fuzzy_matcher_for,
+)
+
+
+@pytest.fixture
+def sources(tmp_path):
+    tax = tmp_path / "taxonomy.yaml"
+    tax.write_text(TAXONOMY_PATH.read_text())
+    xbrl = tmp_path / "xbrl_taxonomy_map.yaml"
+    xbrl.write_text(XBRL_MAP_PATH.read_text(encoding="utf-8"), encoding="utf-8")
+    return tax, xbrl
+
+
+@pytest.fixture(autouse=True)
+def fresh_process(monkeypatch):
+    monkeypatch.setattr(taxonomy_cache, "_compiled", {})
+    monkeypatch.setattr(taxonomy_cache, "_matchers", {})
+
+
+def test_compiled_once_and_shared(sources):
+    tax, xbrl = sources
+    first = compiled_taxonomy(tax, xbrl)
+    assert compiled_taxonomy(tax, xbrl) is first
+    assert first.alias_index == _build_alias_index(first.taxonomy)
+    assert "Revenue" in first.canonical_names
+    assert first.xbrl_map["income_statement"]
+
+
+def test_source_change_invalidates(sources):
+    tax, xbrl = sources
+    first = compiled_taxonomy(tax, xbrl)
+    tax.write_text(tax.read_text().replace("Net sales", "Net product sales"))
+    os.utime(tax, ns=(0, 0))
+    second = compiled_taxonomy(tax, xbrl)
+    assert second is not first
+    assert "net product sales" in second.alias_index
+    assert "net sales" not in second.alias_index
+
+
+def test_artifact_reused_by_new_process(sources, monkeypatch):
+    tax, xbrl = sources
+    first = compiled_taxonomy(tax, xbrl)
+    assert artifact_path(first.source_hash).exists()
+
+    monkeypatch.setattr(taxonomy_cache, "_compiled", {})
+    monkeypatch.setattr(taxonomy_cache, "_matchers", {})
+    monkeypatch.setattr(taxonomy_cache, "_compile", lambda *a: pytest.fail("YAML was reparsed"))
+    reloaded = compiled_taxonomy(tax, xbrl)
+    assert reloaded.source_hash == first.source_hash
+    assert reloaded.alias_index == first.alias_index
+    assert reloaded.matcher.best("net revenue") == first.matcher.best("net revenue")
+
+
+def test_stale_or_corrupt_artifact_ignored(sources):
+    tax, xbrl = sources
+    artifact = artifact_path(taxonomy_cache._source_hash((tax, xbrl)))
+    artifact.parent.mkdir(parents=True)
+    artifact.write_bytes(b"not a pickle")
+    compiled = compiled_taxonomy(tax, xbrl)
+    assert compiled.taxonomy["income_statement"]["revenue"]["canonical"] == "Revenue"
+
+
+def test_artifact_header_checked_before_unpickling(sources, monkeypatch):
+    tax, xbrl = sources
+    first = compiled_taxonomy(tax, xbrl)
+    artifact = artifact_path(first.source_hash)
+    header, payload = artifact.read_bytes().split(b"\n", 1)
+    monkeypatch.setattr(taxonomy_cache, "_compiled", {})
+    monkeypatch.setattr(taxonomy_cache, "_matchers", {})
+    monkeypatch.setattr(
+        taxonomy_cache.pickle, "loads", lambda data: pytest.fail("unverified artifact unpickled"),
+    )
+    # Tampered payload, and an artifact copied from other sources
+    artifact.write_bytes(header + b"\n" + payload + b".")
+    assert compiled_taxonomy(tax, xbrl).alias_index == first.alias_index
+    monkeypatch.setattr(taxonomy_cache, "_compiled", {})
+    monkeypatch.setattr(taxonomy_cache, "_matchers", {})
+    artifact.write_bytes(header.replace(first.source_hash.encode(), b"0" * 64) + b"\n" + payload)
+    assert compiled_taxonomy(tax, xbrl).alias_index == first.alias_index
+
+
+def test_artifact_kept_in_cache_dir(sources, cache_dir):
+    tax, xbrl = sources
+    compiled = compiled_taxonomy(tax, xbrl)
+    assert artifact_path(compiled.source_hash).parent == cache_dir / "taxonomy"
+    assert sorted(p.name for p in tax.parent.iterdir()) == sorted([tax.name, xbrl.name, "cache"])
+
+
+def test_unwritable_artifact_location(sources, monkeypatch):
+    tax, xbrl = sources
+
+    def fail(*args, **kwargs):
+        raise PermissionError("read-only install")
+
+    monkeypatch.setattr(taxonomy_cache.os, "replace", fail)
+    compiled = compiled_taxonomy(tax, xbrl)
+    assert compiled.alias_index
+    assert not artifact_path(compiled.source_hash).exists()
+
+
+def test_normalize_reuses_compiled_alias_index(monkeypatch):
+    taxonomy = load_taxonomy()
+    assert alias_index_for(taxonomy) is compiled_taxonomy().alias_index
+    monkeypatch.setattr(taxonomy_cache, "_build_alias_index", lambda t: pytest.fail("index rebuilt"))
+    rows = normalize_table_rows([["Net revenues", "100"]], taxonomy)
+    assert rows[0][1] == "Revenue"
+
+
+def test_matcher_built_once_per_custom_index(monkeypatch):
+    index = {"net revenues": "Revenue", "revenue": "Revenue"}
+    matcher = fuzzy_matcher_for(index)
+    monkeypatch.setattr(taxonomy_cache, "FuzzyMatcher", lambda i: pytest.fail("matcher rebuilt"))
+    assert fuzzy_matcher_for(index) is matcher
+    assert normalize_table_rows([["Net revenue", "1"]], {}, alias_index=index)[0][1] == "Revenue"
@@ -0,0 +1,46 @@
+"""Tests for sec_parser.token_budget — token estimates and per-model chunk budgets."""
+
+from __future__ import annotations
+
+from sec_parser.token_budget import (
+    DEFAULT_LIMITS,
+    MIN_CHUNK_TOKENS,
+    chunk_budget,
+    estimate_tokens,
+    fit_output_ratio,
+    model_limits,
+)
+
+
+def test_estimate_counts_digits_and_symbols_individually():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("Revenue") == 1
+    assert estimate_tokens("Depreciation") == 2
+    assert estimate_tokens("1,234") == 5
+    assert estimate_tokens("Total   (12)\n") == 7
+
+
+def test_figures_estimate_denser_than_prose():
+    prose = "The Company recognizes revenue when control of the goods transfers. " * 20
+    table = "| Revenue | 1,234,567 | 1,098,765 |\n" * 40
+    assert estimate_tokens(table) / len(table) > 2 * estimate_tokens(prose) / len(prose)
+
+
+def test_model_limits_by_longest_prefix():
+    assert model_limits("gemini-2.5-flash-lite-preview").output_tokens == 65_536
+    assert model_limits("gemini-2.0-flash-001").output_tokens == 8_192
+    assert model_limits("some-other-model") == DEFAULT_LIMITS
+
+
+def test_budget_fits_expected_output():
+    assert chunk_budget("gemini-2.5-flash", "prose", 16000) < chunk_budget("gemini-2.5-flash", "notes", 65536)
+    assert chunk_budget("gemini-2.5-flash", "notes", 100) == MIN_CHUNK_TOKENS
+    # The input limit caps the budget once the template is counted
+    assert chunk_budget("some-other-model", "notes", 10**9, overhead=72) == DEFAULT_LIMITS.input_tokens - 72
+
+
+def test_fit_output_ratio_takes_quantile():
+    samples = [(1000, n) for n in range(100, 1100, 100)]  # ratios 0.1 .. 1.0
+    assert fit_output_ratio(samples) == 0.9
+    assert fit_output_ratio(samples, quantile=0.5) == 0.5
+    assert fit_output_ratio([(0, 10)]) is None